@@ -1,5 +1,6 @@
 import cv2
 from picamera2 import Picamera2
+from cam_capture import CaptureRing, picamera2_source
 dispW=1280
 dispH=720
 picam2 = Picamera2()
@@ -8,9 +9,17 @@ picam2.preview_configuration.main.format='XRGB8888'
 picam2.preview_configuration.align()
 picam2.configure("preview")
 picam2.start()
-while True:
-    im=picam2.capture_array()
+# capture runs on its own thread; the window shows the newest frame
+ring = CaptureRing(picamera2_source(picam2))
+display = ring.reader("display")
+ring.start()
+for im in display:
     cv2.imshow('Camera', im)
     if cv2.waitKey(1) == ord('q'):
         break
+ring.stop()
+print(ring.summary())
 cv2.destroyAllWindows()
+# the reader loop also ends when the capture thread fails
+if ring.error is not None:
+    raise ring.error
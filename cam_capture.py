@@ -0,0 +1,244 @@
+# cam_capture.py
+"""
+Threaded capture for the Picamera2 preview loops.
+
+A producer thread captures into a fixed ring of preallocated frames, so a
+slow consumer (cv2.imshow/waitKey, a recorder, analytics) never throttles
+the camera. Each consumer has a reader that hands out the newest frame it
+hasn't seen and counts the frames it missed; the slot a reader holds is
+not overwritten until it moves on.
+
+    ring = CaptureRing(picamera2_source(picam2))
+    display = ring.reader("display")
+    ring.start()
+    for im in display:                # newest frame, held until the next one
+        cv2.imshow("Camera", im)
+        if cv2.waitKey(1) == ord("q"):
+            break
+    ring.stop()
+    print(display.frames, "shown,", display.dropped, "dropped")
+
+With slots >= readers + 2 the producer never waits for a reader.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+try:
+    from picamera2 import MappedArray
+except Exception:
+    MappedArray = None
+
+
+def picamera2_source(picam2, stream="main"):
+    """capture(out) for a started Picamera2: copies the next frame into out without allocating."""
+    def capture(out):
+        request = picam2.capture_request()
+        try:
+            with MappedArray(request, stream) as m:
+                np.copyto(out, m.array)
+        finally:
+            request.release()
+
+    def first():
+        return picam2.capture_array(stream)
+
+    capture.first = first
+    return capture
+
+
+def synthetic_source(shape=(180, 320, 3), fps=60):
+    """capture(out) that paces itself to fps and writes a frame counter, for testing without a camera."""
+    state = {"n": 0, "next": time.monotonic()}
+
+    def capture(out):
+        state["next"] += 1 / fps
+        delay = state["next"] - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        state["n"] += 1
+        out.fill(state["n"] & 0xff)
+
+    def first():
+        return np.zeros(shape, np.uint8)
+
+    capture.first = first
+    return capture
+
+
+class Reader:
+    """One consumer of a CaptureRing."""
+
+    def __init__(self, ring, name):
+        self.ring = ring
+        self.name = name
+        self.seq = 0            # sequence number of the held frame (0: none yet)
+        self.timestamp = None   # time.monotonic() when it was captured
+        self.frames = 0
+        self.dropped = 0
+        self._slot = None
+
+    def get(self, timeout=None):
+        """
+        Release the held frame and hold the newest one not seen yet, waiting
+        for it if needed; returns the array, or None on timeout or stop().
+        """
+        ring = self.ring
+        with ring._cond:
+            self._release()
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while ring._seq <= self.seq:
+                if not ring._running:
+                    return None
+                left = None if deadline is None else deadline - time.monotonic()
+                if left is not None and left <= 0:
+                    return None
+                ring._cond.wait(left)
+            slot = ring._newest
+            ring._holders[slot] += 1
+            self._slot = slot
+            if self.seq:
+                self.dropped += ring._seq - self.seq - 1
+            self.seq = ring._seq
+            self.timestamp = ring._stamps[slot]
+            self.frames += 1
+            return ring.frames[slot]
+
+    def release(self):
+        """Let the producer reuse the held frame."""
+        with self.ring._cond:
+            self._release()
+
+    def _release(self):
+        if self._slot is not None:
+            self.ring._holders[self._slot] -= 1
+            self._slot = None
+            self.ring._cond.notify_all()
+
+    def __iter__(self):
+        while True:
+            frame = self.get()
+            if frame is None:
+                return
+            yield frame
+
+
+class CaptureRing:
+    """Producer thread writing into a ring of preallocated frames."""
+
+    def __init__(self, capture, slots=4):
+        """
+        capture: callable filling a frame array in place (picamera2_source());
+        its .first() gives a frame to take the shape and dtype from
+        slots: ring size
+        """
+        self.capture = capture
+        sample = capture.first()
+        self.frames = [np.empty_like(sample) for _ in range(slots)]
+        self._holders = [0] * slots
+        self._stamps = [None] * slots
+        self._cond = threading.Condition()
+        self._seq = 0           # frames captured
+        self._newest = None
+        self._next = 0
+        self._running = False
+        self._thread = None
+        self.error = None
+        self.readers = []
+        self.started = None
+
+    def reader(self, name):
+        """A new consumer; it sees frames captured after its first get()."""
+        reader = Reader(self, name)
+        self.readers.append(reader)
+        return reader
+
+    def start(self):
+        self._running = True
+        self.started = time.monotonic()
+        self._thread = threading.Thread(target=self._produce, name="capture", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def captured(self):
+        return self._seq
+
+    def fps(self):
+        """Average capture rate since start()."""
+        if not self.started or not self._seq:
+            return 0.0
+        return self._seq / (time.monotonic() - self.started)
+
+    def _free_slot(self):
+        # the next slot that is neither the newest frame nor held by a reader
+        n = len(self.frames)
+        for k in range(n):
+            slot = (self._next + k) % n
+            if slot != self._newest and not self._holders[slot]:
+                self._next = (slot + 1) % n
+                return slot
+        return None
+
+    def _produce(self):
+        try:
+            while True:
+                with self._cond:
+                    slot = self._free_slot()
+                    while slot is None and self._running:
+                        # more readers than slots allow: wait for a release
+                        self._cond.wait()
+                        slot = self._free_slot()
+                    if not self._running:
+                        return
+                self.capture(self.frames[slot])
+                with self._cond:
+                    self._stamps[slot] = time.monotonic()
+                    self._newest = slot
+                    self._seq += 1
+                    self._cond.notify_all()
+        except Exception as e:
+            self.error = e
+            with self._cond:
+                self._running = False
+                self._cond.notify_all()
+
+    def summary(self):
+        parts = ["captured %d (%.1f fps average)" % (self._seq, self.fps())]
+        for reader in self.readers:
+            parts.append("%s: %d frames, %d dropped" % (reader.name, reader.frames, reader.dropped))
+        return ", ".join(parts)
+
+
+# ---------------------------
+# Example usage (main)
+# ---------------------------
+if __name__ == "__main__":
+    # a 60 fps stand-in camera, a display that keeps up and analytics that don't
+    ring = CaptureRing(synthetic_source(fps=60))
+    display = ring.reader("display")
+    analytics = ring.reader("analytics")
+
+    def consume(reader, seconds_per_frame):
+        for frame in reader:
+            time.sleep(seconds_per_frame)
+
+    threads = [threading.Thread(target=consume, args=(display, 0.005)),
+               threading.Thread(target=consume, args=(analytics, 0.05))]
+    ring.start()
+    for t in threads:
+        t.start()
+    time.sleep(3)
+    ring.stop()
+    for t in threads:
+        t.join()
+    print(ring.summary())
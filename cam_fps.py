@@ -1,5 +1,6 @@
 import cv2
 from picamera2 import Picamera2
+from cam_capture import CaptureRing, picamera2_source
 import time
 picam2 = Picamera2()
 picam2.preview_configuration.main.size = (320,180)
@@ -8,15 +9,31 @@ picam2.preview_configuration.controls.FrameRate = 60
 picam2.preview_configuration.align()
 picam2.configure("preview")
 picam2.start()
+# capture runs on its own thread, so its fps no longer includes GUI time
+ring = CaptureRing(picamera2_source(picam2))
+display = ring.reader("display")
+ring.start()
 
-while True:
-    tstart = time.time()
-    im = picam2.capture_array()
+tstart = time.time()
+shown = 0
+captured = ring.captured
+for im in display:
     cv2.imshow("Camera", im)
     if cv2.waitKey(1) == ord('q'):
         break
+    shown += 1
     tend = time.time()
-    looptime = tend-tstart
-    fps=1/looptime
-    print(fps)
-cv2.destroyAllWindows()
\ No newline at end of file
+    if tend - tstart >= 1:
+        # rates over the last second, not since the start
+        count = ring.captured
+        print("capture %.1f fps, display %.1f fps, %d dropped by display" % (
+            (count - captured) / (tend - tstart), shown / (tend - tstart), display.dropped))
+        tstart = tend
+        shown = 0
+        captured = count
+ring.stop()
+print(ring.summary())
+cv2.destroyAllWindows()
+# the reader loop also ends when the capture thread fails
+if ring.error is not None:
+    raise ring.error
\ No newline at end of file
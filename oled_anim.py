@@ -0,0 +1,280 @@
+# oled_anim.py
+"""
+Compact 1bpp animation asset format (.oanim) for the OLED players.
+
+Frames are stored as PIL '1' bitmaps (rows MSB first, like Arduino
+PROGMEM frames), each one either RLE-encoded on its own (key frame) or as
+the RLE-encoded XOR against the previous frame (delta), whichever is
+smaller, with a key frame at least every KEY_INTERVAL frames. A frame
+index makes every frame addressable; Animation memory-maps the file and
+decodes frames lazily, so only the current frame is kept in memory.
+
+Layout (little endian):
+    header  magic "OANM", version u16, width u16, height u16, delay_ms u16, count u32
+    index   count x (offset u32, length u32, encoding u8, 3 reserved bytes)
+    data    encoded frames
+
+Converter:
+    python3 oled_anim.py convert frames.h -o face.oanim --size 64x64 --delay 42
+    python3 oled_anim.py convert face.gif -o face.oanim
+    python3 oled_anim.py convert f000.png f001.png ... -o face.oanim
+    python3 oled_anim.py info face.oanim
+"""
+
+import argparse
+import mmap
+import re
+import struct
+import sys
+
+from PIL import Image, ImageSequence
+
+MAGIC = b"OANM"
+VERSION = 1
+HEADER = struct.Struct("<4sHHHHI")
+ENTRY = struct.Struct("<IIB3x")
+
+KEY = 0
+DELTA = 1
+
+# longest delta chain a random access has to replay
+KEY_INTERVAL = 32
+
+
+# ---------------------------
+# RLE (PackBits style)
+# ---------------------------
+# control byte c < 128: c + 1 literal bytes follow
+# control byte c >= 128: the next byte repeats c - 125 times (3..130)
+def rle_encode(data):
+    out = bytearray()
+    n = len(data)
+    i = 0
+    literal = bytearray()
+    while i < n:
+        run = 1
+        while i + run < n and run < 130 and data[i + run] == data[i]:
+            run += 1
+        if run >= 3:
+            if literal:
+                _flush_literal(out, literal)
+            out += bytes((run + 125, data[i]))
+            i += run
+        else:
+            literal.append(data[i])
+            i += 1
+            if len(literal) == 128:
+                _flush_literal(out, literal)
+    if literal:
+        _flush_literal(out, literal)
+    return bytes(out)
+
+
+def _flush_literal(out, literal):
+    out.append(len(literal) - 1)
+    out += literal
+    literal.clear()
+
+
+def rle_decode(data, size):
+    out = bytearray(size)
+    pos = 0
+    i = 0
+    while i < len(data):
+        c = data[i]
+        if c < 128:
+            out[pos:pos + c + 1] = data[i + 1:i + 2 + c]
+            pos += c + 1
+            i += c + 2
+        else:
+            count = c - 125
+            out[pos:pos + count] = bytes((data[i + 1],)) * count
+            pos += count
+            i += 2
+    if pos != size:
+        raise ValueError("damaged frame: %d bytes decoded, %d expected" % (pos, size))
+    return out
+
+
+def _xor(a, b):
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(len(a), "big")
+
+
+# ---------------------------
+# Writing
+# ---------------------------
+def write(path, frames, width, height, delay_ms=42):
+    """Write raw 1bpp frames (bytes of width * height / 8) as an .oanim file."""
+    size = width * height // 8
+    encoded = []
+    prev = None
+    for i, frame in enumerate(frames):
+        frame = bytes(frame)
+        if len(frame) != size:
+            raise ValueError("frame %d is %d bytes, expected %d for %dx%d" % (i, len(frame), size, width, height))
+        best = (KEY, rle_encode(frame))
+        if prev is not None and i % KEY_INTERVAL:
+            delta = rle_encode(_xor(frame, prev))
+            if len(delta) < len(best[1]):
+                best = (DELTA, delta)
+        encoded.append(best)
+        prev = frame
+
+    offset = HEADER.size + ENTRY.size * len(encoded)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, width, height, delay_ms, len(encoded)))
+        for encoding, data in encoded:
+            f.write(ENTRY.pack(offset, len(data), encoding))
+            offset += len(data)
+        for _, data in encoded:
+            f.write(data)
+
+
+# ---------------------------
+# Reading
+# ---------------------------
+class Animation:
+    """
+    Memory-mapped .oanim file; frames (raw 1bpp bytes) are decoded on access.
+    Sequential access decodes one frame at a time; random access replays the
+    deltas from the nearest key frame.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.width, self.height, self.delay_ms, self.count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError("%s is not an .oanim file" % path)
+        if version != VERSION:
+            raise ValueError("%s: unsupported .oanim version %d" % (path, version))
+        self.frameSize = self.width * self.height // 8
+        self._last = None  # (index, frame) of the last decoded frame
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def entry(self, i):
+        """(offset, length, encoding) of frame i."""
+        return ENTRY.unpack_from(self._map, HEADER.size + i * ENTRY.size)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("frame index out of range")
+        if self._last is not None and self._last[0] == i:
+            return self._last[1]
+        # start from the last decoded frame if it is on the way, else from the key frame
+        start = i
+        while self.entry(start)[2] == DELTA and not (self._last is not None and self._last[0] == start - 1):
+            start -= 1
+        frame = self._last[1] if self.entry(start)[2] == DELTA else None
+        for j in range(start, i + 1):
+            offset, length, encoding = self.entry(j)
+            data = rle_decode(self._map[offset:offset + length], self.frameSize)
+            frame = bytes(data) if encoding == KEY else _xor(data, frame)
+        self._last = (i, frame)
+        return frame
+
+    def image(self, i):
+        """Frame i as a PIL '1' image."""
+        return Image.frombytes("1", (self.width, self.height), self[i])
+
+    def close(self):
+        self._map.close()
+
+
+# ---------------------------
+# Converter
+# ---------------------------
+_NUMBER = r"(?:0[xX][0-9a-fA-F]+|\d+)"
+_ARRAY = re.compile(r"[\[{]\s*(%s(?:\s*,\s*%s)*)\s*,?\s*[\]}]" % (_NUMBER, _NUMBER))
+
+
+def frames_from_progmem(text, width, height):
+    """
+    Frames from a PROGMEM/C array dump (or Python bytes([...]) literals):
+    every {...} / [...] list of numbers is split into frames of width * height / 8 bytes
+    (shorter lists, such as index expressions, are skipped).
+    """
+    size = width * height // 8
+    frames = []
+    for match in _ARRAY.finditer(text):
+        values = [int(v, 0) for v in match.group(1).split(",")]
+        if len(values) < size:
+            continue
+        if len(values) % size:
+            raise ValueError("array of %d bytes is not a whole number of %dx%d frames" % (len(values), width, height))
+        for i in range(0, len(values), size):
+            frames.append(bytes(values[i:i + size]))
+    return frames
+
+
+def frames_from_images(paths):
+    """Frames, size and delay (ms or None) from a GIF/animated image or a sequence of images."""
+    frames = []
+    size = None
+    delay = None
+    for path in paths:
+        with Image.open(path) as im:
+            for frame in ImageSequence.Iterator(im):
+                if delay is None and frame.info.get("duration"):
+                    delay = int(frame.info["duration"])
+                img = frame.convert("1")
+                if size is None:
+                    size = img.size
+                elif img.size != size:
+                    raise ValueError("%s: %dx%d frame in a %dx%d animation" % (path, img.width, img.height, *size))
+                frames.append(img.tobytes())
+    return frames, size, delay
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = ap.add_subparsers(dest="command", required=True)
+    conv = sub.add_parser("convert", help="build an .oanim from a PROGMEM dump, a GIF or images")
+    conv.add_argument("sources", nargs="+")
+    conv.add_argument("-o", "--output", required=True)
+    conv.add_argument("--size", default="64x64", help="frame size of PROGMEM dumps (default 64x64)")
+    conv.add_argument("--delay", type=int, help="frame delay in ms (default: from the GIF, else 42)")
+    info = sub.add_parser("info", help="describe an .oanim file")
+    info.add_argument("path")
+    args = ap.parse_args(argv)
+
+    if args.command == "info":
+        anim = Animation(args.path)
+        kinds = [anim.entry(i)[2] for i in range(len(anim))]
+        data = sum(anim.entry(i)[1] for i in range(len(anim)))
+        print("%s: %d frames %dx%d, %d ms, %d key / %d delta, %d data bytes (raw %d)" % (
+            args.path, len(anim), anim.width, anim.height, anim.delay_ms,
+            kinds.count(KEY), kinds.count(DELTA), data, len(anim) * anim.frameSize))
+        return 0
+
+    images = [p for p in args.sources if not p.lower().endswith((".h", ".c", ".cpp", ".ino", ".py", ".txt"))]
+    if images and len(images) != len(args.sources):
+        ap.error("mix of PROGMEM dumps and images")
+    if images:
+        frames, (width, height), delay = frames_from_images(images)
+    else:
+        width, height = (int(v) for v in args.size.lower().split("x"))
+        frames = []
+        for path in args.sources:
+            with open(path) as f:
+                frames.extend(frames_from_progmem(f.read(), width, height))
+        delay = None
+    if not frames:
+        ap.error("no frames found")
+    if width % 8:
+        ap.error("frame width must be a multiple of 8")
+    write(args.output, frames, width, height, args.delay or delay or 42)
+    print("%s: %d frames %dx%d" % (args.output, len(frames), width, height))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,89 +1,286 @@
 from luma.core.interface.serial import i2c
 from luma.oled.device import ssd1306
 from PIL import Image
+import hashlib
+import mmap
+import os
+import struct
 import time
 
+from oled_anim import ENTRY, HEADER, Animation
+from roboeyes import SSD1306_COLUMNADDR, SSD1306_PAGEADDR, diff_windows, pack_pages
+
 # -----------------------------
 # OLED SETUP
 # -----------------------------
 serial = i2c(port=1, address=0x3C)   # change to 0x3D if needed
 device = ssd1306(serial, width=128, height=64)
 
-FRAME_DELAY = 0.042  # 42 ms
-FRAME_WIDTH = 64
-FRAME_HEIGHT = 64
-
 BLUE_START = 16         # First row of blue area
 BLUE_HEIGHT = 48        # Height of the blue region
 DISPLAY_WIDTH = 128     # OLED width
 DISPLAY_HEIGHT = 64     # OLED height
 
+# Device-ready frames (SSD1306 page bytes) are built once and cached here,
+# keyed on the .oanim file's size, mtime and header, and memory-mapped to play
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "oled_animation", "frames.bin")
+CACHE_MAGIC = b"OLAF"
+CACHE_FORMAT = 2
+
+# Pacing: a step sent more than LATE_TOLERANCE s after its deadline is late;
+# achieved fps is printed every REPORT_INTERVAL s
+LATE_TOLERANCE = 0.002
+REPORT_INTERVAL = 10.0
+
 # -----------------------------
-# FRAME DATA (converted from Arduino PROGMEM)
-# Each frame is 512 bytes = 64x64 monochrome bitmap
-# Paste ALL your frames here
+# FRAME DATA (converted from Arduino PROGMEM with oled_anim.py)
+# Each frame is 512 bytes = 64x64 monochrome bitmap, decoded on demand
+# from the memory-mapped asset. Rebuild it from a dump, GIF or images:
+#   python3 oled_anim.py convert frames.h -o oled_animation.oanim
 # -----------------------------
+ANIMATION_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "oled_animation.oanim")
+frames = Animation(ANIMATION_FILE)
+FRAME_WIDTH = frames.width
+FRAME_HEIGHT = frames.height
+FRAME_DELAY = frames.delay_ms / 1000
+
+
+# -----------------------------
+# FRAME STORE (scaled, composed and page-packed once)
+# -----------------------------
+def compose(frame):
+    """64x64 PROGMEM bitmap -> 128x64 image with the face in the blue region."""
+    img = Image.frombytes("1", (FRAME_WIDTH, FRAME_HEIGHT), frame)
+
+    # --- SCALE DOWN IF NEEDED ---
+    if img.height > BLUE_HEIGHT:
+        scale = BLUE_HEIGHT / img.height
+        new_width = int(img.width * scale)
+        new_height = int(img.height * scale)
+
+        # Nearest is best for 1-bit images
+        img = img.resize((new_width, new_height), Image.NEAREST)
+
+    # Create a blank 128×64 image
+    full_img = Image.new("1", (DISPLAY_WIDTH, DISPLAY_HEIGHT))
+
+    # Center horizontally, at the start of the blue region
+    x = (DISPLAY_WIDTH - img.width) // 2
+    y = BLUE_START
+
+    # Paste face into the blue section only
+    full_img.paste(img, (x, y))
+    return full_img
+
+
+def store_key(source):
+    """
+    Hash of everything the packed frames depend on: the layout constants and
+    the source .oanim's size, mtime, header and frame index (no frame is
+    decoded, so a cache hit costs a stat and a short read).
+    """
+    st = os.stat(source)
+    with open(source, "rb") as f:
+        header = f.read(HEADER.size)
+        count = HEADER.unpack(header)[5]
+        index = f.read(ENTRY.size * count)
+    h = hashlib.sha1(struct.pack("<7HQQ", CACHE_FORMAT, FRAME_WIDTH, FRAME_HEIGHT, BLUE_START,
+                                 BLUE_HEIGHT, DISPLAY_WIDTH, DISPLAY_HEIGHT,
+                                 st.st_size, st.st_mtime_ns))
+    h.update(header)
+    h.update(index)
+    return h.digest()
+
+
+class FrameStore:
+    """
+    Memory-mapped cache file; frames are zero-copy views of the page
+    buffers, so only the pages being sent are read in.
+    """
+
+    def __init__(self, f, count, size, offset):
+        self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self.count = count
+        self.frameSize = size
+        self._offset = offset
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("frame index out of range")
+        start = self._offset + i * self.frameSize
+        return self._view[start:start + self.frameSize]
+
+
+def load_store(path, key):
+    """Packed frames mapped from the cache file, or None if it is missing or stale."""
+    header = 4 + 20 + 8
+    try:
+        with open(path, "rb") as f:
+            head = f.read(header)
+            if len(head) < header or head[:4] != CACHE_MAGIC or head[4:24] != key:
+                return None
+            count, size = struct.unpack("<II", head[24:header])
+            if count == 0 or os.fstat(f.fileno()).st_size != header + count * size:
+                return None
+            return FrameStore(f, count, size, header)
+    except OSError:
+        return None
+
+
+def save_store(path, key, packed):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(CACHE_MAGIC + key + struct.pack("<II", len(packed), len(packed[0])))
+        f.writelines(packed)
+    os.replace(tmp, path)
+
+
+def frame_store(frames, source=ANIMATION_FILE, path=CACHE_FILE):
+    """
+    Device-ready page buffers for all frames, mapped from the cache or built
+    (and cached) now; in memory only if the cache cannot be written.
+    """
+    key = store_key(source)
+    store = load_store(path, key)
+    if store is not None:
+        return store
+    packed = [bytes(pack_pages(compose(frame), DISPLAY_WIDTH, DISPLAY_HEIGHT)) for frame in frames]
+    try:
+        save_store(path, key, packed)
+    except OSError as e:
+        print("Warning: could not write frame cache:", e)
+        return packed
+    return load_store(path, key) or packed
+
+
+def page_windows(buf, prev):
+    """
+    Transfers (command, data) that turn prev into buf on the display: the
+    windows of pages/columns that changed (everything if prev is None).
+    """
+    w = DISPLAY_WIDTH
+    return [((SSD1306_COLUMNADDR, x0, x1, SSD1306_PAGEADDR, p0, p1),
+             [b for p in range(p0, p1 + 1) for b in buf[p * w + x0:p * w + x1 + 1]])
+            for p0, p1, x0, x1 in diff_windows(buf, prev, w, DISPLAY_HEIGHT // 8)]
+
+
+def fold_holds(packed):
+    """
+    Fold runs of identical frames into [page buffer, hold in frames] steps;
+    a run at the end that matches the first frame joins it across the loop.
+    """
+    timeline = []
+    for buf in packed:
+        if timeline and timeline[-1][0] == buf:
+            timeline[-1][1] += 1
+        else:
+            timeline.append([buf, 1])
+    if len(timeline) > 1 and timeline[-1][0] == timeline[0][0]:
+        timeline[0][1] += timeline.pop()[1]
+    return timeline
+
+
+def send(transfers):
+    for cmd, data in transfers:
+        device.command(*cmd)
+        device.data(data)
+
+
+def play(timeline, steps):
+    """
+    Show the timeline on absolute deadlines. Each step is sent early by its
+    transfer time (its bytes at the measured bus time per byte) so it is on
+    the display at its deadline; when the bus falls behind, steps whose
+    successor is already due are skipped.
+    Reports achieved against target fps every REPORT_INTERVAL seconds.
+    """
+    holds = [hold for _, hold in timeline]
+    offsets = [sum(holds[:k]) * FRAME_DELAY for k in range(len(holds))]
+    loop_time = sum(holds) * FRAME_DELAY
+    step_bytes = [sum(len(cmd) + len(data) for cmd, data in transfers) for transfers, _ in steps]
+    byte_time = None  # moving average of the bus time per byte (s)
+
+    # first frame in full: the display content is unknown
+    send(page_windows(timeline[0][0], None))
+    start = time.monotonic()
+    report_at = start + REPORT_INTERVAL
+    skipped, late, bus = 0, 0, 0.0
+    window_start, window_shown = start, 0
+    i, loop = 0, 0
+
+    def deadline(step, loop):
+        return start + loop * loop_time + offsets[step]
+
+    while True:
+        nxt, nxt_loop = (i + 1, loop) if i + 1 < len(steps) else (0, loop + 1)
+        early = step_bytes[nxt] * byte_time if byte_time else 0
+        delay = deadline(nxt, nxt_loop) - early - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+        # can't keep up: skip ahead while the step after nxt is already due
+        now = time.monotonic()
+        while True:
+            after, after_loop = (nxt + 1, nxt_loop) if nxt + 1 < len(steps) else (0, nxt_loop + 1)
+            if deadline(after, after_loop) > now:
+                break
+            skipped += holds[nxt]
+            nxt, nxt_loop = after, after_loop
+
+        # only stream bytes: everything was scaled, composed and packed at startup
+        if nxt == (i + 1) % len(steps):
+            transfers = steps[nxt][0]
+        else:
+            transfers = page_windows(timeline[nxt][0], timeline[i][0])
+        t0 = time.monotonic()
+        send(transfers)
+        t1 = time.monotonic()
+        sent = sum(len(cmd) + len(data) for cmd, data in transfers)
+        if sent:
+            rate = (t1 - t0) / sent
+            byte_time = rate if byte_time is None else byte_time + (rate - byte_time) * 0.25
+        bus += t1 - t0
+        if t1 - deadline(nxt, nxt_loop) > LATE_TOLERANCE:
+            late += 1
+        # the frames of the step that was on the display until now
+        window_shown += holds[i]
+        i, loop = nxt, nxt_loop
+
+        if t1 >= report_at:
+            print("achieved %.1f fps (target %.1f), %d late, %d frames skipped, bus %.1f%%" % (
+                window_shown / (t1 - window_start), 1 / FRAME_DELAY, late, skipped,
+                100 * bus / (t1 - start)))
+            window_start, window_shown = t1, 0
+            report_at = t1 + REPORT_INTERVAL
 
-frames = [
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,224,0,0,0,0,0,0,15,248,0,63,254,0,0,0,30,120,3,255,255,192,0,0,60,60,15,255,255,248,0,0,56,28,63,128,1,252,0,0,56,28,124,0,0,127,0,0,56,28,112,0,0,15,192,0,56,28,0,0,0,3,224,0,0,56,0,0,0,1,240,0,0,56,0,0,0,0,120,0,0,112,0,0,0,0,60,0,0,112,0,128,0,0,30,0,0,96,15,240,7,240,14,0,0,96,63,248,31,248,7,0,0,112,124,124,63,252,3,128,0,0,120,24,16,30,3,128,0,0,112,0,0,14,1,192,0,56,0,0,0,4,1,224,0,56,0,0,0,0,0,224,6,56,3,128,0,224,0,96,14,0,15,128,3,224,0,112,14,0,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,7,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,128,1,224,0,56,24,0,3,0,0,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,31,224,0,112,6,0,0,7,255,224,0,240,7,0,0,63,255,224,0,224,7,0,1,255,128,0,0,224,3,128,7,240,0,0,1,224,3,128,7,128,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,112,15,255,255,248,0,0,1,248,63,128,1,252,0,0,3,24,124,0,0,127,0,0,3,12,112,0,0,15,192,0,2,12,0,0,0,3,224,0,3,24,0,0,0,1,240,0,0,24,0,0,0,0,120,0,0,24,0,0,0,0,60,0,0,16,0,0,0,0,30,0,0,16,0,0,0,0,14,0,0,0,7,224,3,224,7,0,0,8,31,248,15,248,3,128,0,12,63,248,63,254,3,128,0,0,120,60,28,30,1,192,0,0,112,0,16,14,1,224,0,0,0,0,0,0,0,224,6,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,192,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,128,1,224,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,32,124,0,0,127,0,0,0,72,112,0,0,15,192,0,0,136,0,0,0,3,224,0,0,136,0,0,0,1,240,0,0,8,0,0,0,0,120,0,0,8,0,0,0,0,60,0,0,8,0,0,0,0,30,0,0,0,0,0,0,0,14,0,0,4,0,0,0,0,7,0,0,0,15,224,3,240,3,128,0,0,63,248,15,252,3,128,0,0,127,248,63,254,1,192,2,0,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,124,0,0,127,0,0,0,0,112,0,0,15,192,0,0,0,0,0,0,3,224,0,0,0,0,0,0,1,240,0,0,0,0,0,0,0,120,0,0,0,0,0,0,0,60,0,0,0,0,0,0,0,30,0,0,0,0,0,0,0,14,0,0,192,0,0,0,0,7,0,1,192,15,224,3,240,3,128,3,192,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,124,0,0,127,0,0,0,0,112,0,0,15,192,0,0,0,0,0,0,3,224,0,0,0,0,0,0,1,240,0,0,24,0,0,0,0,120,0,0,60,0,0,0,0,60,0,0,120,0,0,0,0,30,0,0,240,0,0,0,0,14,0,0,224,0,0,0,0,7,0,1,224,15,224,3,240,3,128,3,192,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,124,0,0,127,0,0,0,1,240,0,0,15,192,0,0,7,128,0,0,3,224,0,0,15,128,0,0,1,240,0,0,30,0,0,0,0,120,0,0,60,0,0,0,0,60,0,0,120,0,0,0,0,30,0,0,240,0,0,0,0,14,0,0,224,0,0,0,0,7,0,1,224,15,224,3,240,3,128,3,192,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,7,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,28,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,252,0,0,127,0,0,0,1,240,0,0,15,192,0,0,7,192,0,0,3,224,0,0,15,128,0,0,1,240,0,0,30,0,0,0,0,120,0,0,60,0,0,0,0,60,0,0,120,0,0,0,0,30,0,0,240,0,0,0,0,14,0,0,224,0,0,0,0,7,0,1,224,15,224,3,240,3,128,3,192,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,252,0,0,127,0,0,0,1,240,0,0,15,192,0,0,7,192,0,0,3,224,0,0,15,128,0,0,1,240,0,0,30,0,0,0,0,120,0,0,60,0,0,0,0,60,0,0,120,0,0,0,0,30,0,0,240,0,0,0,0,14,0,0,224,0,0,0,0,7,0,1,224,15,224,3,240,3,128,3,192,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,252,0,0,127,0,0,0,1,240,0,0,15,192,0,0,7,192,0,0,3,224,0,0,15,128,0,0,1,240,0,0,30,0,0,0,0,120,0,0,60,0,0,0,0,60,0,0,120,0,0,0,0,30,0,0,240,0,0,0,0,14,0,0,224,0,0,0,0,7,0,1,224,15,224,3,240,3,128,3,192,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,252,0,0,127,0,0,0,1,240,0,0,15,192,0,0,7,192,0,0,3,224,0,0,15,128,0,0,1,240,0,0,30,0,0,0,0,120,0,0,60,0,0,0,0,60,0,0,120,0,0,0,0,30,0,0,240,0,0,0,0,14,0,0,224,0,0,0,0,7,0,1,224,15,224,3,240,3,128,3,192,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,252,0,0,127,0,0,0,1,240,0,0,15,192,0,0,7,192,0,0,3,224,0,0,15,128,0,0,1,240,0,0,30,0,0,0,0,120,0,0,60,0,0,0,0,60,0,0,120,0,0,0,0,30,0,0,240,0,0,0,0,14,0,0,224,0,0,0,0,7,0,1,224,15,224,3,240,3,128,3,192,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,252,0,0,127,0,0,0,1,240,0,0,15,192,0,0,7,192,0,0,3,224,0,0,15,128,0,0,1,240,0,0,30,0,0,0,0,120,0,0,60,0,0,0,0,60,0,0,120,0,0,0,0,30,0,0,240,0,0,0,0,14,0,0,224,0,0,0,0,7,0,1,224,15,224,3,240,3,128,3,192,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,124,0,0,127,0,0,0,0,112,0,0,15,192,0,0,0,0,0,0,3,224,0,0,14,0,0,0,1,240,0,0,30,0,0,0,0,120,0,0,60,0,0,0,0,60,0,0,120,0,0,0,0,30,0,0,240,0,0,0,0,14,0,0,224,0,0,0,0,7,0,1,224,15,224,3,240,3,128,3,192,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,0,15,255,255,248,0,0,0,0,63,128,1,252,0,0,0,0,124,0,0,127,0,0,0,0,112,0,0,15,192,0,0,136,0,0,0,3,224,0,0,136,0,0,0,1,240,0,0,0,0,0,0,0,120,0,0,0,0,0,0,0,60,0,0,0,0,0,0,0,30,0,0,0,0,0,0,0,14,0,0,4,0,0,0,0,7,0,0,0,15,224,3,240,3,128,3,128,63,248,15,252,3,128,3,128,127,248,63,254,1,192,7,128,112,60,28,14,1,224,7,0,96,0,16,4,0,224,15,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,224,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,0,1,192,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,7,255,255,224,0,112,6,0,15,255,255,224,0,240,7,0,7,255,255,224,0,224,7,0,0,0,0,0,0,224,3,128,0,0,0,0,1,224,3,128,0,0,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,63,254,0,0,0,0,0,3,255,255,192,0,0,0,96,15,255,255,248,0,0,1,240,63,128,1,252,0,0,3,24,124,0,0,127,0,0,6,24,112,0,0,15,192,0,6,24,0,0,0,3,224,0,2,24,0,0,0,1,240,0,0,24,0,0,0,0,120,0,0,16,0,0,0,0,60,0,0,16,0,0,0,0,30,0,0,24,0,0,0,0,14,0,0,0,7,224,3,224,7,0,0,12,31,248,15,248,3,128,0,12,63,248,63,254,3,128,0,0,120,60,28,30,1,192,0,0,112,0,16,14,1,224,0,0,0,0,0,0,0,224,6,0,0,0,0,0,0,96,14,0,7,128,1,224,0,112,14,0,15,192,3,240,0,112,30,0,31,192,7,240,0,48,28,0,31,224,7,248,0,56,28,0,31,224,7,248,0,56,28,0,15,224,3,248,0,56,28,0,15,192,3,240,0,56,28,0,7,128,1,224,0,56,24,0,0,0,0,0,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,31,224,0,112,6,0,0,7,255,224,0,240,7,0,0,63,255,224,0,224,7,0,1,255,128,0,0,224,3,128,7,240,0,0,1,224,3,128,7,128,0,0,3,192,1,192,0,0,0,0,3,128,0,224,0,0,0,0,7,128,0,240,0,0,0,0,15,0,0,112,0,0,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,3,224,0,0,0,0,0,0,15,240,0,63,254,0,0,0,30,248,3,255,255,192,0,0,56,56,15,255,255,248,0,0,56,28,63,128,1,252,0,0,48,28,124,0,0,127,0,0,48,28,112,0,0,15,192,0,48,56,0,0,0,3,224,0,32,56,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,112,0,0,0,0,60,0,0,112,0,128,0,0,30,0,0,112,15,240,7,240,14,0,0,112,63,248,31,248,7,0,0,32,124,124,63,252,3,128,0,0,120,24,16,30,3,128,0,8,112,0,0,14,1,192,0,28,0,0,0,4,1,224,0,28,0,0,0,0,0,224,6,24,3,128,0,224,0,96,14,0,15,128,3,224,0,112,14,0,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,7,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,128,1,224,0,56,24,0,3,0,0,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0]),
-  bytes([0,0,0,0,0,0,0,0,3,192,0,0,0,0,0,0,15,240,0,0,0,0,0,0,63,248,0,0,0,0,0,0,120,120,0,63,254,0,0,0,240,60,3,255,255,192,0,0,240,28,15,255,255,248,0,0,224,28,63,128,1,252,0,0,224,28,124,0,0,127,0,0,224,60,112,0,0,15,192,0,192,56,0,0,0,3,224,0,0,120,0,0,0,1,240,0,0,112,0,0,0,0,120,0,0,240,7,240,0,0,60,0,0,224,31,248,7,224,30,0,0,224,63,252,31,240,14,0,0,224,120,16,63,252,7,0,0,224,112,0,24,60,3,128,0,224,96,0,0,30,3,128,0,0,0,0,0,14,1,192,0,0,0,0,0,0,1,224,0,48,0,0,0,0,0,224,6,120,7,128,1,224,0,96,14,56,15,128,3,224,0,112,14,48,15,192,3,240,0,112,30,0,15,192,3,240,0,48,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,15,192,3,240,0,56,28,0,7,192,1,224,0,56,24,0,7,128,1,192,0,24,56,0,0,0,0,0,0,24,24,0,0,0,0,0,0,28,24,0,0,0,0,0,0,24,24,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,28,0,0,0,0,0,0,56,14,0,0,0,0,0,0,112,14,0,0,0,7,224,0,112,6,0,0,0,127,224,0,240,7,0,0,3,255,224,0,224,7,0,0,15,240,0,0,224,3,128,0,63,0,0,1,224,3,128,0,248,0,0,3,192,1,192,1,240,0,0,3,128,0,224,3,224,0,0,7,128,0,240,3,128,0,0,15,0,0,112,3,128,0,0,30,0,0,60,0,0,0,0,30,0,0,62,0,0,0,0,124,0,0,31,0,0,0,0,248,0,0,15,192,0,0,1,224,0,0,3,224,0,0,7,192,0,0,1,248,0,0,15,128,0,0,0,127,0,0,126,0,0,0,0,63,240,7,248,0,0,0,0,15,255,255,224,0,0,0,0,1,255,255,0,0,0,0,0,0,7,224,0,0,0,0,0,0,0,0,0,0,0])
-
-]
 
 # -----------------------------
 # DISPLAY ANIMATION LOOP
 # -----------------------------
-while True:
-    for frame in frames:
-        img = Image.frombytes("1", (FRAME_WIDTH, FRAME_HEIGHT), frame)
-
-        # --- SCALE DOWN IF NEEDED ---
-        if img.height > BLUE_HEIGHT:
-            scale = BLUE_HEIGHT / img.height
-            new_width = int(img.width * scale)
-            new_height = int(img.height * scale)
-    
-            # Nearest is best for 1-bit images
-            img = img.resize((new_width, new_height), Image.NEAREST)
-    
-        # Create a blank 128×64 image
-        full_img = Image.new("1", (DISPLAY_WIDTH, DISPLAY_HEIGHT))
-    
-        # Center horizontally
-        x = (DISPLAY_WIDTH - img.width) // 2
-    
-        # Position at start of blue region
-        y = BLUE_START
-    
-        # Paste face into the blue section only
-        full_img.paste(img, (x, y))
-    
-        # Display frame
-        device.display(full_img)
-        time.sleep(FRAME_DELAY)
+packed = frame_store(frames)
+timeline = fold_holds(packed)
+# per step, the transfers from the previous step of the cycle (the last one before the first)
+steps = [(page_windows(buf, timeline[i - 1][0]), hold) for i, (buf, hold) in enumerate(timeline)]
+
+# what holds and windows save per loop, against resending every frame in full
+frame_bytes = len(packed[0])
+held = len(packed) - len(timeline)
+sent_bytes = sum(len(data) for transfers, _ in steps for _, data in transfers)
+sent_transfers = sum(len(transfers) for transfers, _ in steps)
+print("%d frames -> %d steps: holds skip %d frames per loop (%d transfers, %d bytes)" % (
+    len(packed), len(timeline), held, held, held * frame_bytes))
+print("per loop: %d bytes in %d transfers instead of %d bytes in %d" % (
+    sent_bytes, sent_transfers, len(packed) * frame_bytes, len(packed)))
+
+play(timeline, steps)
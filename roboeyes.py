@@ -9,14 +9,24 @@ Implements nearly all features from the Arduino version:
 - cyclops / curiosity
 - rounded eyes, triangular eyelids, happy bottom eyelid
 - smooth tweening ("Next" values)
-Use with luma.oled (ssd1306 or ssd1327) + Pillow.
+Use with luma.oled (ssd1306 or ssd1327) + Pillow; on ssd1327 frames are drawn
+in 4-bit grayscale with anti-aliased edges and only changed rows are sent.
 """
 
 import time
 import random
+import threading
+from array import array
+from functools import lru_cache
 from math import floor
 from PIL import Image, ImageDraw
 
+# Optional: vectorized NumPy render backend
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # If using luma:
 try:
     from luma.core.interface.serial import i2c
@@ -39,31 +49,446 @@ OFF = False
 # position definitions (not strictly necessary but included for parity)
 N = 1; NE = 2; E = 3; SE = 4; S = 5; SW = 6; W = 7; NW = 8
 
+# SSD1306 addressing commands used for partial (windowed) updates
+SSD1306_COLUMNADDR = 0x21
+SSD1306_PAGEADDR = 0x22
+# SSD1327 (4-bit grayscale) window commands: column address counts pixel pairs
+SSD1327_COLUMNADDR = 0x15
+SSD1327_ROWADDR = 0x75
+# attributes advanced by update(); when none of them change over a frame and
+# nothing is animating, the eyes have converged and rendering can stop
+# (targets are included because the blink/idle timers change them inside update())
+STATE_ATTRS = (
+    "eyeLx", "eyeLy", "eyeRx", "eyeRy", "eyeLxNext", "eyeLyNext", "eyeRxNext", "eyeRyNext",
+    "eyeLwidthCurrent", "eyeRwidthCurrent", "eyeLwidthNext", "eyeRwidthNext",
+    "eyeLheightCurrent", "eyeRheightCurrent", "eyeLheightNext", "eyeRheightNext",
+    "eyeLheightOffset", "eyeRheightOffset",
+    "eyeLborderRadiusCurrent", "eyeRborderRadiusCurrent",
+    "eyeLborderRadiusNext", "eyeRborderRadiusNext",
+    "spaceBetweenCurrent", "spaceBetweenNext",
+    "eyelidsTiredHeight", "eyelidsAngryHeight", "eyelidsHappyBottomOffset",
+    "eyelidsTiredHeightNext", "eyelidsAngryHeightNext", "eyelidsHappyBottomOffsetNext",
+)
+
+# run(): a frame starting this many seconds after its deadline counts as late
+LATE_TOLERANCE = 0.002
+
+# run(adaptive=True): on-time frames in a row before the frame rate is raised again
+ADAPTIVE_RECOVER_FRAMES = 50
+
+# command bytes sent per window (COLUMNADDR x0 x1 PAGEADDR p0 p1); two dirty
+# pages are merged into one window when that is not more expensive
+WINDOW_OVERHEAD = 6
+
+# Instrumentation: stages timed every frame and samples kept per stage for stats()
+# ("wake" is the setter-to-display latency measured by the asyncio driver)
+STATS_STAGES = ("state", "render", "pack", "transfer", "frame", "wake")
+STATS_WINDOW = 256
+
 def millis():
     """Arduino-like millis() in milliseconds."""
     return int(time.monotonic() * 1000)
 
 
+# stage timer clock (ns); a module global so timing a stage costs one call
+_perf_ns = time.perf_counter_ns
+
+
+def _approach(current, target, k):
+    """Move current a fraction k towards target; snap once within half a pixel."""
+    if abs(target - current) < 0.5:
+        return target
+    return current + (target - current) * k
+
+
+# 8-bit gray -> 4-bit nibble lookup tables (even pixel low nibble, odd pixel high nibble)
+_NIBBLE_LOW = bytes(v >> 4 for v in range(256))
+_NIBBLE_HIGH = bytes(v & 0xF0 for v in range(256))
+
+
+def pack_pages(img, width, height):
+    """Pack a PIL image into SSD1306 page order (8 rows per byte, LSB = top row)."""
+    if img.mode != "1":
+        img = img.convert("1")
+    pages = height // 8
+    # rotating clockwise turns every column into a row of packed bytes,
+    # ordered from the bottom page to the top page
+    raw = img.transpose(Image.ROTATE_270).tobytes()
+    buf = bytearray(width * pages)
+    for p in range(pages):
+        buf[p * width:(p + 1) * width] = raw[pages - 1 - p::pages]
+    return buf
+
+
+def diff_windows(buf, old, stride, rows):
+    """
+    (row0, row1, col0, col1) windows where buf differs from old, both laid out
+    as `rows` rows of `stride` bytes (SSD1306 pages, SSD1327 pixel rows).
+    Neighbouring rows are merged when one window costs no more than two.
+    """
+    if old is None:
+        return [(0, rows - 1, 0, stride - 1)]
+    windows = []
+    for p in range(rows):
+        start = p * stride
+        row = buf[start:start + stride]
+        prev = old[start:start + stride]
+        if row == prev:
+            continue
+        x0 = 0
+        while row[x0] == prev[x0]:
+            x0 += 1
+        x1 = stride - 1
+        while row[x1] == prev[x1]:
+            x1 -= 1
+        if windows and windows[-1][1] == p - 1:
+            # neighbouring row: merge if one bigger window costs no more than two
+            p0, p1, c0, c1 = windows[-1]
+            m0, m1 = min(c0, x0), max(c1, x1)
+            separate = (p1 - p0 + 1) * (c1 - c0 + 1) + (x1 - x0 + 1) + WINDOW_OVERHEAD
+            merged = (p - p0 + 1) * (m1 - m0 + 1)
+            if merged <= separate:
+                windows[-1] = (p0, p, m0, m1)
+                continue
+        windows.append((p, p, x0, x1))
+    return windows
+
+
+# ---------------------------
+# Sprite cache
+# ---------------------------
+# Eye and eyelid shapes only take a handful of sizes while tweening converges,
+# so every shape is rasterized once per geometry and then blitted at (x, y).
+# Hard-edged PIL triangles are drawn in place (see RoboEyes._fill_triangle).
+SPRITE_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def _round_rect_sprite(w, h, r):
+    """Mode '1' mask of a filled rounded rectangle (paste mask for '1' and 'L' images)."""
+    mask = Image.new("1", (w, h), 0)
+    draw = ImageDraw.Draw(mask)
+    try:
+        draw.rounded_rectangle([0, 0, w - 1, h - 1], radius=r, fill=1)
+    except Exception:
+        # fallback: draw rectangle (older Pillow versions)
+        draw.rectangle([0, 0, w - 1, h - 1], fill=1)
+    return mask
+
+
+# Anti-aliased sprites for the grayscale path: drawn at AA_SCALE x AA_SCALE
+# resolution and box-filtered down to an 'L' coverage mask
+AA_SCALE = 4
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def _round_rect_sprite_aa(w, h, r):
+    """Mode 'L' coverage mask of a filled rounded rectangle with anti-aliased edges."""
+    s = AA_SCALE
+    mask = Image.new("L", (w * s, h * s), 0)
+    draw = ImageDraw.Draw(mask)
+    try:
+        draw.rounded_rectangle([0, 0, w * s - 1, h * s - 1], radius=r * s, fill=255)
+    except Exception:
+        draw.rectangle([0, 0, w * s - 1, h * s - 1], fill=255)
+    return mask.resize((w, h), Image.BOX)
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def _triangle_sprite_aa(pts):
+    """Mode 'L' coverage mask of a filled triangle, vertices relative to its bounding box."""
+    s = AA_SCALE
+    w = max(p[0] for p in pts) + 1
+    h = max(p[1] for p in pts) + 1
+    mask = Image.new("L", (w * s, h * s), 0)
+    # vertices sit on pixel centres, like the hard-edged sprite
+    ImageDraw.Draw(mask).polygon([(x * s + s // 2, y * s + s // 2) for x, y in pts], fill=255)
+    return mask.resize((w, h), Image.BOX)
+
+
+def sprite_cache_info():
+    """Hit/miss counters of the shape caches (functools CacheInfo per cache)."""
+    info = {
+        "round_rect": _round_rect_sprite.cache_info(),
+        "round_rect_aa": _round_rect_sprite_aa.cache_info(),
+        "triangle_aa": _triangle_sprite_aa.cache_info(),
+    }
+    if np is not None:
+        info["round_rect_mask"] = _round_rect_mask.cache_info()
+        info["triangle_mask"] = _triangle_mask.cache_info()
+    return info
+
+
+def sprite_cache_clear():
+    """Drop all cached shapes and reset the counters."""
+    _round_rect_sprite.cache_clear()
+    _round_rect_sprite_aa.cache_clear()
+    _triangle_sprite_aa.cache_clear()
+    if np is not None:
+        _round_rect_mask.cache_clear()
+        _triangle_mask.cache_clear()
+
+
+# ---------------------------
+# NumPy backend shape masks
+# ---------------------------
+# bit weights that fold 8 canvas rows into one SSD1306 page byte (LSB = top row)
+_PAGE_BITS = np.array([1, 2, 4, 8, 16, 32, 64, 128], dtype=np.uint8) if np is not None else None
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def _round_rect_mask(w, h, r):
+    """Boolean (h, w) mask of a filled rounded rectangle with corner radius r (cached, read-only)."""
+    r = min(r, (w - 1) // 2, (h - 1) // 2)
+    ys = np.arange(h)[:, None]
+    xs = np.arange(w)[None, :]
+    # distance from the nearest corner centre (0 along the straight edges)
+    dx = xs - np.clip(xs, r, w - 1 - r)
+    dy = ys - np.clip(ys, r, h - 1 - r)
+    mask = dx * dx + dy * dy <= r * (r + 0.8)
+    mask.setflags(write=False)
+    return mask
+
+
+@lru_cache(maxsize=SPRITE_CACHE_SIZE)
+def _triangle_mask(pts):
+    """Boolean mask of a filled triangle, vertices relative to its bounding box (cached, read-only)."""
+    w = max(p[0] for p in pts) + 1
+    h = max(p[1] for p in pts) + 1
+    ys = np.arange(h, dtype=float)
+    lo = np.full(h, np.inf)
+    hi = np.full(h, -np.inf)
+    for (ax, ay), (bx, by) in ((pts[0], pts[1]), (pts[1], pts[2]), (pts[2], pts[0])):
+        rows = (ys >= min(ay, by)) & (ys <= max(ay, by))
+        if ay == by:
+            x0, x1 = min(ax, bx), max(ax, bx)
+        else:
+            x0 = x1 = ax + (ys[rows] - ay) * (bx - ax) / (by - ay)
+        lo[rows] = np.minimum(lo[rows], x0)
+        hi[rows] = np.maximum(hi[rows], x1)
+    # rounding that gives the same coverage as Pillow's polygon fill
+    xs = np.arange(w)
+    mask = (xs >= np.floor(lo + 0.5)[:, None]) & (xs <= np.ceil(hi - 0.5)[:, None])
+    mask.setflags(write=False)
+    return mask
+
+
+class FramePipe:
+    """
+    Latest-frame-wins handoff from the render thread to a transfer thread.
+    Page buffers are copied into one of two preallocated buffers (double
+    buffering), so the renderer can reuse its own buffer right away; a frame
+    that is replaced before the transfer thread picks it up is dropped.
+    """
+
+    def __init__(self, send):
+        self._send = send
+        self._cond = threading.Condition()
+        self._pending = None
+        self._sending = None
+        self._buffers = None
+        self._running = True
+        self.framesSent = 0
+        self.framesDropped = 0
+        self._thread = threading.Thread(target=self._run, name="roboeyes-transfer", daemon=True)
+        self._thread.start()
+
+    def put(self, frame):
+        """Queue a frame (page bytes or PIL image), replacing any frame not yet sent."""
+        with self._cond:
+            if isinstance(frame, (bytes, bytearray)):
+                if self._buffers is None or len(self._buffers[0]) != len(frame):
+                    self._buffers = (bytearray(len(frame)), bytearray(len(frame)))
+                back = self._buffers[0] if self._buffers[0] is not self._sending else self._buffers[1]
+                back[:] = frame
+                frame = back
+            if self._pending is not None:
+                self.framesDropped += 1
+            self._pending = frame
+            self._cond.notify()
+
+    def stop(self):
+        """Send the pending frame (if any) and end the transfer thread."""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None and self._running:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                frame = self._sending = self._pending
+                self._pending = None
+            try:
+                self._send(frame)
+            except Exception as e:
+                print("RoboEyes transfer failed:", e)
+            with self._cond:
+                self._sending = None
+            self.framesSent += 1
+
+
+class FrameStats:
+    """
+    Rolling per-stage frame timings.
+    Every stage keeps its last `window` durations (ns) in a preallocated ring,
+    so recording a sample is one store; sorting for percentiles only happens
+    when summary() is asked for. Frame start times and the bus byte counter
+    are kept the same way for achieved fps and bytes per second.
+    """
+
+    def __init__(self, window=STATS_WINDOW):
+        self.window = window
+        self._samples = {stage: array("q", bytes(8 * window)) for stage in STATS_STAGES}
+        self._counts = dict.fromkeys(STATS_STAGES, 0)
+        self._frameStart = array("q", bytes(8 * window))
+        self._frameBytes = array("q", bytes(8 * window))
+
+    def add(self, stage, ns):
+        """Record one duration for a stage."""
+        n = self._counts[stage]
+        self._samples[stage][n % self.window] = ns
+        self._counts[stage] = n + 1
+
+    def frame(self, start_ns, ns, bytes_sent):
+        """Record a finished frame: start time, total duration, bytes sent so far."""
+        n = self._counts["frame"] % self.window
+        self._frameStart[n] = start_ns
+        self._frameBytes[n] = bytes_sent
+        self.add("frame", ns)
+
+    def reset(self):
+        for stage in STATS_STAGES:
+            self._counts[stage] = 0
+
+    def _window(self, values, count):
+        """Samples in the ring, oldest first."""
+        if count <= self.window:
+            return values[:count]
+        i = count % self.window
+        return values[i:] + values[:i]
+
+    def summary(self):
+        """Dict with achieved fps, bytes/s and per-stage count/mean/p50/p95/max in microseconds."""
+        frames = self._counts["frame"]
+        starts = self._window(self._frameStart, frames)
+        sent = self._window(self._frameBytes, frames)
+        fps = bytes_per_s = 0.0
+        if len(starts) > 1 and starts[-1] > starts[0]:
+            span = (starts[-1] - starts[0]) / 1e9
+            fps = (len(starts) - 1) / span
+            bytes_per_s = (sent[-1] - sent[0]) / span
+        stages = {}
+        for stage in STATS_STAGES:
+            values = sorted(self._window(self._samples[stage], self._counts[stage]))
+            if not values:
+                continue
+            last = len(values) - 1
+            stages[stage] = {
+                "count": self._counts[stage],
+                "mean_us": sum(values) / len(values) / 1000,
+                "p50_us": values[last // 2] / 1000,
+                "p95_us": values[last * 95 // 100] / 1000,
+                "max_us": values[last] / 1000,
+            }
+        return {"fps": fps, "bytes_per_s": bytes_per_s, "stages": stages}
+
+
 class RoboEyes:
-    def __init__(self, device=None, width=128, height=64, frame_rate=50, monochrome=False):
+    def __init__(self, device=None, width=128, height=64, frame_rate=50, monochrome=False, partial_update=True,
+                 backend="pil", pipelined=False, time_based=False, clock=None, rng=None, instrumented=True):
         """
         device: luma device or None. If None, you can still call draw_frame_to_image() to get PIL Image.
         width/height: screen pixel dimensions
         frame_rate: target FPS
         monochrome: True uses mode '1' (0/1), False uses 'L' (0/255). Defaults to True.
+        partial_update: on SSD1306-style devices only send the pages/columns that changed
+        backend: "pil" draws with ImageDraw, "numpy" rasterizes straight into SSD1306 page
+                 bytes (used with SSD1306-style devices or no device; otherwise falls back to PIL)
+        pipelined: transfer frames on a background thread while the next one is rendered
+        time_based: tween by elapsed time instead of per frame, so animation speed
+                    does not depend on frame_rate (see setTimeBased())
+        clock: millisecond clock used for all timers (default millis(); inject a virtual clock for tests)
+        rng: random source with randint() (default the random module; e.g. random.Random(seed))
+        instrumented: time every frame stage for stats() (a few clock reads per frame)
         """
+        self.millis = clock if clock is not None else millis
+        self.random = rng if rng is not None else random
         self.device = device
         self.screenWidth = width
         self.screenHeight = height
         self.monochrome = monochrome
 
+        # Partial updates: last page (SSD1306) or nibble row (SSD1327) buffer sent
+        # to the display (None = unknown, send full frame)
+        self.partialUpdate = partial_update
+        self._shadow = None
+        self.bytesSent = 0
+        self.windowsSent = 0
+
+        # Render backend
+        if backend not in ("pil", "numpy"):
+            raise ValueError("unknown backend: %r" % (backend,))
+        if backend == "numpy" and np is None:
+            raise ImportError("backend='numpy' needs numpy installed")
+        self.backend = backend
+        if backend == "numpy":
+            # preallocated canvas and page buffer, reused every frame
+            pages = height // 8
+            self._canvas = np.zeros((height, width), dtype=bool)
+            self._pageBuffer = bytearray(width * pages)
+            self._pagesArray = np.frombuffer(self._pageBuffer, dtype=np.uint8).reshape(pages, width)
+
+        # Pipelined mode: frames go to a transfer thread (see startPipeline())
+        self._pipe = None
+        # called with each finished frame instead of sending it, for drivers that
+        # schedule the bus themselves; they send it with transferFrame()
+        self.frameSink = None
+        if pipelined and device is not None:
+            self.startPipeline()
+
+        # Clip playback: (frame iterator, final state) while a precompiled clip plays
+        self._clip = None
+
+        # run() scheduler counters
+        self._running = False
+        self.framesRendered = 0
+        self.lateFrames = 0
+        self.droppedFrames = 0
+
+        # Instrumentation: per-stage timings for stats(), optional periodic log line
+        self._stats = FrameStats() if instrumented else None
+        self._statsLog = None
+        self._statsInterval = 0
+        self._statsNextLog = 0
+
+        # Quiescent mode: set once a frame changes nothing, cleared by setters/timers
+        self.quiescent = False
+        self._lastState = None
+        self._wakeEvent = threading.Event()
+        # called by wake() (from the setter's thread), e.g. to wake an event loop
+        self.onWake = None
+
         # Colors (0/1 or 0/255)
         self.BGCOLOR = 0
         self.MAINCOLOR = 1 if monochrome else 255
+        # grayscale (SSD1327) path: anti-aliased edges
+        self.antialias = True
 
         # Frame timing
         self.frameInterval = 1000 // frame_rate  # ms
-        self.fpsTimer = millis()
+        self.targetFrameInterval = self.frameInterval  # run(adaptive=True) may raise frameInterval above this
+        self.fpsTimer = self.millis()
+
+        # Tweening: per frame (original) or by elapsed time at tweenRate halvings per second
+        self.timeBased = time_based
+        self.tweenRate = 50
+        self._lastTickMs = None
+        self._dt = self.frameInterval
 
         # Mood flags
         self.tired = False
@@ -140,12 +565,12 @@ class RoboEyes:
         self.autoblinker = False
         self.blinkInterval = 1
         self.blinkIntervalVariation = 4
-        self.blinktimer = millis()
+        self.blinktimer = self.millis()
 
         self.idle = False
         self.idleInterval = 1
         self.idleIntervalVariation = 3
-        self.idleAnimationTimer = millis()
+        self.idleAnimationTimer = self.millis()
 
         self.confused = False
         self.confusedAnimationTimer = 0
@@ -192,35 +617,153 @@ class RoboEyes:
     # UTIL / SETTERS
     # ---------------------------
     def setFramerate(self, fps):
+        self.wake()
         self.frameInterval = int(1000 / fps)
+        self.targetFrameInterval = self.frameInterval
+
+    def setTimeBased(self, active, rate=None):
+        """Tween by elapsed time (rate = halvings per second) instead of once per frame."""
+        self.wake()
+        self.timeBased = bool(active)
+        if rate is not None:
+            self.tweenRate = rate
+        self._lastTickMs = None
+
+    def wake(self):
+        """Leave quiescent mode; called by every setter (call it after changing attributes directly)."""
+        if self.quiescent:
+            # don't let the time-based tween see the whole pause as one frame
+            self._lastTickMs = None
+        self.quiescent = False
+        self._wakeEvent.set()
+        if self.onWake is not None:
+            self.onWake()
+
+    def nextTimer(self):
+        """millis() time of the next scheduled blink/idle timer, or None if none is running."""
+        timers = []
+        if self.autoblinker:
+            timers.append(self.blinktimer)
+        if self.idle:
+            timers.append(self.idleAnimationTimer)
+        return min(timers) if timers else None
+
+    def frameDue(self):
+        """False while quiescent and no blink/idle timer is due (the frame would not change)."""
+        if not self.quiescent:
+            return True
+        due = self.nextTimer()
+        return due is not None and self.millis() >= due
+
+    def wait(self, timeout=None):
+        """
+        Sleep until update() has work to do: the next frame while animating,
+        otherwise the next blink/idle timer or a wake() from a setter.
+        timeout: upper bound in seconds (None = no bound)
+        """
+        now = self.millis()
+        if self.quiescent:
+            due = self.nextTimer()
+            delay = None if due is None else max(0, due - now) / 1000
+        else:
+            delay = max(0, self.fpsTimer + self.frameInterval - now) / 1000
+        if timeout is not None and (delay is None or delay > timeout):
+            delay = timeout
+        self._wakeEvent.wait(delay)
+        self._wakeEvent.clear()
+
+    def startPipeline(self):
+        """Render on the calling thread and transfer on a background thread."""
+        if self._pipe is None:
+            self._pipe = FramePipe(self._transfer)
+
+    def stopPipeline(self):
+        """Flush the last frame and go back to transferring inside update()."""
+        if self._pipe is not None:
+            self._pipe.stop()
+            self._pipe = None
+
+    def invalidate(self):
+        """Forget what is on the display so the next frame is sent in full."""
+        self._shadow = None
+
+    # ---------------------------
+    # Instrumentation
+    # ---------------------------
+    def stats(self):
+        """
+        Rolling frame statistics: achieved fps, bytes sent per second, late and
+        dropped frame counts and, per stage (state, render, pack, transfer and
+        the whole frame), count and mean/p50/p95/max duration in microseconds.
+        Empty stage data if the eyes were created with instrumented=False.
+        """
+        summary = self._stats.summary() if self._stats is not None else {"fps": 0.0, "bytes_per_s": 0.0, "stages": {}}
+        summary.update(late_frames=self.lateFrames, dropped_frames=self.droppedFrames,
+                       bytes_sent=self.bytesSent, quiescent=self.quiescent)
+        return summary
+
+    def statsLine(self):
+        """One-line summary of stats() for logs."""
+        s = self.stats()
+        parts = ["%.1f fps" % s["fps"]]
+        for stage, t in s["stages"].items():
+            parts.append("%s %.0f/%.0fus" % (stage, t["p50_us"], t["p95_us"]))
+        parts.append("late %d dropped %d" % (s["late_frames"], s["dropped_frames"]))
+        parts.append("%.1f kB/s" % (s["bytes_per_s"] / 1000))
+        return "RoboEyes: " + " | ".join(parts)
+
+    def setStatsLog(self, interval, log=print):
+        """Call log(statsLine()) every interval seconds while frames render (None/0 = off)."""
+        if self._stats is None:
+            self._stats = FrameStats()
+        self._statsLog = log if interval else None
+        self._statsInterval = int((interval or 0) * 1e9)
+        self._statsNextLog = _perf_ns() + self._statsInterval
+
+    def resetStats(self):
+        """Start the rolling statistics over (counters such as lateFrames are kept)."""
+        if self._stats is not None:
+            self._stats.reset()
 
     def setDisplayColors(self, background, main):
+        self.wake()
         self.BGCOLOR = background
         self.MAINCOLOR = main
 
+    def setAntialias(self, active):
+        """Anti-aliased eye and eyelid edges on 4-bit grayscale displays (SSD1327)."""
+        self.wake()
+        self.antialias = bool(active)
+        self._shadow = None
+
     def setWidth(self, leftEye, rightEye):
+        self.wake()
         self.eyeLwidthNext = leftEye
         self.eyeRwidthNext = rightEye
         self.eyeLwidthDefault = leftEye
         self.eyeRwidthDefault = rightEye
 
     def setHeight(self, leftEye, rightEye):
+        self.wake()
         self.eyeLheightNext = leftEye
         self.eyeRheightNext = rightEye
         self.eyeLheightDefault = leftEye
         self.eyeRheightDefault = rightEye
 
     def setBorderradius(self, leftEye, rightEye):
+        self.wake()
         self.eyeLborderRadiusNext = leftEye
         self.eyeRborderRadiusNext = rightEye
         self.eyeLborderRadiusDefault = leftEye
         self.eyeRborderRadiusDefault = rightEye
 
     def setSpacebetween(self, space):
+        self.wake()
         self.spaceBetweenNext = space
         self.spaceBetweenDefault = space
 
     def setMood(self, mood):
+        self.wake()
         if mood == TIRED:
             self.tired = True; self.angry = False; self.happy = False
         elif mood == ANGRY:
@@ -231,6 +774,7 @@ class RoboEyes:
             self.tired = False; self.angry = False; self.happy = False
 
     def setPosition(self, position):
+        self.wake()
         if position == N:
             self.eyeLxNext = self.getScreenConstraint_X() // 2
             self.eyeLyNext = 0
@@ -260,6 +804,7 @@ class RoboEyes:
             self.eyeLyNext = self.getScreenConstraint_Y() // 2
 
     def setAutoblinker(self, active, interval=None, variation=None):
+        self.wake()
         self.autoblinker = bool(active)
         if interval is not None:
             self.blinkInterval = interval
@@ -267,6 +812,7 @@ class RoboEyes:
             self.blinkIntervalVariation = variation
 
     def setIdleMode(self, active, interval=None, variation=None):
+        self.wake()
         self.idle = bool(active)
         if interval is not None:
             self.idleInterval = interval
@@ -274,22 +820,27 @@ class RoboEyes:
             self.idleIntervalVariation = variation
 
     def setCuriosity(self, curiousBit):
+        self.wake()
         self.curious = bool(curiousBit)
 
     def setCyclops(self, cyclopsBit):
+        self.wake()
         self.cyclops = bool(cyclopsBit)
 
     def setHFlicker(self, flickerBit, amplitude=None):
+        self.wake()
         self.hFlicker = bool(flickerBit)
         if amplitude is not None:
             self.hFlickerAmplitude = amplitude
 
     def setVFlicker(self, flickerBit, amplitude=None):
+        self.wake()
         self.vFlicker = bool(flickerBit)
         if amplitude is not None:
             self.vFlickerAmplitude = amplitude
 
     def setSweat(self, sweatBit):
+        self.wake()
         self.sweat = bool(sweatBit)
 
     def getScreenConstraint_X(self):
@@ -298,10 +849,95 @@ class RoboEyes:
     def getScreenConstraint_Y(self):
         return self.screenHeight - self.eyeLheightDefault
 
+    # ---------------------------
+    # Frame scheduler
+    # ---------------------------
+    def run(self, duration=None, callback=None, adaptive=False, min_fps=10):
+        """
+        Drive the eyes on absolute frame deadlines (no drift from late frames).
+        Sleeps until each deadline; when more than a frame behind, the missed
+        frames are advanced without rendering (counted in droppedFrames) so
+        animations keep their speed. Frames that start more than LATE_TOLERANCE
+        after their deadline are counted in lateFrames. While quiescent it
+        sleeps until the next timer or wake().
+        duration: seconds to run (None = until stop())
+        callback: called as callback(self) before every frame
+        adaptive: lower the frame rate (down to min_fps) while frames are late and
+                  raise it back to the setFramerate() target once they are on time;
+                  meant for time-based tweening, where fps does not change speed
+        """
+        onTime = 0
+        self._running = True
+        start = time.monotonic()
+        deadline = start
+        while self._running:
+            if duration is not None and time.monotonic() - start >= duration:
+                break
+            if callback is not None:
+                callback(self)
+
+            if not self.frameDue():
+                # converged: sleep until a timer or a setter, then restart the schedule
+                due = self.nextTimer()
+                delay = None if due is None else (due - self.millis()) / 1000
+                if duration is not None:
+                    left = max(0, duration - (time.monotonic() - start))
+                    delay = left if delay is None else min(delay, left)
+                self._wakeEvent.wait(delay)
+                self._wakeEvent.clear()
+                deadline = time.monotonic()
+                continue
+
+            self._sleep_until(deadline)
+            # frameInterval is re-read every frame so setFramerate() applies at once
+            period = self.frameInterval / 1000
+            behind = time.monotonic() - deadline
+            late = behind > LATE_TOLERANCE
+            if behind >= period:
+                # catch up: skip rendering of the frames whose deadlines have passed
+                # (time-based tweening catches up by itself from the elapsed time)
+                missed = int(behind // period)
+                if not self.timeBased:
+                    for _ in range(missed):
+                        self._tick(render=False)
+                self.droppedFrames += missed
+                deadline += missed * period
+                behind -= missed * period
+            if late:
+                self.lateFrames += 1
+            if adaptive:
+                onTime = 0 if late else onTime + 1
+                if late:
+                    self.frameInterval = min(int(1000 / min_fps), int(self.frameInterval * 1.25) + 1)
+                elif onTime >= ADAPTIVE_RECOVER_FRAMES and self.frameInterval > self.targetFrameInterval:
+                    self.frameInterval = max(self.targetFrameInterval, int(self.frameInterval * 0.9))
+                    onTime = 0
+            self.fpsTimer = self.millis()
+            self._tick()
+            self.framesRendered += 1
+            deadline += period
+        self._running = False
+
+    def stop(self):
+        """Make run() return after the current frame."""
+        self._running = False
+        self._wakeEvent.set()
+
+    def _sleep_until(self, deadline):
+        """
+        Sleep until a time.monotonic() deadline. One plain sleep: oversleeping
+        by a scheduler tick is absorbed by LATE_TOLERANCE, and spinning out the
+        last millisecond would cost a few percent of a core at 50 fps.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
     # ---------------------------
     # Blink / open / close
     # ---------------------------
     def close(self, left=True, right=True):
+        self.wake()
         if left:
             self.eyeLheightNext = 1
             self.eyeL_open = False
@@ -310,6 +946,7 @@ class RoboEyes:
             self.eyeR_open = False
 
     def open(self, left=True, right=True):
+        self.wake()
         if left:
             self.eyeL_open = True
         if right:
@@ -321,20 +958,98 @@ class RoboEyes:
 
     # Animations triggers
     def anim_confused(self):
+        self.wake()
         self.confused = True
 
     def anim_laugh(self):
+        self.wake()
         self.laugh = True
 
     # ---------------------------
     # Core update/draw method
     # ---------------------------
     def update(self):
+        # Converged and no timer due: nothing would change, skip render and bus traffic
+        if not self.frameDue():
+            return
+
         # Rate limit to frameInterval (ms)
-        if millis() - self.fpsTimer < self.frameInterval:
+        if self.millis() - self.fpsTimer < self.frameInterval:
+            return
+        self.fpsTimer = self.millis()
+        self._tick()
+
+    def _tick(self, render=True):
+        """Advance the animation by one frame; render and send it unless render is False."""
+        stats = self._stats
+        t0 = _perf_ns()
+        # ms since the previous frame (time-based mode); a nominal frame after a quiescent pause
+        now = self.millis()
+        if self._clip is not None and self._clip_frame(render):
+            self._lastTickMs = now
+            if render and stats is not None:
+                self._frame_done(stats, t0)
             return
-        self.fpsTimer = millis()
+        if self._lastTickMs is None or self.quiescent:
+            self._dt = self.frameInterval
+        else:
+            self._dt = now - self._lastTickMs
+        self._lastTickMs = now
+        self._advance_state()
+        if stats is not None:
+            stats.add("state", _perf_ns() - t0)
+        if render:
+            self._render_frame()
+        else:
+            # frame dropped to catch up: keep eyelids and sweat moving too
+            self._advance_overlays()
+
+        # Quiescent once a frame leaves the state untouched and nothing is animating
+        state = tuple(getattr(self, a) for a in STATE_ATTRS)
+        self.quiescent = (state == self._lastState
+                          and not (self.hFlicker or self.vFlicker or self.sweat
+                                   or self.laugh or self.confused))
+        self._lastState = state
+        if render and stats is not None:
+            self._frame_done(stats, t0)
+
+    def _frame_done(self, stats, t0):
+        """Record a rendered frame and write the periodic stats line when it is due."""
+        t1 = _perf_ns()
+        stats.frame(t0, t1 - t0, self.bytesSent)
+        if self._statsLog is not None and t1 >= self._statsNextLog:
+            self._statsNextLog = t1 + self._statsInterval
+            self._statsLog(self.statsLine())
 
+    # ---------------------------
+    # Precompiled clip playback (see roboeyes_clips.py)
+    # ---------------------------
+    def playClip(self, frames, final):
+        """
+        Stream prerendered page buffers instead of animating, one per frame,
+        then continue live from `final` (attribute name -> value).
+        """
+        self.wake()
+        self._clip = (iter(frames), final)
+
+    def _clip_frame(self, render):
+        """Present the next clip frame; False once the clip is over (state restored)."""
+        frames, final = self._clip
+        frame = next(frames, None)
+        if frame is None:
+            self._clip = None
+            for name, value in final.items():
+                setattr(self, name, value)
+            return False
+        if render:
+            if self.device:
+                self._present(frame)
+            else:
+                self._last_pages = frame
+        return True
+
+    def _advance_state(self):
+        """Tweens, timers, macro animations and flicker for one frame."""
         # CURIOUS height offset
         if self.curious:
             if self.eyeLxNext <= 10:
@@ -352,60 +1067,25 @@ class RoboEyes:
             self.eyeLheightOffset = 0
             self.eyeRheightOffset = 0
 
-        # Left eye height tween
-        self.eyeLheightCurrent = (self.eyeLheightCurrent + self.eyeLheightNext + self.eyeLheightOffset) // 2
-        # adjust vertical centering when closing/opening
-        self.eyeLy += ((self.eyeLheightDefault - self.eyeLheightCurrent) // 2)
-        self.eyeLy -= (self.eyeLheightOffset // 2)
-
-        # Right eye height tween
-        self.eyeRheightCurrent = (self.eyeRheightCurrent + self.eyeRheightNext + self.eyeRheightOffset) // 2
-        self.eyeRy += ((self.eyeRheightDefault - self.eyeRheightCurrent) // 2)
-        self.eyeRy -= (self.eyeRheightOffset // 2)
-
-        # Auto-open if previously set to open and fully closed
-        if self.eyeL_open:
-            if self.eyeLheightCurrent <= 1 + self.eyeLheightOffset:
-                self.eyeLheightNext = self.eyeLheightDefault
-        if self.eyeR_open:
-            if self.eyeRheightCurrent <= 1 + self.eyeRheightOffset:
-                self.eyeRheightNext = self.eyeRheightDefault
-
-        # widths tween
-        self.eyeLwidthCurrent = (self.eyeLwidthCurrent + self.eyeLwidthNext) // 2
-        self.eyeRwidthCurrent = (self.eyeRwidthCurrent + self.eyeRwidthNext) // 2
-
-        # space tween
-        self.spaceBetweenCurrent = (self.spaceBetweenCurrent + self.spaceBetweenNext) // 2
-
-        # positions tween
-        self.eyeLx = (self.eyeLx + self.eyeLxNext) // 2
-        self.eyeLy = (self.eyeLy + self.eyeLyNext) // 2
-
-        # Recompute right eye position from left
-        self.eyeRxNext = self.eyeLxNext + self.eyeLwidthCurrent + self.spaceBetweenCurrent
-        self.eyeRyNext = self.eyeLyNext
-        self.eyeRx = (self.eyeRx + self.eyeRxNext) // 2
-        self.eyeRy = (self.eyeRy + self.eyeRyNext) // 2
-
-        # border radius
-        self.eyeLborderRadiusCurrent = (self.eyeLborderRadiusCurrent + self.eyeLborderRadiusNext) // 2
-        self.eyeRborderRadiusCurrent = (self.eyeRborderRadiusCurrent + self.eyeRborderRadiusNext) // 2
+        if self.timeBased:
+            self._tween_timed(self._dt)
+        else:
+            self._tween_per_frame()
 
         # Autoblinker
         if self.autoblinker:
-            if millis() >= self.blinktimer:
+            if self.millis() >= self.blinktimer:
                 self.blink_once()
-                next_ms = (self.blinkInterval * 1000) + (random.randint(0, self.blinkIntervalVariation) * 1000)
-                self.blinktimer = millis() + next_ms
+                next_ms = (self.blinkInterval * 1000) + (self.random.randint(0, self.blinkIntervalVariation) * 1000)
+                self.blinktimer = self.millis() + next_ms
 
         # Laugh animation
         if self.laugh:
             if self.laughToggle:
                 self.setVFlicker(True, 5)
-                self.laughAnimationTimer = millis()
+                self.laughAnimationTimer = self.millis()
                 self.laughToggle = False
-            elif millis() >= self.laughAnimationTimer + self.laughAnimationDuration:
+            elif self.millis() >= self.laughAnimationTimer + self.laughAnimationDuration:
                 self.setVFlicker(False, 0)
                 self.laughToggle = True
                 self.laugh = False
@@ -414,23 +1094,23 @@ class RoboEyes:
         if self.confused:
             if self.confusedToggle:
                 self.setHFlicker(True, 20)
-                self.confusedAnimationTimer = millis()
+                self.confusedAnimationTimer = self.millis()
                 self.confusedToggle = False
-            elif millis() >= self.confusedAnimationTimer + self.confusedAnimationDuration:
+            elif self.millis() >= self.confusedAnimationTimer + self.confusedAnimationDuration:
                 self.setHFlicker(False, 0)
                 self.confusedToggle = True
                 self.confused = False
 
         # Idle mode random movement
         if self.idle:
-            if millis() >= self.idleAnimationTimer:
-                maxx = max(0, self.getScreenConstraint_X())
-                maxy = max(0, self.getScreenConstraint_Y())
+            if self.millis() >= self.idleAnimationTimer:
+                maxx = max(0, int(self.getScreenConstraint_X()))
+                maxy = max(0, int(self.getScreenConstraint_Y()))
                 # clamp to ints
-                self.eyeLxNext = random.randint(0 if maxx <= 0 else 0, maxx) if maxx > 0 else 0
-                self.eyeLyNext = random.randint(0 if maxy <= 0 else 0, maxy) if maxy > 0 else 0
-                next_ms = (self.idleInterval * 1000) + (random.randint(0, self.idleIntervalVariation) * 1000)
-                self.idleAnimationTimer = millis() + next_ms
+                self.eyeLxNext = self.random.randint(0 if maxx <= 0 else 0, maxx) if maxx > 0 else 0
+                self.eyeLyNext = self.random.randint(0 if maxy <= 0 else 0, maxy) if maxy > 0 else 0
+                next_ms = (self.idleInterval * 1000) + (self.random.randint(0, self.idleIntervalVariation) * 1000)
+                self.idleAnimationTimer = self.millis() + next_ms
 
         # Horizontal and vertical flicker
         if self.hFlicker:
@@ -457,14 +1137,166 @@ class RoboEyes:
             self.eyeRheightCurrent = 0
             self.spaceBetweenCurrent = 0
 
-        # Draw to PIL Image and (if device present) show on device
-        img = self.draw_frame_to_image()
+    def _tween_per_frame(self):
+        """Original tweening: halve the distance to every target once per frame."""
+        # Left eye height tween
+        self.eyeLheightCurrent = (self.eyeLheightCurrent + self.eyeLheightNext + self.eyeLheightOffset) // 2
+        # adjust vertical centering when closing/opening
+        self.eyeLy += ((self.eyeLheightDefault - self.eyeLheightCurrent) // 2)
+        self.eyeLy -= (self.eyeLheightOffset // 2)
+
+        # Right eye height tween
+        self.eyeRheightCurrent = (self.eyeRheightCurrent + self.eyeRheightNext + self.eyeRheightOffset) // 2
+        self.eyeRy += ((self.eyeRheightDefault - self.eyeRheightCurrent) // 2)
+        self.eyeRy -= (self.eyeRheightOffset // 2)
+
+        # Auto-open if previously set to open and fully closed
+        if self.eyeL_open:
+            if self.eyeLheightCurrent <= 1 + self.eyeLheightOffset:
+                self.eyeLheightNext = self.eyeLheightDefault
+        if self.eyeR_open:
+            if self.eyeRheightCurrent <= 1 + self.eyeRheightOffset:
+                self.eyeRheightNext = self.eyeRheightDefault
+
+        # widths tween
+        self.eyeLwidthCurrent = (self.eyeLwidthCurrent + self.eyeLwidthNext) // 2
+        self.eyeRwidthCurrent = (self.eyeRwidthCurrent + self.eyeRwidthNext) // 2
+
+        # space tween
+        self.spaceBetweenCurrent = (self.spaceBetweenCurrent + self.spaceBetweenNext) // 2
+
+        # positions tween
+        self.eyeLx = (self.eyeLx + self.eyeLxNext) // 2
+        self.eyeLy = (self.eyeLy + self.eyeLyNext) // 2
+
+        # Recompute right eye position from left
+        self.eyeRxNext = self.eyeLxNext + self.eyeLwidthCurrent + self.spaceBetweenCurrent
+        self.eyeRyNext = self.eyeLyNext
+        self.eyeRx = (self.eyeRx + self.eyeRxNext) // 2
+        self.eyeRy = (self.eyeRy + self.eyeRyNext) // 2
+
+        # border radius
+        self.eyeLborderRadiusCurrent = (self.eyeLborderRadiusCurrent + self.eyeLborderRadiusNext) // 2
+        self.eyeRborderRadiusCurrent = (self.eyeRborderRadiusCurrent + self.eyeRborderRadiusNext) // 2
+
+    def _tween_timed(self, dt):
+        """
+        Time-based tweening: the distance to every target halves every
+        1/tweenRate seconds whatever the frame rate (same feel as the per-frame
+        tween at tweenRate fps). Values are floats and snap onto the target
+        once they are within half a pixel.
+        """
+        k = 1 - 0.5 ** (dt * self.tweenRate / 1000)
+
+        def approach(current, target):
+            return _approach(current, target, k)
+
+        # heights (the per-frame tween adds the centering shift to y every frame,
+        # i.e. y settles on yNext + shift; here the shift is part of the target)
+        self.eyeLheightCurrent = approach(self.eyeLheightCurrent, self.eyeLheightNext + self.eyeLheightOffset)
+        self.eyeRheightCurrent = approach(self.eyeRheightCurrent, self.eyeRheightNext + self.eyeRheightOffset)
+        shiftL = (self.eyeLheightDefault - self.eyeLheightCurrent) // 2 - self.eyeLheightOffset // 2
+        shiftR = (self.eyeRheightDefault - self.eyeRheightCurrent) // 2 - self.eyeRheightOffset // 2
+
+        # Auto-open if previously set to open and fully closed
+        if self.eyeL_open:
+            if self.eyeLheightCurrent <= 1 + self.eyeLheightOffset:
+                self.eyeLheightNext = self.eyeLheightDefault
+        if self.eyeR_open:
+            if self.eyeRheightCurrent <= 1 + self.eyeRheightOffset:
+                self.eyeRheightNext = self.eyeRheightDefault
+
+        # widths, space
+        self.eyeLwidthCurrent = approach(self.eyeLwidthCurrent, self.eyeLwidthNext)
+        self.eyeRwidthCurrent = approach(self.eyeRwidthCurrent, self.eyeRwidthNext)
+        self.spaceBetweenCurrent = approach(self.spaceBetweenCurrent, self.spaceBetweenNext)
+
+        # positions
+        self.eyeLx = approach(self.eyeLx, self.eyeLxNext)
+        self.eyeLy = approach(self.eyeLy, self.eyeLyNext + shiftL)
+        self.eyeRxNext = self.eyeLxNext + self.eyeLwidthCurrent + self.spaceBetweenCurrent
+        self.eyeRyNext = self.eyeLyNext
+        self.eyeRx = approach(self.eyeRx, self.eyeRxNext)
+        self.eyeRy = approach(self.eyeRy, self.eyeRyNext + shiftR)
+
+        # border radius
+        self.eyeLborderRadiusCurrent = approach(self.eyeLborderRadiusCurrent, self.eyeLborderRadiusNext)
+        self.eyeRborderRadiusCurrent = approach(self.eyeRborderRadiusCurrent, self.eyeRborderRadiusNext)
+
+    def _render_frame(self):
+        """Render the current state with the selected backend and present it."""
+        stats = self._stats
+        t0 = _perf_ns()
+        # 4-bit grayscale display: 'L' render packed to nibbles, no convert('1')
+        if self.device and self._gray_device():
+            self._advance_overlays()
+            img = self._render_gray(self._display_list())
+            if stats is not None:
+                stats.add("render", _perf_ns() - t0)
+            self._present(self._image_to_nibbles(img))
+        # NumPy backend: page bytes straight to the device, no PIL image
+        elif self.backend == "numpy" and (not self.device or self._windowed_device()):
+            self._advance_overlays()
+            buf = self._render_pages(self._display_list())
+            if stats is not None:
+                stats.add("render", _perf_ns() - t0)
+            if self.device:
+                self._present(buf)
+            else:
+                self._last_pages = buf
+        else:
+            img = self.draw_frame_to_image()
+            if stats is not None:
+                stats.add("render", _perf_ns() - t0)
+            if self.device and self._windowed_device():
+                # packing is render work: do it here, not on the transfer thread
+                self._present(self._image_to_pages(img))
+            elif self.device:
+                self._present(img)
+            else:
+                # No device provided — user can use returned image (or save it)
+                self._last_image = img
+
+    def _present(self, frame):
+        """Hand a finished frame to the frame sink or the transfer thread, or send it right away."""
+        if self.frameSink is not None:
+            self.frameSink(frame)
+        elif self._pipe is not None:
+            self._pipe.put(frame)
+        else:
+            self._transfer(frame)
+
+    def transferFrame(self, frame):
+        """Send a frame handed to frameSink to the display."""
+        self._transfer(frame)
+
+    def _transfer(self, frame):
+        """Send a frame: page/nibble bytes go out windowed, PIL images through the device API."""
+        if isinstance(frame, (bytes, bytearray)):
+            if self._gray_device():
+                self._send_rows(frame)
+            else:
+                self._send_pages(frame)
+        else:
+            self._show_image(frame)
+
+    def _show_image(self, img):
+        """Send a rendered PIL image to the device (or keep it if there is none)."""
         if self.device:
+            if self._windowed_device():
+                # pack to SSD1306 pages and only send what changed since the last frame
+                self._send_pages(self._image_to_pages(img))
             # luma device expects mode '1' image for monochrome displays
             # Convert if necessary
-            if hasattr(self.device, "display"):
+            elif hasattr(self.device, "display"):
                 # device.display expects a bitmap; convert to '1' for safety
-                self.device.display(img.convert("1"))
+                t0 = _perf_ns()
+                img = img.convert("1")
+                t1 = _perf_ns()
+                self.device.display(img)
+                if self._stats is not None:
+                    self._stats.add("pack", t1 - t0)
+                    self._stats.add("transfer", _perf_ns() - t1)
             else:
                 # unknown device API: try draw directly
                 try:
@@ -477,34 +1309,11 @@ class RoboEyes:
 
     def draw_frame_to_image(self):
         """Return a PIL Image of the current frame (does not send to device)."""
-        mode = "1" if self.monochrome else "L"
-        bg = 0 if self.monochrome else 0
-        main = 1 if self.monochrome else 255
-        img = Image.new(mode, (self.screenWidth, self.screenHeight), color=bg)
-        draw = ImageDraw.Draw(img)
-
-        # Draw background (already filled)
-
-        # Draw left eye as rounded rect (center vertically adjusted)
-        el_x = int(self.eyeLx)
-        el_w = int(self.eyeLwidthCurrent)
-        el_h = max(1, int(self.eyeLheightCurrent))
-        # vertical centering: adjust top to center the current height inside default eye height
-        el_y = int(self.eyeLy + ((self.eyeLheightDefault - el_h) / 2))
-
-        # If width or height could be zero (e.g., cyclops right eye), handle gracefully.
-        if el_w > 0 and el_h > 0:
-            self._fill_round_rect(draw, el_x, el_y, el_w, el_h, int(self.eyeLborderRadiusCurrent), main)
-
-        # Right eye
-        er_x = int(self.eyeRx)
-        er_w = int(self.eyeRwidthCurrent)
-        er_h = max(0, int(self.eyeRheightCurrent))
-        er_y = int(self.eyeRy + ((self.eyeRheightDefault - er_h) / 2))
-
-        if not self.cyclops and er_w > 0 and er_h > 0:
-            self._fill_round_rect(draw, er_x, er_y, er_w, er_h, int(self.eyeRborderRadiusCurrent), main)
+        self._advance_overlays()
+        return self._render_image(self._display_list())
 
+    def _advance_overlays(self):
+        """Advance the eyelid transitions and sweat drops by one frame."""
         # Mood transitions: prepare tired/angry/happy states (eyelids)
         # Tired top eyelids
         if self.tired:
@@ -525,142 +1334,334 @@ class RoboEyes:
             self.eyelidsHappyBottomOffsetNext = 0
 
         # Animated transitions (averaging)
-        self.eyelidsTiredHeight = (self.eyelidsTiredHeight + self.eyelidsTiredHeightNext) // 2
-        self.eyelidsAngryHeight = (self.eyelidsAngryHeight + self.eyelidsAngryHeightNext) // 2
-        self.eyelidsHappyBottomOffset = (self.eyelidsHappyBottomOffset + self.eyelidsHappyBottomOffsetNext) // 2
+        if self.timeBased:
+            k = 1 - 0.5 ** (self._dt * self.tweenRate / 1000)
+            self.eyelidsTiredHeight = _approach(self.eyelidsTiredHeight, self.eyelidsTiredHeightNext, k)
+            self.eyelidsAngryHeight = _approach(self.eyelidsAngryHeight, self.eyelidsAngryHeightNext, k)
+            self.eyelidsHappyBottomOffset = _approach(self.eyelidsHappyBottomOffset, self.eyelidsHappyBottomOffsetNext, k)
+        else:
+            self.eyelidsTiredHeight = (self.eyelidsTiredHeight + self.eyelidsTiredHeightNext) // 2
+            self.eyelidsAngryHeight = (self.eyelidsAngryHeight + self.eyelidsAngryHeightNext) // 2
+            self.eyelidsHappyBottomOffset = (self.eyelidsHappyBottomOffset + self.eyelidsHappyBottomOffsetNext) // 2
+
+        # Sweat drops (steps are per frame at tweenRate fps; scaled by elapsed time in time-based mode)
+        if self.sweat:
+            f = self._dt * self.tweenRate / 1000 if self.timeBased else 1
+            # drop 1 (left)
+            if self.sweat1YPos <= self.sweat1YPosMax:
+                self.sweat1YPos += 0.5 * f
+            else:
+                self.sweat1XPosInitial = self.random.randint(0, 30)
+                self.sweat1YPos = 2
+                self.sweat1YPosMax = self.random.randint(10, 20)
+                self.sweat1Width = 1.0
+                self.sweat1Height = 2.0
+            if self.sweat1YPos <= self.sweat1YPosMax / 2:
+                self.sweat1Width += 0.5 * f
+                self.sweat1Height += 0.5 * f
+            else:
+                self.sweat1Width = max(1.0, self.sweat1Width - 0.1 * f)
+                self.sweat1Height = max(1.0, self.sweat1Height - 0.5 * f)
+            self.sweat1XPos = int(self.sweat1XPosInitial - (self.sweat1Width / 2))
+
+            # drop 2 (center area)
+            if self.sweat2YPos <= self.sweat2YPosMax:
+                self.sweat2YPos += 0.5 * f
+            else:
+                self.sweat2XPosInitial = self.random.randint(30, max(30, self.screenWidth - 30))
+                self.sweat2YPos = 2
+                self.sweat2YPosMax = self.random.randint(10, 20)
+                self.sweat2Width = 1.0
+                self.sweat2Height = 2.0
+            if self.sweat2YPos <= self.sweat2YPosMax / 2:
+                self.sweat2Width += 0.5 * f
+                self.sweat2Height += 0.5 * f
+            else:
+                self.sweat2Width = max(1.0, self.sweat2Width - 0.1 * f)
+                self.sweat2Height = max(1.0, self.sweat2Height - 0.5 * f)
+            self.sweat2XPos = int(self.sweat2XPosInitial - (self.sweat2Width / 2))
+
+            # drop 3 (right)
+            if self.sweat3YPos <= self.sweat3YPosMax:
+                self.sweat3YPos += 0.5 * f
+            else:
+                self.sweat3XPosInitial = (self.screenWidth - 30) + self.random.randint(0, 30)
+                self.sweat3YPos = 2
+                self.sweat3YPosMax = self.random.randint(10, 20)
+                self.sweat3Width = 1.0
+                self.sweat3Height = 2.0
+            if self.sweat3YPos <= self.sweat3YPosMax / 2:
+                self.sweat3Width += 0.5 * f
+                self.sweat3Height += 0.5 * f
+            else:
+                self.sweat3Width = max(1.0, self.sweat3Width - 0.1 * f)
+                self.sweat3Height = max(1.0, self.sweat3Height - 0.5 * f)
+            self.sweat3XPos = int(self.sweat3XPosInitial - (self.sweat3Width / 2))
+
+    def _display_list(self):
+        """
+        Describe the current frame as a list of drawing operations
+        ("rrect", x, y, w, h, r, color) / ("tri", p1, p2, p3, color),
+        painted in order onto a cleared screen by one of the render backends.
+        """
+        main = 1 if self.monochrome else 255
+        ops = []
+
+        # Draw left eye as rounded rect (center vertically adjusted)
+        el_x = int(self.eyeLx)
+        el_w = int(self.eyeLwidthCurrent)
+        el_h = max(1, int(self.eyeLheightCurrent))
+        # vertical centering: adjust top to center the current height inside default eye height
+        el_y = int(self.eyeLy + ((self.eyeLheightDefault - el_h) / 2))
+
+        # If width or height could be zero (e.g., cyclops right eye), handle gracefully.
+        if el_w > 0 and el_h > 0:
+            ops.append(("rrect", el_x, el_y, el_w, el_h, int(self.eyeLborderRadiusCurrent), main))
+
+        # Right eye
+        er_x = int(self.eyeRx)
+        er_w = int(self.eyeRwidthCurrent)
+        er_h = max(0, int(self.eyeRheightCurrent))
+        er_y = int(self.eyeRy + ((self.eyeRheightDefault - er_h) / 2))
+
+        if not self.cyclops and er_w > 0 and er_h > 0:
+            ops.append(("rrect", er_x, er_y, er_w, er_h, int(self.eyeRborderRadiusCurrent), main))
 
         # Draw tired top eyelids (shape: triangle)
         t = int(self.eyelidsTiredHeight)
         if t > 0:
             # left
-            self._fill_triangle(draw,
-                                (el_x, el_y - 1),
-                                (el_x + el_w, el_y - 1),
-                                (el_x, el_y + t - 1),
-                                self.BGCOLOR if self.monochrome else 0)
+            ops.append(("tri",
+                        (el_x, el_y - 1),
+                        (el_x + el_w, el_y - 1),
+                        (el_x, el_y + t - 1),
+                        self.BGCOLOR if self.monochrome else 0))
             # right (if not cyclops)
             if not self.cyclops and er_w > 0 and er_h > 0:
-                self._fill_triangle(draw,
-                                    (er_x, er_y - 1),
-                                    (er_x + er_w, er_y - 1),
-                                    (er_x + er_w, er_y + t - 1),
-                                    self.BGCOLOR if self.monochrome else 0)
+                ops.append(("tri",
+                            (er_x, er_y - 1),
+                            (er_x + er_w, er_y - 1),
+                            (er_x + er_w, er_y + t - 1),
+                            self.BGCOLOR if self.monochrome else 0))
             else:
                 # cyclops covers split top eyelid halves
                 if self.cyclops:
                     half = el_w // 2
-                    self._fill_triangle(draw, (el_x, el_y - 1), (el_x + half, el_y - 1), (el_x, el_y + t - 1), self.BGCOLOR)
-                    self._fill_triangle(draw, (el_x + half, el_y - 1), (el_x + el_w, el_y - 1), (el_x + el_w, el_y + t - 1), self.BGCOLOR)
+                    ops.append(("tri", (el_x, el_y - 1), (el_x + half, el_y - 1), (el_x, el_y + t - 1), self.BGCOLOR))
+                    ops.append(("tri", (el_x + half, el_y - 1), (el_x + el_w, el_y - 1), (el_x + el_w, el_y + t - 1), self.BGCOLOR))
 
         # Draw angry top eyelids
         a = int(self.eyelidsAngryHeight)
         if a > 0:
             if not self.cyclops and er_w > 0 and er_h > 0:
                 # left angry triangle (flipped orientation)
-                self._fill_triangle(draw,
-                                    (el_x, el_y - 1),
-                                    (el_x + el_w, el_y - 1),
-                                    (el_x + el_w, el_y + a - 1),
-                                    self.BGCOLOR if self.monochrome else 0)
+                ops.append(("tri",
+                            (el_x, el_y - 1),
+                            (el_x + el_w, el_y - 1),
+                            (el_x + el_w, el_y + a - 1),
+                            self.BGCOLOR if self.monochrome else 0))
                 # right angry triangle reversed
-                self._fill_triangle(draw,
-                                    (er_x, er_y - 1),
-                                    (er_x + er_w, er_y - 1),
-                                    (er_x, er_y + a - 1),
-                                    self.BGCOLOR if self.monochrome else 0)
+                ops.append(("tri",
+                            (er_x, er_y - 1),
+                            (er_x + er_w, er_y - 1),
+                            (er_x, er_y + a - 1),
+                            self.BGCOLOR if self.monochrome else 0))
             else:
                 # cyclops split
                 half = el_w // 2
-                self._fill_triangle(draw, (el_x, el_y - 1), (el_x + half, el_y - 1), (el_x + half, el_y + a - 1), self.BGCOLOR)
-                self._fill_triangle(draw, (el_x + half, el_y - 1), (el_x + el_w, el_y - 1), (el_x + half, el_y + a - 1), self.BGCOLOR)
+                ops.append(("tri", (el_x, el_y - 1), (el_x + half, el_y - 1), (el_x + half, el_y + a - 1), self.BGCOLOR))
+                ops.append(("tri", (el_x + half, el_y - 1), (el_x + el_w, el_y - 1), (el_x + half, el_y + a - 1), self.BGCOLOR))
 
         # Draw happy bottom eyelids - rounded rect under eye
         hb = int(self.eyelidsHappyBottomOffset)
         if hb > 0:
-            self._fill_round_rect(draw, el_x - 1, (el_y + el_h) - hb + 1, el_w + 2, self.eyeLheightDefault, int(self.eyeLborderRadiusCurrent), self.BGCOLOR)
+            ops.append(("rrect", el_x - 1, (el_y + el_h) - hb + 1, el_w + 2, self.eyeLheightDefault, int(self.eyeLborderRadiusCurrent), self.BGCOLOR))
             if not self.cyclops and er_w > 0 and er_h > 0:
-                self._fill_round_rect(draw, er_x - 1, (er_y + er_h) - hb + 1, er_w + 2, self.eyeRheightDefault, int(self.eyeRborderRadiusCurrent), self.BGCOLOR)
+                ops.append(("rrect", er_x - 1, (er_y + er_h) - hb + 1, er_w + 2, self.eyeRheightDefault, int(self.eyeRborderRadiusCurrent), self.BGCOLOR))
 
         # Draw sweat drops
         if self.sweat:
-            # drop 1 (left)
-            if self.sweat1YPos <= self.sweat1YPosMax:
-                self.sweat1YPos += 0.5
-            else:
-                self.sweat1XPosInitial = random.randint(0, 30)
-                self.sweat1YPos = 2
-                self.sweat1YPosMax = random.randint(10, 20)
-                self.sweat1Width = 1.0
-                self.sweat1Height = 2.0
-            if self.sweat1YPos <= self.sweat1YPosMax / 2:
-                self.sweat1Width += 0.5
-                self.sweat1Height += 0.5
-            else:
-                self.sweat1Width = max(1.0, self.sweat1Width - 0.1)
-                self.sweat1Height = max(1.0, self.sweat1Height - 0.5)
-            self.sweat1XPos = int(self.sweat1XPosInitial - (self.sweat1Width / 2))
-            self._fill_round_rect(draw, self.sweat1XPos, int(self.sweat1YPos), max(1, int(self.sweat1Width)), max(1, int(self.sweat1Height)), self.sweatBorderradius, self.MAINCOLOR)
+            ops.append(("rrect", self.sweat1XPos, int(self.sweat1YPos), max(1, int(self.sweat1Width)), max(1, int(self.sweat1Height)), self.sweatBorderradius, self.MAINCOLOR))
+            ops.append(("rrect", self.sweat2XPos, int(self.sweat2YPos), max(1, int(self.sweat2Width)), max(1, int(self.sweat2Height)), self.sweatBorderradius, self.MAINCOLOR))
+            ops.append(("rrect", self.sweat3XPos, int(self.sweat3YPos), max(1, int(self.sweat3Width)), max(1, int(self.sweat3Height)), self.sweatBorderradius, self.MAINCOLOR))
 
-            # drop 2 (center area)
-            if self.sweat2YPos <= self.sweat2YPosMax:
-                self.sweat2YPos += 0.5
-            else:
-                self.sweat2XPosInitial = random.randint(30, max(30, self.screenWidth - 30))
-                self.sweat2YPos = 2
-                self.sweat2YPosMax = random.randint(10, 20)
-                self.sweat2Width = 1.0
-                self.sweat2Height = 2.0
-            if self.sweat2YPos <= self.sweat2YPosMax / 2:
-                self.sweat2Width += 0.5
-                self.sweat2Height += 0.5
-            else:
-                self.sweat2Width = max(1.0, self.sweat2Width - 0.1)
-                self.sweat2Height = max(1.0, self.sweat2Height - 0.5)
-            self.sweat2XPos = int(self.sweat2XPosInitial - (self.sweat2Width / 2))
-            self._fill_round_rect(draw, self.sweat2XPos, int(self.sweat2YPos), max(1, int(self.sweat2Width)), max(1, int(self.sweat2Height)), self.sweatBorderradius, self.MAINCOLOR)
+        return ops
 
-            # drop 3 (right)
-            if self.sweat3YPos <= self.sweat3YPosMax:
-                self.sweat3YPos += 0.5
+    # ---------------------------
+    # Render backends
+    # ---------------------------
+    def _render_image(self, ops):
+        """PIL backend: paint the display list into a new Image."""
+        mode = "1" if self.monochrome else "L"
+        img = Image.new(mode, (self.screenWidth, self.screenHeight), color=0)
+        for op in ops:
+            if op[0] == "rrect":
+                self._fill_round_rect(img, *op[1:])
             else:
-                self.sweat3XPosInitial = (self.screenWidth - 30) + random.randint(0, 30)
-                self.sweat3YPos = 2
-                self.sweat3YPosMax = random.randint(10, 20)
-                self.sweat3Width = 1.0
-                self.sweat3Height = 2.0
-            if self.sweat3YPos <= self.sweat3YPosMax / 2:
-                self.sweat3Width += 0.5
-                self.sweat3Height += 0.5
+                self._fill_triangle(img, *op[1:])
+        return img
+
+    def _render_pages(self, ops):
+        """
+        NumPy backend: rasterize the display list as boolean masks into a
+        preallocated canvas and pack it straight into the SSD1306 page buffer
+        (no PIL objects per frame). Edges may differ from Pillow by a pixel.
+        """
+        canvas = self._canvas
+        canvas.fill(False)
+        for op in ops:
+            if op[0] == "rrect":
+                x, y, w, h, r, color = op[1:]
+                if w <= 0 or h <= 0:
+                    continue
+                self._blit_mask(canvas, _round_rect_mask(int(w), int(h), max(0, int(r))), int(x), int(y), color)
             else:
-                self.sweat3Width = max(1.0, self.sweat3Width - 0.1)
-                self.sweat3Height = max(1.0, self.sweat3Height - 0.5)
-            self.sweat3XPos = int(self.sweat3XPosInitial - (self.sweat3Width / 2))
-            self._fill_round_rect(draw, self.sweat3XPos, int(self.sweat3YPos), max(1, int(self.sweat3Width)), max(1, int(self.sweat3Height)), self.sweatBorderradius, self.MAINCOLOR)
+                p1, p2, p3, color = op[1:]
+                pts = [(int(p[0]), int(p[1])) for p in (p1, p2, p3)]
+                x0 = min(p[0] for p in pts)
+                y0 = min(p[1] for p in pts)
+                mask = _triangle_mask(tuple((px - x0, py - y0) for px, py in pts))
+                self._blit_mask(canvas, mask, x0, y0, color)
+        # rows 8p..8p+7 of the canvas become bits 0..7 of page p
+        np.matmul(_PAGE_BITS, canvas.view(np.uint8).reshape(-1, 8, self.screenWidth), out=self._pagesArray)
+        return self._pageBuffer
+
+    def _blit_mask(self, canvas, mask, x, y, color):
+        """Set (color != 0) or clear the pixels of a mask placed at (x, y), clipped to the screen."""
+        h, w = mask.shape
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.screenWidth, x + w), min(self.screenHeight, y + h)
+        if x0 >= x1 or y0 >= y1:
+            return
+        m = mask[y0 - y:y1 - y, x0 - x:x1 - x]
+        region = canvas[y0:y1, x0:x1]
+        if color:
+            region |= m
+        else:
+            region &= ~m
 
+    # ---------------------------
+    # Partial display updates
+    # ---------------------------
+    def _windowed_device(self):
+        """True if the device takes raw SSD1306 commands/data (luma ssd1306, no rotation)."""
+        dev = self.device
+        return (self.partialUpdate
+                and getattr(dev, "mode", None) == "1"
+                and getattr(dev, "rotate", 0) == 0
+                and hasattr(dev, "command") and hasattr(dev, "data"))
+
+    def _gray_device(self):
+        """True for 4-bit grayscale SSD1327 devices (luma ssd1327, or command/data devices in mode 'L')."""
+        dev = self.device
+        return (self.partialUpdate
+                and getattr(dev, "rotate", 0) == 0
+                and hasattr(dev, "command") and hasattr(dev, "data")
+                and ((ssd1327 is not None and isinstance(dev, ssd1327))
+                     or getattr(dev, "mode", None) == "L"))
+
+    def _render_gray(self, ops):
+        """Paint the display list into an 'L' image, with anti-aliased sprites if enabled."""
+        img = Image.new("L", (self.screenWidth, self.screenHeight), color=0)
+        scale = 255 if self.monochrome else 1
+        if not self.antialias:
+            for op in ops:
+                if op[0] == "rrect":
+                    self._fill_round_rect(img, *op[1:-1], op[-1] * scale)
+                else:
+                    self._fill_triangle(img, *op[1:-1], op[-1] * scale)
+            return img
+        for op in ops:
+            if op[0] == "rrect":
+                _, x, y, w, h, r, color = op
+                if w > 0 and h > 0:
+                    img.paste(color * scale, (int(x), int(y)),
+                              _round_rect_sprite_aa(int(w), int(h), max(0, int(r))))
+            else:
+                pts = [(int(px), int(py)) for px, py in op[1:4]]
+                x0 = min(p[0] for p in pts)
+                y0 = min(p[1] for p in pts)
+                img.paste(op[4] * scale, (x0, y0),
+                          _triangle_sprite_aa(tuple((px - x0, py - y0) for px, py in pts)))
         return img
 
+    def _image_to_nibbles(self, img):
+        """Pack an 'L' image into SSD1327 GDDRAM order: 2 pixels per byte, even pixel in the low nibble."""
+        t0 = _perf_ns()
+        raw = img.tobytes()
+        low = raw[0::2].translate(_NIBBLE_LOW)
+        high = raw[1::2].translate(_NIBBLE_HIGH)
+        # OR the two halves in one go as big integers
+        buf = (int.from_bytes(low, "big") | int.from_bytes(high, "big")).to_bytes(len(low), "big")
+        if self._stats is not None:
+            self._stats.add("pack", _perf_ns() - t0)
+        return buf
+
+    def _image_to_pages(self, img):
+        """Pack a PIL image into SSD1306 page order (8 rows per byte, LSB = top row)."""
+        t0 = _perf_ns()
+        buf = pack_pages(img, self.screenWidth, self.screenHeight)
+        if self._stats is not None:
+            self._stats.add("pack", _perf_ns() - t0)
+        return buf
+
+    def _dirty_windows(self, buf):
+        """Return a list of (page0, page1, col0, col1) windows that differ from the shadow."""
+        return diff_windows(buf, self._shadow, self.screenWidth, self.screenHeight // 8)
+
+    def _send_pages(self, buf):
+        """Send only the changed windows of a page buffer to the device."""
+        t0 = _perf_ns()
+        dev = self.device
+        w = self.screenWidth
+        colstart = getattr(dev, "_colstart", 0)
+        for p0, p1, x0, x1 in self._dirty_windows(buf):
+            dev.command(SSD1306_COLUMNADDR, colstart + x0, colstart + x1,
+                        SSD1306_PAGEADDR, p0, p1)
+            data = []
+            for p in range(p0, p1 + 1):
+                data.extend(buf[p * w + x0:p * w + x1 + 1])
+            dev.data(data)
+            self.bytesSent += len(data)
+            self.windowsSent += 1
+        # copy: the numpy backend reuses its page buffer
+        self._shadow = bytes(buf)
+        if self._stats is not None:
+            self._stats.add("transfer", _perf_ns() - t0)
+
+    def _send_rows(self, buf):
+        """Send only the changed rows (column spans) of a nibble buffer to an SSD1327."""
+        t0 = _perf_ns()
+        dev = self.device
+        stride = self.screenWidth // 2
+        for r0, r1, c0, c1 in diff_windows(buf, self._shadow, stride, self.screenHeight):
+            dev.command(SSD1327_COLUMNADDR, c0, c1, SSD1327_ROWADDR, r0, r1)
+            data = []
+            for r in range(r0, r1 + 1):
+                data.extend(buf[r * stride + c0:r * stride + c1 + 1])
+            dev.data(data)
+            self.bytesSent += len(data)
+            self.windowsSent += 1
+        self._shadow = bytes(buf)
+        if self._stats is not None:
+            self._stats.add("transfer", _perf_ns() - t0)
+
     # ---------------------------
     # Low-level drawing helpers
     # ---------------------------
-    def _fill_round_rect(self, draw: ImageDraw.ImageDraw, x, y, w, h, r, color):
-        """Rounded rectangle (fills). Uses ImageDraw.rounded_rectangle."""
+    def _fill_round_rect(self, img, x, y, w, h, r, color):
+        """Rounded rectangle (fills), blitted from the sprite cache."""
         if w <= 0 or h <= 0:
             return
-        # bounding box: left, top, right, bottom
-        left = int(x)
-        top = int(y)
-        right = int(x + w - 1)
-        bottom = int(y + h - 1)
-        try:
-            draw.rounded_rectangle([left, top, right, bottom], radius=max(0, int(r)), fill=color)
-        except Exception:
-            # fallback: draw rectangle (older Pillow versions)
-            draw.rectangle([left, top, right, bottom], fill=color)
-
-    def _fill_triangle(self, draw: ImageDraw.ImageDraw, p1, p2, p3, color):
-        """Fill triangle by polygon."""
+        img.paste(color, (int(x), int(y)), _round_rect_sprite(int(w), int(h), max(0, int(r))))
+
+    def _fill_triangle(self, img, p1, p2, p3, color):
+        """
+        Filled triangle, drawn in place: Pillow's polygon edges depend on where
+        the triangle sits, so a pasted sprite would differ by a pixel at times.
+        """
         pts = [(int(p1[0]), int(p1[1])), (int(p2[0]), int(p2[1])), (int(p3[0]), int(p3[1]))]
-        draw.polygon(pts, fill=color)
+        ImageDraw.Draw(img).polygon(pts, fill=color)
 
 
 # ---------------------------
@@ -689,26 +1690,37 @@ if __name__ == "__main__":
     eyes.setCyclops(False)
     eyes.setSweat(False)
 
-    # Demo loop that randomly triggers animations and moods
-    try:
+    # Demo thread that randomly triggers animations and moods
+    # (one roll every 250 ms; same odds as the old per-5 ms roll).
+    # Setters wake the eyes, so run() can sleep while they are converged.
+    def demo():
         while True:
-            eyes.update()
-            # Randomly trigger some actions
+            time.sleep(0.25)
             r = random.random()
-            if r < 0.003:
+            if r < 0.15:
                 eyes.anim_confused()
-            elif r < 0.006:
+            elif r < 0.3:
                 eyes.anim_laugh()
-            elif r < 0.01:
+            elif r < 0.5:
                 eyes.setMood(TIRED)
-            elif r < 0.012:
+            elif r < 0.6:
                 eyes.setMood(ANGRY)
-            elif r < 0.014:
+            elif r < 0.7:
                 eyes.setMood(HAPPY)
-            elif r < 0.016:
+            elif r < 0.8:
                 eyes.setMood(DEFAULT)
-            #elif r < 0.02:
+            #elif r < 1.0:
                 #eyes.setSweat(not eyes.sweat)
-            time.sleep(0.005)  # small sleep to yield
+
+    threading.Thread(target=demo, daemon=True).start()
+
+    # per-stage timings, fps and bus rate every 10 s
+    eyes.setStatsLog(10)
+
+    try:
+        # frame deadlines are kept by run(); late/dropped frames are counted
+        eyes.run()
     except KeyboardInterrupt:
         print("Exit")
+        print("frames: %d rendered, %d late, %d dropped" % (eyes.framesRendered, eyes.lateFrames, eyes.droppedFrames))
+        print(eyes.statsLine())
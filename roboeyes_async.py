@@ -0,0 +1,256 @@
+# roboeyes_async.py
+"""
+asyncio driver for RoboEyes, so the face can share one event loop with
+sensor readers, a buzzer and so on instead of running its own blocking loop.
+
+    face = AsyncRoboEyes(RoboEyes(device=device, monochrome=True))
+
+    async def main():
+        asyncio.create_task(face.run())
+        await face.setMood(HAPPY)     # returns once the change is on the display
+
+    asyncio.run(main())
+
+run() renders on the event loop and sends every frame to the display on a
+worker thread (the only part that blocks), keeping frame deadlines like
+RoboEyes.run(). While the eyes are converged it awaits the next blink/idle
+timer or a setter, so an idle face costs no wakeups. The latency from a
+setter to the frame showing it on the display is recorded as the "wake"
+stage of eyes.stats().
+"""
+
+import asyncio
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import roboeyes
+from roboeyes import RoboEyes, DEFAULT, TIRED, ANGRY, HAPPY, _perf_ns
+
+# RoboEyes methods that get an awaitable twin on AsyncRoboEyes
+ASYNC_SETTERS = (
+    "setMood", "setPosition", "setAutoblinker", "setIdleMode", "setCuriosity", "setCyclops",
+    "setHFlicker", "setVFlicker", "setSweat", "setWidth", "setHeight", "setBorderradius",
+    "setSpacebetween", "setDisplayColors", "setFramerate",
+    "close", "open", "blink_once", "anim_confused", "anim_laugh",
+)
+
+
+class AsyncRoboEyes:
+    """Awaitable frame loop and setters for one RoboEyes."""
+
+    def __init__(self, eyes, executor=None):
+        """
+        eyes: the RoboEyes to drive
+        executor: where bus writes run (default: one worker thread of its own,
+        started by run() and shut down when it returns)
+        """
+        self.eyes = eyes
+        self._executor = executor
+        self._ownExecutor = executor is None
+        self._loop = None
+        self._loopThread = None
+        self._wake = None
+        self._running = False
+        self._ticking = False
+        self._frame = None
+        # perf_counter_ns() of the first setter not yet on the display, and
+        # futures of the setters waiting for that frame
+        self._wakeNs = None
+        self._waiters = []
+        eyes.onWake = self._on_wake
+
+    # ---------------------------
+    # Frame loop
+    # ---------------------------
+    async def run(self, duration=None):
+        """
+        Animate until duration (s) or stop(), on absolute frame deadlines: late
+        frames are counted in eyes.lateFrames, frames more than a period behind
+        are advanced without rendering (eyes.droppedFrames).
+        """
+        eyes = self.eyes
+        loop = self._loop = asyncio.get_running_loop()
+        self._loopThread = threading.get_ident()
+        self._wake = asyncio.Event()
+        sink, eyes.frameSink = eyes.frameSink, self.put
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="roboeyes-bus")
+        self._running = True
+        start = deadline = loop.time()
+        transfer = None
+        try:
+            while self._running:
+                now = loop.time()
+                if duration is not None and now - start >= duration:
+                    break
+
+                if not eyes.frameDue():
+                    # converged: await a timer or a setter, then restart the schedule
+                    due = eyes.nextTimer()
+                    delay = None if due is None else max(0, due - eyes.millis()) / 1000
+                    if duration is not None:
+                        left = max(0, duration - (now - start))
+                        delay = left if delay is None else min(delay, left)
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._wake.clear()
+                    deadline = loop.time()
+                    continue
+
+                if now < deadline:
+                    await asyncio.sleep(deadline - now)
+                period = eyes.frameInterval / 1000
+                behind = loop.time() - deadline
+                if behind > roboeyes.LATE_TOLERANCE:
+                    eyes.lateFrames += 1
+                if behind >= period:
+                    missed = int(behind // period)
+                    if not eyes.timeBased:
+                        self._ticking = True
+                        for _ in range(missed):
+                            eyes._tick(render=False)
+                        self._ticking = False
+                    eyes.droppedFrames += missed
+                    deadline += missed * period
+
+                # setters until now are in this frame
+                wakeNs, self._wakeNs = self._wakeNs, None
+                waiters, self._waiters = self._waiters, []
+                eyes.fpsTimer = eyes.millis()
+                self._ticking = True
+                eyes._tick()
+                self._ticking = False
+                eyes.framesRendered += 1
+                deadline += period
+
+                frame, self._frame = self._frame, None
+                # one frame on the bus at a time; the next one renders meanwhile
+                if transfer is not None:
+                    await transfer
+                transfer = asyncio.ensure_future(self._show(frame, wakeNs, waiters))
+        finally:
+            if transfer is not None:
+                await transfer
+            eyes.frameSink = sink
+            self._running = False
+            self._ticking = False
+            if self._ownExecutor:
+                self._executor.shutdown()
+                self._executor = None
+            for waiter in self._waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+            self._waiters = []
+
+    def stop(self):
+        """Make run() return after the current frame."""
+        self._running = False
+        if self._wake is not None:
+            self._wake.set()
+
+    def put(self, frame):
+        # eyes.frameSink while run() runs; the numpy backend reuses its buffer
+        self._frame = bytes(frame) if isinstance(frame, bytearray) else frame
+
+    async def _show(self, frame, wakeNs, waiters):
+        """Send a frame on the worker thread, then report it to the setters that wait for it."""
+        if frame is not None:
+            try:
+                await self._loop.run_in_executor(self._executor, self.eyes.transferFrame, frame)
+            except Exception as e:
+                print("RoboEyes transfer failed:", e)
+        if wakeNs is not None and self.eyes._stats is not None:
+            self.eyes._stats.add("wake", _perf_ns() - wakeNs)
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    # ---------------------------
+    # Wakeups and setters
+    # ---------------------------
+    def _on_wake(self):
+        """eyes.onWake: note the time and wake run(), from the loop or any other thread."""
+        if self._ticking and threading.get_ident() == self._loopThread:
+            # the eyes' own blinks and flickers, set off by the frame being rendered
+            return
+        if self._wakeNs is None:
+            self._wakeNs = _perf_ns()
+        if self._wake is None or not self._running:
+            return
+        if threading.get_ident() == self._loopThread:
+            self._wake.set()
+        else:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def shown(self):
+        """Wait until the next frame is on the display (returns at once if run() is not running)."""
+        if not self._running:
+            return
+        waiter = self._loop.create_future()
+        self._waiters.append(waiter)
+        # make sure a frame comes even if the eyes were converged
+        self.eyes.wake()
+        await waiter
+
+    def __getattr__(self, name):
+        # everything else (getters, counters, stats()) is the RoboEyes'
+        return getattr(self.eyes, name)
+
+
+def _shown_after(name):
+    async def setter(self, *args, **kwargs):
+        getattr(self.eyes, name)(*args, **kwargs)
+        await self.shown()
+    setter.__name__ = name
+    setter.__doc__ = "RoboEyes.%s(), returning once the change is on the display." % name
+    return setter
+
+
+for _name in ASYNC_SETTERS:
+    setattr(AsyncRoboEyes, _name, _shown_after(_name))
+
+
+# ---------------------------
+# Example usage (main)
+# ---------------------------
+if __name__ == "__main__":
+    try:
+        from luma.core.interface.serial import i2c
+        from luma.oled.device import ssd1306
+        device = ssd1306(i2c(port=1, address=0x3C), width=128, height=64)
+    except Exception as e:
+        print("Warning: luma.oled not available or device init failed:", e)
+        device = None
+
+    face = AsyncRoboEyes(RoboEyes(device=device, width=128, height=64, frame_rate=50, monochrome=True))
+    face.eyes.setAutoblinker(True, interval=2, variation=3)
+
+    async def distance_sensor():
+        # stand-in for a GPIO reader: poll, and react on the face when something is close
+        while True:
+            await asyncio.sleep(0.5)
+            dist = random.uniform(5, 100)
+            if dist < 15:
+                await face.setMood(ANGRY)
+            elif dist < 40:
+                await face.setMood(TIRED)
+            else:
+                await face.setMood(DEFAULT)
+
+    async def motion_sensor():
+        while True:
+            await asyncio.sleep(random.uniform(1, 4))
+            await face.anim_laugh()
+            await face.setMood(HAPPY)
+
+    async def main():
+        sensors = [asyncio.create_task(distance_sensor()), asyncio.create_task(motion_sensor())]
+        await face.run(duration=15)
+        for task in sensors:
+            task.cancel()
+        print(face.eyes.statsLine())
+
+    asyncio.run(main())
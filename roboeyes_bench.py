@@ -0,0 +1,186 @@
+# roboeyes_bench.py
+"""
+Headless, deterministic RoboEyes render benchmark.
+
+Runs a fixed script of moods/animations for N frames on a virtual clock
+with a seeded RNG, through every render backend, and reports per-frame
+latency percentiles, allocations and bytes that would go over the bus.
+Frame hashes (SHA-1 of the SSD1306 page buffer) can be dumped and checked
+later, so performance changes can be verified to be pixel-exact.
+
+    python3 roboeyes_bench.py --frames 2000
+    python3 roboeyes_bench.py --hashes baseline.txt
+    python3 roboeyes_bench.py --check baseline.txt
+"""
+
+import argparse
+import hashlib
+import random
+import sys
+import time
+import tracemalloc
+
+import roboeyes
+from roboeyes_sim import NullSSD1306, VirtualClock
+
+
+# frame -> action, repeated every SCRIPT_PERIOD frames
+SCRIPT = {
+    0: lambda e: e.setMood(roboeyes.DEFAULT),
+    60: lambda e: e.setPosition(roboeyes.NE),
+    120: lambda e: e.setMood(roboeyes.TIRED),
+    180: lambda e: e.anim_laugh(),
+    240: lambda e: e.setMood(roboeyes.ANGRY),
+    300: lambda e: e.setPosition(roboeyes.SW),
+    360: lambda e: e.anim_confused(),
+    420: lambda e: e.setMood(roboeyes.HAPPY),
+    480: lambda e: e.setSweat(True),
+    600: lambda e: e.setSweat(False),
+    630: lambda e: e.setCuriosity(True),
+    660: lambda e: e.setPosition(roboeyes.W),
+    720: lambda e: e.setCyclops(True),
+    780: lambda e: e.setMood(roboeyes.TIRED),
+    840: lambda e: e.setCyclops(False),
+    870: lambda e: e.setCuriosity(False),
+    900: lambda e: e.blink_once(),
+}
+SCRIPT_PERIOD = 960
+
+
+def backends():
+    """Render backends available here."""
+    names = ["pil"]
+    if roboeyes.np is not None:
+        names.append("numpy")
+    return names
+
+
+def make_eyes(backend, seed, fps, time_based):
+    clock = VirtualClock()
+    eyes = roboeyes.RoboEyes(device=NullSSD1306(), width=128, height=64, frame_rate=fps,
+                             monochrome=True, backend=backend, time_based=time_based,
+                             clock=clock, rng=random.Random(seed))
+    eyes.setAutoblinker(True, interval=2, variation=3)
+    eyes.setIdleMode(True, interval=3, variation=4)
+    return eyes, clock
+
+
+def run_frames(eyes, clock, frames, on_frame):
+    """Advance the script one frame at a time; every frame is rendered (no quiescent skip)."""
+    for i in range(frames):
+        action = SCRIPT.get(i % SCRIPT_PERIOD)
+        if action:
+            action(eyes)
+        clock.advance(eyes.frameInterval)
+        on_frame(i)
+
+
+def bench(backend, frames, seed, fps, time_based):
+    """Return (latencies_ns, frame_hashes, alloc_bytes, device) for one backend."""
+    # pass 1: timing and hashes
+    eyes, clock = make_eyes(backend, seed, fps, time_based)
+    latencies = []
+    hashes = []
+    perf = time.perf_counter_ns
+
+    def timed(i):
+        t0 = perf()
+        eyes._tick()
+        latencies.append(perf() - t0)
+        hashes.append(hashlib.sha1(eyes._shadow).hexdigest())
+
+    run_frames(eyes, clock, frames, timed)
+    device = eyes.device
+
+    # pass 2: same frames again under tracemalloc (slow, so not timed)
+    eyes, clock = make_eyes(backend, seed, fps, time_based)
+    allocs = []
+
+    def traced(i):
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        eyes._tick()
+        allocs.append(tracemalloc.get_traced_memory()[1] - base)
+
+    tracemalloc.start()
+    try:
+        run_frames(eyes, clock, frames, traced)
+    finally:
+        tracemalloc.stop()
+    return latencies, hashes, allocs, device
+
+
+def percentile(sorted_values, q):
+    idx = min(len(sorted_values) - 1, int(round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+def report(backend, latencies, allocs, device, frames):
+    lat = sorted(latencies)
+    us = lambda ns: ns / 1000
+    print("%-6s frames=%d  p50=%.0fus p90=%.0fus p99=%.0fus max=%.0fus  mean=%.0fus" % (
+        backend, frames, us(percentile(lat, 50)), us(percentile(lat, 90)),
+        us(percentile(lat, 99)), us(lat[-1]), us(sum(lat) / len(lat))))
+    print("       alloc/frame: mean=%.0fB max=%dB   bus: %.1f data B/frame, %.1f cmd B/frame" % (
+        sum(allocs) / len(allocs), max(allocs),
+        device.dataBytes / frames, device.commandBytes / frames))
+
+
+def write_hashes(path, results):
+    with open(path, "w") as f:
+        for backend, hashes in results.items():
+            for i, h in enumerate(hashes):
+                f.write("%s %d %s\n" % (backend, i, h))
+
+
+def check_hashes(path, results):
+    """Compare against a dump; returns True if every frame of every backend matches."""
+    expected = {}
+    with open(path) as f:
+        for line in f:
+            backend, i, h = line.split()
+            expected.setdefault(backend, {})[int(i)] = h
+    ok = True
+    for backend, hashes in results.items():
+        ref = expected.get(backend)
+        if ref is None:
+            print("%-6s no reference hashes" % backend)
+            continue
+        bad = [i for i, h in enumerate(hashes) if i in ref and ref[i] != h]
+        if bad:
+            ok = False
+            print("%-6s MISMATCH in %d frames, first at frame %d" % (backend, len(bad), bad[0]))
+        else:
+            print("%-6s %d frames match" % (backend, min(len(hashes), len(ref))))
+    return ok
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument("--frames", type=int, default=2000)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--fps", type=int, default=50)
+    ap.add_argument("--time-based", action="store_true", help="use time-based tweening")
+    ap.add_argument("--backend", action="append", choices=["pil", "numpy"],
+                    help="backend to run (repeatable, default: all available)")
+    ap.add_argument("--hashes", metavar="PATH", help="write per-frame hashes to PATH")
+    ap.add_argument("--check", metavar="PATH", help="compare per-frame hashes with PATH")
+    args = ap.parse_args(argv)
+
+    results = {}
+    for backend in args.backend or backends():
+        latencies, hashes, allocs, device = bench(backend, args.frames, args.seed, args.fps, args.time_based)
+        report(backend, latencies, allocs, device, args.frames)
+        results[backend] = hashes
+        digest = hashlib.sha1("".join(hashes).encode()).hexdigest()
+        print("       frames digest %s" % digest)
+
+    if args.hashes:
+        write_hashes(args.hashes, results)
+    if args.check:
+        return 0 if check_hashes(args.check, results) else 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+# roboeyes_clips.py
+"""
+Precompiled RoboEyes animation clips.
+
+Blink, laugh, confused and mood transitions always produce the same frames
+for a given eye geometry. compile_clips() records them once on a headless
+copy of the eyes (virtual clock) as SSD1306 page buffers; ClipLibrary plays
+them back through RoboEyes.playClip() with no rasterization and saves them
+to a cache file keyed by the geometry, so later starts skip compiling.
+
+    clips = ClipLibrary.for_eyes(eyes)       # load from cache or compile
+    clips.blink(eyes)                        # instead of eyes.blink_once()
+    clips.setMood(eyes, roboeyes.HAPPY)      # instead of eyes.setMood(HAPPY)
+
+Clips are recorded with the eyes centred and stored relative to that
+position: they play wherever the eyes rest (after setPosition() or an idle
+move), shifted on the fly, and end where they started. They need the eyes
+at rest (converged, no curiosity, cyclops or sweat); in any other state the
+live animation is used.
+"""
+
+import hashlib
+import json
+import os
+import random
+import struct
+import zlib
+
+import roboeyes
+from roboeyes import DEFAULT, TIRED, ANGRY, HAPPY
+from roboeyes_sim import NullSSD1306, VirtualClock
+
+CLIP_FORMAT = 2
+CLIP_MAGIC = b"REYC"
+
+MOODS = {"default": DEFAULT, "tired": TIRED, "angry": ANGRY, "happy": HAPPY}
+
+# position targets; a settled eye can stop a pixel short of them, so they
+# are not matched: a clip plays as if they were on the eyes and leaves them there
+NEXT_ATTRS = ("eyeLxNext", "eyeLyNext", "eyeRxNext", "eyeRyNext")
+# state a clip must start from (amplitudes, open flags and the flicker
+# phase don't matter at rest); positions are relative to the left eye
+START_ATTRS = tuple(a for a in roboeyes.STATE_ATTRS if a not in NEXT_ATTRS) + (
+    "tired", "angry", "happy", "curious", "cyclops", "sweat", "hFlicker", "vFlicker",
+)
+# state restored when a clip ends, so live animation carries on seamlessly
+FINAL_ATTRS = START_ATTRS + NEXT_ATTRS + (
+    "hFlickerAlternate", "vFlickerAlternate", "hFlickerAmplitude", "vFlickerAmplitude",
+    "laugh", "laughToggle", "confused", "confusedToggle",
+)
+# positions, taken relative to (eyeLx, eyeLy) and shifted on playback
+X_ATTRS = ("eyeLx", "eyeRx", "eyeLxNext", "eyeRxNext")
+Y_ATTRS = ("eyeLy", "eyeRy", "eyeLyNext", "eyeRyNext")
+
+# safety limit on the frames recorded per clip
+MAX_CLIP_FRAMES = 500
+
+
+def geometry_key(eyes):
+    """Hex key of everything that changes what a clip looks like."""
+    config = [
+        CLIP_FORMAT, eyes.screenWidth, eyes.screenHeight, eyes.monochrome, eyes.backend,
+        eyes.frameInterval, eyes.timeBased, eyes.tweenRate,
+        eyes.eyeLwidthDefault, eyes.eyeLheightDefault, eyes.eyeLborderRadiusDefault,
+        eyes.eyeRwidthDefault, eyes.eyeRheightDefault, eyes.eyeRborderRadiusDefault,
+        eyes.spaceBetweenDefault, eyes.BGCOLOR, eyes.MAINCOLOR,
+    ]
+    return hashlib.sha1(json.dumps(config).encode()).hexdigest()
+
+
+def snapshot(eyes, attrs=START_ATTRS):
+    """Tuple of the clip-relevant state of the eyes, positions relative to the left eye."""
+    ox, oy = eyes.eyeLx, eyes.eyeLy
+    return tuple(getattr(eyes, a) - ox if a in X_ATTRS else getattr(eyes, a) - oy if a in Y_ATTRS
+                 else getattr(eyes, a) for a in attrs)
+
+
+def translate_pages(frame, width, pages, dx, dy):
+    """SSD1306 page buffer moved by (dx, dy) pixels; uncovered pixels are cleared."""
+    full = (1 << (8 * width)) - 1
+    # one int per page, a byte lane per column: shifts move whole columns/rows
+    rows = [int.from_bytes(frame[p * width:(p + 1) * width], "little") for p in range(pages)]
+    q, r = divmod(dy, 8)
+    lo_mask = int.from_bytes(bytes(((0xff << r) & 0xff,)) * width, "little")
+    hi_mask = int.from_bytes(bytes(((1 << r) - 1,)) * width, "little")
+    out = bytearray()
+    for p in range(pages):
+        src = p - q
+        v = (rows[src] << r) & lo_mask if 0 <= src < pages else 0
+        if r and 0 <= src - 1 < pages:
+            v |= (rows[src - 1] >> (8 - r)) & hi_mask
+        if dx > 0:
+            v = (v << (8 * dx)) & full
+        elif dx < 0:
+            v >>= -8 * dx
+        out += v.to_bytes(width, "little")
+    return bytes(out)
+
+
+class Clip:
+    """
+    Prerendered frames plus the state to start from (relative) and to restore
+    afterwards (absolute, for the left eye at origin); reach is how far left
+    and up of origin the eyes go while it plays.
+    """
+
+    def __init__(self, frames, start, final, origin, reach):
+        self.frames = frames
+        self.start = start
+        self.final = final
+        self.origin = tuple(origin)
+        self.reach = tuple(reach)
+
+
+def _twin(eyes):
+    """Headless copy of the eyes' geometry, at rest, on a virtual clock."""
+    # the recorded frame is the twin's shadow buffer, the device only takes the bytes
+    clock = VirtualClock()
+    twin = roboeyes.RoboEyes(device=NullSSD1306(), width=eyes.screenWidth, height=eyes.screenHeight,
+                             monochrome=eyes.monochrome, backend=eyes.backend,
+                             time_based=eyes.timeBased, clock=clock, rng=random.Random(0))
+    twin.frameInterval = eyes.frameInterval
+    twin.tweenRate = eyes.tweenRate
+    twin.setDisplayColors(eyes.BGCOLOR, eyes.MAINCOLOR)
+    twin.setWidth(eyes.eyeLwidthDefault, eyes.eyeRwidthDefault)
+    twin.setHeight(eyes.eyeLheightDefault, eyes.eyeRheightDefault)
+    twin.setBorderradius(eyes.eyeLborderRadiusDefault, eyes.eyeRborderRadiusDefault)
+    twin.setSpacebetween(eyes.spaceBetweenDefault)
+    return twin, clock
+
+
+def _step(twin, clock):
+    clock.advance(twin.frameInterval)
+    twin._tick()
+    return bytes(twin._shadow)
+
+
+def _settle(twin, clock):
+    """Tick until the eyes stop changing."""
+    for _ in range(MAX_CLIP_FRAMES):
+        _step(twin, clock)
+        if twin.quiescent:
+            return
+    raise RuntimeError("RoboEyes did not converge while compiling clips")
+
+
+def _record(twin, clock, trigger):
+    """
+    Run trigger(twin) from rest and record frames until the eyes settle
+    again, back on the positions they started from (flicker can leave them a
+    pixel off, which would make the next clip miss its start state).
+    """
+    start = snapshot(twin)
+    origin = (twin.eyeLx, twin.eyeLy)
+    positions = {a: getattr(twin, a) for a in X_ATTRS + Y_ATTRS}
+    reach = [0, 0]
+    trigger(twin)
+    frames = []
+    for settled in (False, True):
+        if settled:
+            for name, value in positions.items():
+                setattr(twin, name, value)
+            twin.hFlickerAlternate = twin.vFlickerAlternate = False
+            twin.wake()
+        for _ in range(MAX_CLIP_FRAMES):
+            frames.append(_step(twin, clock))
+            reach[0] = min(reach[0], min(twin.eyeLx, twin.eyeRx) - origin[0])
+            reach[1] = min(reach[1], min(twin.eyeLy, twin.eyeRy) - origin[1])
+            if twin.quiescent:
+                break
+        else:
+            raise RuntimeError("RoboEyes clip did not converge")
+    # drop repeated frames at the end (that is how quiescence is detected)
+    while len(frames) > 1 and frames[-1] == frames[-2]:
+        frames.pop()
+    final = {a: getattr(twin, a) for a in FINAL_ATTRS}
+    return Clip(frames, start, final, origin, reach)
+
+
+def compile_clips(eyes):
+    """Record blink/laugh/confused in every mood and every mood-to-mood transition."""
+    clips = {}
+    for name, mood in MOODS.items():
+        for anim, trigger in (("blink", lambda e: e.blink_once()),
+                              ("laugh", lambda e: e.anim_laugh()),
+                              ("confused", lambda e: e.anim_confused())):
+            twin, clock = _twin(eyes)
+            twin.setMood(mood)
+            _settle(twin, clock)
+            clips["%s:%s" % (anim, name)] = _record(twin, clock, trigger)
+        for target_name, target in MOODS.items():
+            if target_name == name:
+                continue
+            twin, clock = _twin(eyes)
+            twin.setMood(mood)
+            _settle(twin, clock)
+            clips["mood:%s>%s" % (name, target_name)] = _record(twin, clock, lambda e: e.setMood(target))
+    return clips
+
+
+class ClipLibrary:
+    """Compiled clips for one geometry, with cache-file persistence and playback."""
+
+    def __init__(self, key, clips):
+        self.key = key
+        self.clips = clips
+        self.played = 0
+        self.fallbacks = 0
+
+    @classmethod
+    def for_eyes(cls, eyes, cache_dir=None):
+        """Load the clips for this geometry from cache_dir, compiling (and saving) them if needed."""
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.expanduser("~"), ".cache", "roboeyes")
+        key = geometry_key(eyes)
+        path = os.path.join(cache_dir, "clips-%s.bin" % key)
+        try:
+            return cls.load(path, key)
+        except (OSError, ValueError):
+            pass
+        library = cls(key, compile_clips(eyes))
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            library.save(path)
+        except OSError as e:
+            print("Warning: could not write clip cache:", e)
+        return library
+
+    # Cache file: magic, format, key, index length, JSON index, zlib'd concatenated frames
+    def save(self, path):
+        index = []
+        blob = []
+        for name, clip in self.clips.items():
+            index.append({"name": name, "frames": len(clip.frames), "start": list(clip.start),
+                          "final": clip.final, "origin": list(clip.origin), "reach": list(clip.reach)})
+            blob.extend(clip.frames)
+        index = json.dumps(index).encode()
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(CLIP_MAGIC + struct.pack("<H40sI", CLIP_FORMAT, self.key.encode(), len(index)))
+            f.write(index)
+            f.write(zlib.compress(b"".join(blob)))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, key=None):
+        """Read a cache file; ValueError if it is damaged or for another geometry."""
+        with open(path, "rb") as f:
+            data = f.read()
+        header = struct.calcsize("<H40sI")
+        if data[:4] != CLIP_MAGIC:
+            raise ValueError("not a RoboEyes clip file")
+        version, file_key, index_len = struct.unpack("<H40sI", data[4:4 + header])
+        file_key = file_key.decode()
+        if version != CLIP_FORMAT or (key is not None and file_key != key):
+            raise ValueError("clip file is for another format or geometry")
+        pos = 4 + header
+        index = json.loads(data[pos:pos + index_len])
+        try:
+            blob = zlib.decompress(data[pos + index_len:])
+        except zlib.error as e:
+            raise ValueError("damaged clip file: %s" % e)
+        count = sum(entry["frames"] for entry in index)
+        size = len(blob) // count if count else 0
+        clips = {}
+        offset = 0
+        for entry in index:
+            frames = [blob[offset + i * size:offset + (i + 1) * size] for i in range(entry["frames"])]
+            offset += entry["frames"] * size
+            clips[entry["name"]] = Clip(frames, tuple(entry["start"]), entry["final"],
+                                        entry["origin"], entry["reach"])
+        return cls(file_key, clips)
+
+    # ---------------------------
+    # Playback
+    # ---------------------------
+    def play(self, eyes, name):
+        """Play a clip if the eyes are at its start state (anywhere on screen); returns False if it can't."""
+        clip = self.clips.get(name)
+        if (clip is None or not eyes.quiescent or eyes._clip is not None
+                or not (eyes.device is None or eyes._windowed_device())
+                or snapshot(eyes) != clip.start):
+            return False
+        dx = eyes.eyeLx - clip.origin[0]
+        dy = eyes.eyeLy - clip.origin[1]
+        # only page buffers can be shifted; off the top or left edge live
+        # drawing rounds coordinates differently
+        if ((dx or dy) and not eyes.monochrome or dx != int(dx) or dy != int(dy)
+                or clip.origin[0] + clip.reach[0] + dx < 0 or clip.origin[1] + clip.reach[1] + dy < 0):
+            return False
+        dx, dy = int(dx), int(dy)
+        final = dict(clip.final)
+        for a in X_ATTRS:
+            final[a] += dx
+        for a in Y_ATTRS:
+            final[a] += dy
+        frames = clip.frames
+        if dx or dy:
+            frames = (translate_pages(f, eyes.screenWidth, eyes.screenHeight // 8, dx, dy) for f in frames)
+        eyes.playClip(frames, final)
+        self.played += 1
+        return True
+
+    def _mood_name(self, eyes):
+        if eyes.tired:
+            return "tired"
+        if eyes.angry:
+            return "angry"
+        if eyes.happy:
+            return "happy"
+        return "default"
+
+    def _play_or_live(self, eyes, name, live):
+        if not self.play(eyes, name):
+            self.fallbacks += 1
+            live()
+
+    def blink(self, eyes):
+        self._play_or_live(eyes, "blink:" + self._mood_name(eyes), eyes.blink_once)
+
+    def laugh(self, eyes):
+        self._play_or_live(eyes, "laugh:" + self._mood_name(eyes), eyes.anim_laugh)
+
+    def confused(self, eyes):
+        self._play_or_live(eyes, "confused:" + self._mood_name(eyes), eyes.anim_confused)
+
+    def setMood(self, eyes, mood):
+        target = next((n for n, m in MOODS.items() if m == mood), "default")
+        current = self._mood_name(eyes)
+        if target == current:
+            eyes.setMood(mood)
+            return
+        self._play_or_live(eyes, "mood:%s>%s" % (current, target), lambda: eyes.setMood(mood))
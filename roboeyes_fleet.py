@@ -0,0 +1,414 @@
+# roboeyes_fleet.py
+"""
+Struct-of-arrays RoboEyes engine for many faces (fleet simulator, video wall).
+
+EyeFleet keeps the state of N faces in three NumPy matrices, one row per
+RoboEyes attribute and one column per face:
+
+    state   int64   positions, sizes, radii, eyelids, amplitudes, timers
+    flags   bool    moods, open/blink, flicker, autoblinker, idle, laugh, confused, sweat
+    drops   float64 sweat drops (field, drop, face)
+
+Each row is also an attribute named like its RoboEyes counterpart
+(fleet.eyeLx[i] is face i's eyeLx; assign in place, e.g. fleet.eyeLx[:] = 0).
+tick() advances every face by one frame with array operations and follows
+RoboEyes' per-frame tweening step by step, so a fleet face with the same
+state and timers moves exactly like a RoboEyes instance. Random draws
+(blink/idle intervals, idle targets, sweat drops) come from one NumPy
+generator instead of the per-instance random source.
+
+    fleet = EyeFleet(500, clock=roboeyes.millis, seed=1)
+    fleet.setAutoblinker(True, interval=2, variation=3)
+    fleet.setMood(roboeyes.HAPPY, faces=slice(0, 100))
+    fleet.tick()
+    for i in fleet.changed():
+        show(i, fleet.frame(i))
+
+Rendering reuses RoboEyes' display list and render backends through one
+scratch instance, so only faces that changed need to be rasterized.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+import roboeyes
+from roboeyes import RoboEyes, TIRED, ANGRY, HAPPY, N, NE, E, SE, S, SW, W, NW
+
+INT_FIELDS = (
+    "eyeLx", "eyeLy", "eyeRx", "eyeRy", "eyeLxNext", "eyeLyNext", "eyeRxNext", "eyeRyNext",
+    "eyeLwidthCurrent", "eyeRwidthCurrent", "eyeLwidthNext", "eyeRwidthNext",
+    "eyeLwidthDefault", "eyeRwidthDefault",
+    "eyeLheightCurrent", "eyeRheightCurrent", "eyeLheightNext", "eyeRheightNext",
+    "eyeLheightDefault", "eyeRheightDefault", "eyeLheightOffset", "eyeRheightOffset",
+    "eyeLborderRadiusCurrent", "eyeRborderRadiusCurrent", "eyeLborderRadiusNext", "eyeRborderRadiusNext",
+    "eyeLborderRadiusDefault", "eyeRborderRadiusDefault",
+    "spaceBetweenCurrent", "spaceBetweenNext", "spaceBetweenDefault",
+    "eyelidsTiredHeight", "eyelidsTiredHeightNext", "eyelidsAngryHeight", "eyelidsAngryHeightNext",
+    "eyelidsHappyBottomOffset", "eyelidsHappyBottomOffsetNext",
+    "hFlickerAmplitude", "vFlickerAmplitude",
+    "blinktimer", "blinkInterval", "blinkIntervalVariation",
+    "idleAnimationTimer", "idleInterval", "idleIntervalVariation",
+    "laughAnimationTimer", "confusedAnimationTimer",
+)
+FLAG_FIELDS = (
+    "tired", "angry", "happy", "curious", "cyclops", "eyeL_open", "eyeR_open",
+    "hFlicker", "hFlickerAlternate", "vFlicker", "vFlickerAlternate",
+    "autoblinker", "idle", "laugh", "laughToggle", "confused", "confusedToggle", "sweat",
+)
+# per sweat drop; RoboEyes names them sweat1XPosInitial ... sweat3Height
+DROP_FIELDS = ("XPosInitial", "XPos", "YPos", "YPosMax", "Width", "Height")
+
+# setPosition(): eyeLxNext/eyeLyNext as 0, half or all of the screen constraint
+POSITIONS = {N: (1, 0), NE: (2, 0), E: (2, 1), SE: (2, 2), S: (1, 2), SW: (0, 2), W: (0, 1), NW: (0, 0)}
+
+ALL = slice(None)
+
+
+class EyeFleet:
+    """N RoboEyes faces of one screen size, advanced together."""
+
+    def __init__(self, count, width=128, height=64, frame_rate=50, monochrome=True,
+                 backend="pil", clock=None, seed=None):
+        """
+        count: number of faces
+        width/height/monochrome/backend: as for RoboEyes (shared by all faces)
+        clock: millisecond clock for the timers (default roboeyes.millis)
+        seed: seed for the NumPy random generator
+        """
+        self.count = count
+        self.screenWidth = width
+        self.screenHeight = height
+        self.frameInterval = 1000 // frame_rate
+        self.millis = clock if clock is not None else roboeyes.millis
+        self.rng = np.random.default_rng(seed)
+        self.laughAnimationDuration = 500
+        self.confusedAnimationDuration = 500
+
+        # every face starts like a fresh RoboEyes; it also renders frames (see frame())
+        self._renderer = RoboEyes(device=None, width=width, height=height, frame_rate=frame_rate,
+                                  monochrome=monochrome, backend=backend, clock=self.millis,
+                                  instrumented=False)
+        r = self._renderer
+        self.state = np.array([[getattr(r, a)] * count for a in INT_FIELDS], dtype=np.int64)
+        self.flags = np.array([[getattr(r, a)] * count for a in FLAG_FIELDS], dtype=bool)
+        self.drops = np.array([[[getattr(r, "sweat%d%s" % (k, a))] * count for k in (1, 2, 3)]
+                               for a in DROP_FIELDS], dtype=np.float64)
+        for i, a in enumerate(INT_FIELDS):
+            setattr(self, a, self.state[i])
+        for i, a in enumerate(FLAG_FIELDS):
+            setattr(self, a, self.flags[i])
+        self.sweatXPosInitial, self.sweatXPos, self.sweatYPos, self.sweatYPosMax, \
+            self.sweatWidth, self.sweatHeight = self.drops
+        # sweat respawn range (inclusive) per drop: left, centre, right
+        self._dropLow = np.array([[0], [30], [width - 30]])
+        self._dropHigh = np.array([[30], [max(30, width - 30)], [width]])
+
+        # change detection: state after the previous tick
+        self._previous = np.empty_like(self.state)
+        self._changed = np.ones(count, dtype=bool)
+
+    @property
+    def nbytes(self):
+        """Bytes of per-face state held by the fleet."""
+        return self.state.nbytes + self.flags.nbytes + self.drops.nbytes
+
+    # ---------------------------
+    # Setters (faces: index, slice, index array or bool mask; default all)
+    # ---------------------------
+    def setMood(self, mood, faces=ALL):
+        self.tired[faces] = mood == TIRED
+        self.angry[faces] = mood == ANGRY
+        self.happy[faces] = mood == HAPPY
+
+    def setPosition(self, position, faces=ALL):
+        fx, fy = POSITIONS.get(position, (1, 1))
+        cx = self.getScreenConstraint_X()[faces]
+        cy = self.getScreenConstraint_Y()[faces]
+        self.eyeLxNext[faces] = cx if fx == 2 else cx // 2 if fx == 1 else 0
+        self.eyeLyNext[faces] = cy if fy == 2 else cy // 2 if fy == 1 else 0
+
+    def setWidth(self, leftEye, rightEye, faces=ALL):
+        self.eyeLwidthNext[faces] = self.eyeLwidthDefault[faces] = leftEye
+        self.eyeRwidthNext[faces] = self.eyeRwidthDefault[faces] = rightEye
+
+    def setHeight(self, leftEye, rightEye, faces=ALL):
+        self.eyeLheightNext[faces] = self.eyeLheightDefault[faces] = leftEye
+        self.eyeRheightNext[faces] = self.eyeRheightDefault[faces] = rightEye
+
+    def setBorderradius(self, leftEye, rightEye, faces=ALL):
+        self.eyeLborderRadiusNext[faces] = self.eyeLborderRadiusDefault[faces] = leftEye
+        self.eyeRborderRadiusNext[faces] = self.eyeRborderRadiusDefault[faces] = rightEye
+
+    def setSpacebetween(self, space, faces=ALL):
+        self.spaceBetweenNext[faces] = self.spaceBetweenDefault[faces] = space
+
+    def setAutoblinker(self, active, interval=None, variation=None, faces=ALL):
+        self.autoblinker[faces] = active
+        if interval is not None:
+            self.blinkInterval[faces] = interval
+        if variation is not None:
+            self.blinkIntervalVariation[faces] = variation
+
+    def setIdleMode(self, active, interval=None, variation=None, faces=ALL):
+        self.idle[faces] = active
+        if interval is not None:
+            self.idleInterval[faces] = interval
+        if variation is not None:
+            self.idleIntervalVariation[faces] = variation
+
+    def setCuriosity(self, curiousBit, faces=ALL):
+        self.curious[faces] = curiousBit
+
+    def setCyclops(self, cyclopsBit, faces=ALL):
+        self.cyclops[faces] = cyclopsBit
+
+    def setHFlicker(self, flickerBit, amplitude=None, faces=ALL):
+        self.hFlicker[faces] = flickerBit
+        if amplitude is not None:
+            self.hFlickerAmplitude[faces] = amplitude
+
+    def setVFlicker(self, flickerBit, amplitude=None, faces=ALL):
+        self.vFlicker[faces] = flickerBit
+        if amplitude is not None:
+            self.vFlickerAmplitude[faces] = amplitude
+
+    def setSweat(self, sweatBit, faces=ALL):
+        self.sweat[faces] = sweatBit
+
+    def close(self, left=True, right=True, faces=ALL):
+        if left:
+            self.eyeLheightNext[faces] = 1
+            self.eyeL_open[faces] = False
+        if right:
+            self.eyeRheightNext[faces] = 1
+            self.eyeR_open[faces] = False
+
+    def open(self, left=True, right=True, faces=ALL):
+        if left:
+            self.eyeL_open[faces] = True
+        if right:
+            self.eyeR_open[faces] = True
+
+    def blink_once(self, faces=ALL):
+        self.close(True, True, faces)
+        self.open(True, True, faces)
+
+    def anim_confused(self, faces=ALL):
+        self.confused[faces] = True
+
+    def anim_laugh(self, faces=ALL):
+        self.laugh[faces] = True
+
+    def getScreenConstraint_X(self):
+        return self.screenWidth - self.eyeLwidthCurrent - self.spaceBetweenCurrent - self.eyeRwidthCurrent
+
+    def getScreenConstraint_Y(self):
+        return self.screenHeight - self.eyeLheightDefault
+
+    # ---------------------------
+    # One frame for every face
+    # ---------------------------
+    def tick(self, now=None):
+        """Advance all faces by one frame (RoboEyes._advance_state + _advance_overlays)."""
+        if now is None:
+            now = self.millis()
+        np.copyto(self._previous, self.state)
+
+        # CURIOUS height offset
+        constraintX = self.getScreenConstraint_X()
+        self.eyeLheightOffset[:] = np.where(
+            self.curious & ((self.eyeLxNext <= 10) | ((self.eyeLxNext >= constraintX - 10) & self.cyclops)), 8, 0)
+        self.eyeRheightOffset[:] = np.where(
+            self.curious & (self.eyeRxNext >= self.screenWidth - self.eyeRwidthCurrent - 10), 8, 0)
+
+        self._tween()
+
+        # Autoblinker
+        due = self.autoblinker & (now >= self.blinktimer)
+        if due.any():
+            self.blink_once(due)
+            jitter = self.rng.integers(0, self.blinkIntervalVariation + 1)
+            self.blinktimer[:] = np.where(due, now + self.blinkInterval * 1000 + jitter * 1000, self.blinktimer)
+
+        # Laugh / confused: start the flicker, stop it after the animation duration
+        self._flicker_animation(self.laugh, self.laughToggle, self.laughAnimationTimer,
+                                self.laughAnimationDuration, self.vFlicker, self.vFlickerAmplitude, 5, now)
+        self._flicker_animation(self.confused, self.confusedToggle, self.confusedAnimationTimer,
+                                self.confusedAnimationDuration, self.hFlicker, self.hFlickerAmplitude, 20, now)
+
+        # Idle mode random movement
+        due = self.idle & (now >= self.idleAnimationTimer)
+        if due.any():
+            maxx = np.maximum(0, self.getScreenConstraint_X())
+            maxy = np.maximum(0, self.getScreenConstraint_Y())
+            self.eyeLxNext[:] = np.where(due, self.rng.integers(0, maxx + 1), self.eyeLxNext)
+            self.eyeLyNext[:] = np.where(due, self.rng.integers(0, maxy + 1), self.eyeLyNext)
+            jitter = self.rng.integers(0, self.idleIntervalVariation + 1)
+            self.idleAnimationTimer[:] = np.where(due, now + self.idleInterval * 1000 + jitter * 1000,
+                                                  self.idleAnimationTimer)
+
+        # Horizontal and vertical flicker
+        step = np.where(self.hFlickerAlternate, self.hFlickerAmplitude, -self.hFlickerAmplitude) * self.hFlicker
+        self.eyeLx += step
+        self.eyeRx += step
+        self.hFlickerAlternate ^= self.hFlicker
+        step = np.where(self.vFlickerAlternate, self.vFlickerAmplitude, -self.vFlickerAmplitude) * self.vFlicker
+        self.eyeLy += step
+        self.eyeRy += step
+        self.vFlickerAlternate ^= self.vFlicker
+
+        # Cyclops
+        self.eyeRwidthCurrent[self.cyclops] = 0
+        self.eyeRheightCurrent[self.cyclops] = 0
+        self.spaceBetweenCurrent[self.cyclops] = 0
+
+        self._overlays()
+
+        # a face needs a new frame when its state moved or something animates
+        self._changed = ((self.state != self._previous).any(axis=0)
+                         | self.hFlicker | self.vFlicker | self.sweat | self.laugh | self.confused)
+
+    def _tween(self):
+        """RoboEyes._tween_per_frame on every face."""
+        self.eyeLheightCurrent[:] = (self.eyeLheightCurrent + self.eyeLheightNext + self.eyeLheightOffset) // 2
+        self.eyeLy += (self.eyeLheightDefault - self.eyeLheightCurrent) // 2
+        self.eyeLy -= self.eyeLheightOffset // 2
+
+        self.eyeRheightCurrent[:] = (self.eyeRheightCurrent + self.eyeRheightNext + self.eyeRheightOffset) // 2
+        self.eyeRy += (self.eyeRheightDefault - self.eyeRheightCurrent) // 2
+        self.eyeRy -= self.eyeRheightOffset // 2
+
+        # Auto-open if previously set to open and fully closed
+        reopen = self.eyeL_open & (self.eyeLheightCurrent <= 1 + self.eyeLheightOffset)
+        self.eyeLheightNext[reopen] = self.eyeLheightDefault[reopen]
+        reopen = self.eyeR_open & (self.eyeRheightCurrent <= 1 + self.eyeRheightOffset)
+        self.eyeRheightNext[reopen] = self.eyeRheightDefault[reopen]
+
+        self.eyeLwidthCurrent[:] = (self.eyeLwidthCurrent + self.eyeLwidthNext) // 2
+        self.eyeRwidthCurrent[:] = (self.eyeRwidthCurrent + self.eyeRwidthNext) // 2
+        self.spaceBetweenCurrent[:] = (self.spaceBetweenCurrent + self.spaceBetweenNext) // 2
+
+        self.eyeLx[:] = (self.eyeLx + self.eyeLxNext) // 2
+        self.eyeLy[:] = (self.eyeLy + self.eyeLyNext) // 2
+        self.eyeRxNext[:] = self.eyeLxNext + self.eyeLwidthCurrent + self.spaceBetweenCurrent
+        self.eyeRyNext[:] = self.eyeLyNext
+        self.eyeRx[:] = (self.eyeRx + self.eyeRxNext) // 2
+        self.eyeRy[:] = (self.eyeRy + self.eyeRyNext) // 2
+
+        self.eyeLborderRadiusCurrent[:] = (self.eyeLborderRadiusCurrent + self.eyeLborderRadiusNext) // 2
+        self.eyeRborderRadiusCurrent[:] = (self.eyeRborderRadiusCurrent + self.eyeRborderRadiusNext) // 2
+
+    def _flicker_animation(self, active, toggle, timer, duration, flicker, amplitude, strength, now):
+        """Laugh/confused: first frame switches the flicker on, it goes off after duration ms."""
+        start = active & toggle
+        end = active & ~toggle & (now >= timer + duration)
+        flicker[start] = True
+        amplitude[start] = strength
+        timer[start] = now
+        toggle[start] = False
+        flicker[end] = False
+        amplitude[end] = 0
+        toggle[end] = True
+        active[end] = False
+
+    def _overlays(self):
+        """RoboEyes._advance_overlays (per-frame mode) on every face."""
+        half = self.eyeLheightCurrent // 2
+        self.eyelidsTiredHeightNext[:] = np.where(self.tired & ~self.angry, half, 0)
+        self.eyelidsAngryHeightNext[:] = np.where(self.angry, half, 0)
+        self.eyelidsHappyBottomOffsetNext[:] = np.where(self.happy, half, 0)
+        self.eyelidsTiredHeight[:] = (self.eyelidsTiredHeight + self.eyelidsTiredHeightNext) // 2
+        self.eyelidsAngryHeight[:] = (self.eyelidsAngryHeight + self.eyelidsAngryHeightNext) // 2
+        self.eyelidsHappyBottomOffset[:] = (self.eyelidsHappyBottomOffset + self.eyelidsHappyBottomOffsetNext) // 2
+
+        if not self.sweat.any():
+            return
+        sweat = self.sweat  # broadcasts over the three drops
+        x0, x, y, ymax, w, h = self.drops
+        fall = sweat & (y <= ymax)
+        respawn = sweat ^ fall
+        np.add(y, 0.5, out=y, where=fall)
+        if respawn.any():
+            x0[:] = np.where(respawn, self.rng.integers(self._dropLow, self._dropHigh + 1, x0.shape), x0)
+            y[respawn] = 2
+            ymax[:] = np.where(respawn, self.rng.integers(10, 21, ymax.shape), ymax)
+            w[respawn] = 1.0
+            h[respawn] = 2.0
+        grow = sweat & (y <= ymax / 2)
+        shrink = sweat ^ grow
+        np.add(w, 0.5, out=w, where=grow)
+        np.add(h, 0.5, out=h, where=grow)
+        np.subtract(w, 0.1, out=w, where=shrink)
+        np.maximum(w, 1.0, out=w, where=shrink)
+        np.subtract(h, 0.5, out=h, where=shrink)
+        np.maximum(h, 1.0, out=h, where=shrink)
+        np.trunc(x0 - w / 2, out=x, where=sweat)
+
+    # ---------------------------
+    # Rendering
+    # ---------------------------
+    def changed(self):
+        """Indices of the faces whose frame changed in the last tick()."""
+        return np.flatnonzero(self._changed)
+
+    def load(self, face, eyes=None):
+        """Copy one face's state onto a RoboEyes instance (default the scratch renderer)."""
+        eyes = self._renderer if eyes is None else eyes
+        for name, value in zip(INT_FIELDS, self.state[:, face].tolist()):
+            setattr(eyes, name, value)
+        for name, value in zip(FLAG_FIELDS, self.flags[:, face].tolist()):
+            setattr(eyes, name, value)
+        drops = self.drops[:, :, face].tolist()
+        for f, name in enumerate(DROP_FIELDS):
+            for k in range(3):
+                value = drops[f][k]
+                setattr(eyes, "sweat%d%s" % (k + 1, name), int(value) if name == "XPos" else value)
+        return eyes
+
+    def image(self, face):
+        """PIL image of one face."""
+        r = self.load(face)
+        return r._render_image(r._display_list())
+
+    def frame(self, face):
+        """SSD1306 page bytes of one face."""
+        r = self.load(face)
+        if r.backend == "numpy":
+            return bytes(r._render_pages(r._display_list()))
+        return bytes(r._image_to_pages(r._render_image(r._display_list())))
+
+
+# ---------------------------
+# Example / comparison with separate RoboEyes objects
+# ---------------------------
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    frames = 200
+
+    fleet = EyeFleet(count, seed=1)
+    fleet.setAutoblinker(True, interval=2, variation=3)
+    fleet.setIdleMode(True, interval=3, variation=4)
+    fleet.setSweat(True, faces=slice(0, None, 4))
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        fleet.tick()
+    fleet_us = (time.perf_counter() - t0) / frames * 1e6
+
+    faces = [RoboEyes(device=None, monochrome=True, instrumented=False) for _ in range(count)]
+    for i, eyes in enumerate(faces):
+        eyes.setAutoblinker(True, interval=2, variation=3)
+        eyes.setIdleMode(True, interval=3, variation=4)
+        eyes.setSweat(i % 4 == 0)
+    t0 = time.perf_counter()
+    for _ in range(frames):
+        for eyes in faces:
+            eyes._advance_state()
+            eyes._advance_overlays()
+    objects_us = (time.perf_counter() - t0) / frames * 1e6
+    object_bytes = sum(sys.getsizeof(v) for v in vars(faces[0]).values()) + sys.getsizeof(vars(faces[0]))
+
+    print("%d faces, state only (no rendering)" % count)
+    print("EyeFleet:        %8.0f us/tick  %6.0f B/face" % (fleet_us, fleet.nbytes / count))
+    print("RoboEyes x %-4d  %8.0f us/tick  %6.0f B/face (attributes only)" % (count, objects_us, object_bytes))
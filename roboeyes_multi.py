@@ -0,0 +1,316 @@
+# roboeyes_multi.py
+"""
+Drive several RoboEyes faces from one process.
+
+Displays can sit behind a TCA9548A I2C multiplexer (same address on
+different mux channels) and/or on separate I2C buses. A shared scheduler
+renders every face on the calling thread, then hands each bus its batch of
+frames; transfers on one bus run in order (selecting the mux channel
+before each display), different buses transfer in parallel, and the next
+frame is rendered while the previous batch is still on the wire.
+
+    faces = MultiEyes(frame_rate=50)
+    mux, displays = open_displays(port=1, channels=(0, 1, 2))
+    for eyes, channel in displays:
+        faces.add(eyes, bus=1, mux=mux, channel=channel)
+    faces.run()
+
+SimulatedBus / SimulatedMux / SimulatedSSD1306 stand in for the hardware,
+count bytes and transactions and model wire time, so the scheduler can be
+tested and measured without displays (the panel itself is the
+ssd1306_host emulator).
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import roboeyes
+from roboeyes import RoboEyes
+from roboeyes_sim import NullSSD1306
+from ssd1306_host import I2C, SSD1306Panel
+
+try:
+    from luma.core.interface.serial import i2c
+    from luma.oled.device import ssd1306
+    from smbus2 import SMBus
+except Exception:
+    i2c = None
+    ssd1306 = None
+    SMBus = None
+
+TCA9548A_ADDRESS = 0x70
+
+
+class TCA9548A:
+    """TCA9548A 8-channel I2C multiplexer; bus is anything with write_byte(addr, value) (smbus2.SMBus)."""
+
+    def __init__(self, bus, address=TCA9548A_ADDRESS):
+        self.bus = bus
+        self.address = address
+        self.selected = None
+
+    def select(self, channel):
+        """Route the bus to one channel (skipped if it is already selected)."""
+        if channel != self.selected:
+            self.bus.write_byte(self.address, 1 << channel)
+            self.selected = channel
+
+
+def open_displays(port=1, channels=(0, 1), address=0x3C, mux_address=TCA9548A_ADDRESS,
+                  width=128, height=64, mux_bus=None, **eyes_args):
+    """
+    Create one luma i2c serial for the bus and an ssd1306 + RoboEyes per mux channel.
+    mux_bus: what the multiplexer is written through (default: its own smbus2.SMBus(port))
+    Returns (mux, [(eyes, channel), ...]).
+    """
+    serial = i2c(port=port, address=address)
+    mux = TCA9548A(mux_bus if mux_bus is not None else SMBus(port), mux_address)
+    faces = []
+    for channel in channels:
+        # the display initialises itself on construction, so route the bus first
+        mux.select(channel)
+        device = ssd1306(serial, width=width, height=height)
+        faces.append((RoboEyes(device=device, width=width, height=height, **eyes_args), channel))
+    return mux, faces
+
+
+class _Face:
+    """One RoboEyes plus where its display is."""
+
+    def __init__(self, eyes, bus, mux, channel):
+        self.eyes = eyes
+        self.bus = bus
+        self.mux = mux
+        self.channel = channel
+        self.frame = None
+        # RoboEyes hands finished frames to put() instead of sending them
+        eyes.frameSink = self.put
+
+    def put(self, frame):
+        # the numpy backend reuses its page buffer while this frame is on the wire
+        self.frame = bytes(frame) if isinstance(frame, bytearray) else frame
+
+
+class MultiEyes:
+    """Shared frame scheduler for RoboEyes on several displays/buses."""
+
+    def __init__(self, frame_rate=50):
+        self.frameInterval = 1000 // frame_rate
+        self.faces = []
+        self._busLocks = {}
+        self._pool = None
+        self._running = False
+        self.framesRendered = 0
+        self.lateFrames = 0
+        self.droppedFrames = 0
+        self.transfers = 0
+
+    def add(self, eyes, bus=0, mux=None, channel=None):
+        """Drive eyes on bus (any hashable id); mux/channel if the display is behind a TCA9548A."""
+        self.faces.append(_Face(eyes, bus, mux, channel))
+        self._busLocks.setdefault(bus, threading.Lock())
+        return eyes
+
+    def buses(self):
+        return list(self._busLocks)
+
+    # ---------------------------
+    # One frame
+    # ---------------------------
+    def render(self):
+        """Advance every face by one frame; returns {bus: [(face, frame), ...]} of the new frames."""
+        batches = {}
+        for face in self.faces:
+            if not face.eyes.frameDue():
+                continue
+            face.eyes._tick()
+            if face.frame is not None:
+                batches.setdefault(face.bus, []).append((face, face.frame))
+                face.frame = None
+        return batches
+
+    def _send_batch(self, bus, faces):
+        """Send one bus's frames in order, selecting the mux channel for each display."""
+        with self._busLocks[bus]:
+            for face, frame in faces:
+                if face.mux is not None:
+                    face.mux.select(face.channel)
+                face.eyes.transferFrame(frame)
+                self.transfers += 1
+
+    def transfer(self, batches):
+        """Start the transfers of one frame, one task per bus; returns the futures."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=max(1, len(self._busLocks)),
+                                            thread_name_prefix="roboeyes-bus")
+        return [self._pool.submit(self._send_batch, bus, faces) for bus, faces in batches.items()]
+
+    def step(self):
+        """Render and send one frame synchronously (handy for tests)."""
+        for future in self.transfer(self.render()):
+            future.result()
+
+    # ---------------------------
+    # Scheduler
+    # ---------------------------
+    def run(self, duration=None):
+        """
+        Run all faces on absolute frame deadlines until duration (s) or stop().
+        Frame N+1 is rendered while frame N is transferred; when a whole frame
+        behind, missed frames are advanced without rendering (droppedFrames).
+        """
+        self._running = True
+        start = time.monotonic()
+        deadline = start
+        pending = []
+        try:
+            while self._running:
+                now = time.monotonic()
+                if duration is not None and now - start >= duration:
+                    break
+                if now < deadline:
+                    time.sleep(deadline - now)
+                period = self.frameInterval / 1000
+                behind = time.monotonic() - deadline
+                if behind >= period:
+                    missed = int(behind // period)
+                    for face in self.faces:
+                        if not face.eyes.timeBased:
+                            for _ in range(missed):
+                                face.eyes._tick(render=False)
+                    self.droppedFrames += missed
+                    deadline += missed * period
+                    behind -= missed * period
+                if behind > roboeyes.LATE_TOLERANCE:
+                    self.lateFrames += 1
+
+                batches = self.render()
+                # the previous frame must be on the wire before the next one replaces it
+                for future in pending:
+                    future.result()
+                pending = self.transfer(batches)
+                self.framesRendered += 1
+                deadline += period
+        finally:
+            for future in pending:
+                future.result()
+            self._running = False
+
+    def stop(self):
+        self._running = False
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+
+# ---------------------------
+# Hardware stand-ins
+# ---------------------------
+class SimulatedBus(I2C):
+    """
+    I2C bus model with ssd1306_host.I2C's counters and wire time (realtime=True
+    also sleeps for it); refuses overlapping transactions and routes
+    write_byte() to the multiplexers on it.
+    """
+
+    def __init__(self, clock_hz=400000, realtime=False):
+        super().__init__(freq=clock_hz, realtime=realtime)
+        self.muxes = []
+        self._lock = threading.Lock()
+        self._busy = False
+
+    def transaction(self, nbytes):
+        with self._lock:
+            if self._busy:
+                raise RuntimeError("overlapping transactions on one I2C bus")
+            self._busy = True
+        try:
+            return super().transaction(nbytes)
+        finally:
+            self._busy = False
+
+    def write_byte(self, address, value):
+        self.transaction(1)
+        for mux in self.muxes:
+            if mux.address == address:
+                mux._route(value)
+
+
+class SimulatedMux(TCA9548A):
+    """TCA9548A on a SimulatedBus; tracks which channel the hardware has routed."""
+
+    def __init__(self, bus, address=TCA9548A_ADDRESS):
+        super().__init__(bus, address)
+        self.routed = None
+        bus.muxes.append(self)
+
+    def _route(self, value):
+        self.routed = value.bit_length() - 1 if value else None
+
+
+class SimulatedSSD1306(NullSSD1306):
+    """
+    luma-style SSD1306 on a SimulatedBus: counts bytes like NullSSD1306 and
+    decodes them into an ssd1306_host.SSD1306Panel, so its GDDRAM (ram) can
+    be compared with RoboEyes' frames; refuses writes when a mux is routed
+    to another channel.
+    """
+
+    def __init__(self, bus, width=128, height=64, mux=None, channel=None):
+        super().__init__()
+        self.bus = bus
+        self.mux = mux
+        self.channel = channel
+        self.width = width
+        self.height = height
+        self.panel = SSD1306Panel()
+        self.panel.mode = 0  # horizontal addressing, as luma's init leaves it
+
+    @property
+    def ram(self):
+        return self.panel.ram
+
+    def _check_route(self):
+        if self.mux is not None and self.mux.routed != self.channel:
+            raise RuntimeError("display on channel %s written while mux routes %s" % (self.channel, self.mux.routed))
+
+    def command(self, *cmd):
+        self._check_route()
+        self.bus.transaction(len(cmd) + 1)
+        super().command(*cmd)
+        for b in cmd:
+            self.panel.command(b)
+
+    def data(self, data):
+        self._check_route()
+        self.bus.transaction(len(data) + 1)
+        super().data(data)
+        for b in data:
+            self.panel.data(b)
+
+
+# ---------------------------
+# Example usage (main)
+# ---------------------------
+if __name__ == "__main__":
+    # Simulated robot: two buses, three faces behind a mux on bus 1, one on bus 2
+    buses = {1: SimulatedBus(realtime=True), 2: SimulatedBus(realtime=True)}
+    mux = SimulatedMux(buses[1])
+    faces = MultiEyes(frame_rate=50)
+    for channel in (0, 1, 2):
+        dev = SimulatedSSD1306(buses[1], mux=mux, channel=channel)
+        eyes = faces.add(RoboEyes(device=dev, monochrome=True), bus=1, mux=mux, channel=channel)
+        eyes.setAutoblinker(True, interval=2, variation=3)
+        eyes.setIdleMode(True, interval=3, variation=4)
+    eyes = faces.add(RoboEyes(device=SimulatedSSD1306(buses[2]), monochrome=True), bus=2)
+    eyes.setSweat(True)
+
+    faces.run(duration=5)
+    faces.close()
+    print("frames: %d rendered, %d late, %d dropped, %d transfers" % (
+        faces.framesRendered, faces.lateFrames, faces.droppedFrames, faces.transfers))
+    for n, bus in buses.items():
+        print("bus %d: %d transactions, %d bytes, %.3f s on the wire" % (n, bus.transactions, bus.bytes, bus.wire_time))
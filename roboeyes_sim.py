@@ -0,0 +1,39 @@
+# roboeyes_sim.py
+"""
+Stand-ins for running RoboEyes without hardware or wall-clock time: a
+virtual millis() clock and an SSD1306 device that only counts bytes. Used
+by the benchmark, clip compiling and the multi-display simulation.
+
+    clock = VirtualClock()
+    eyes = RoboEyes(device=NullSSD1306(), clock=clock, monochrome=True)
+    clock.advance(eyes.frameInterval)
+"""
+
+
+class VirtualClock:
+    """millis() stand-in that only moves when advanced."""
+
+    def __init__(self, start=0):
+        self.now = start
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, ms):
+        self.now += ms
+
+
+class NullSSD1306:
+    """Device stand-in that takes SSD1306 commands/data and only counts bytes."""
+    mode = "1"
+    rotate = 0
+
+    def __init__(self):
+        self.commandBytes = 0
+        self.dataBytes = 0
+
+    def command(self, *cmd):
+        self.commandBytes += len(cmd)
+
+    def data(self, data):
+        self.dataBytes += len(data)
@@ -1,7 +1,14 @@
 #MicroPython SSD1306 OLED driver, I2C and SPI interfaces created by Adafruit
 
-import time
+try:
+    import utime as time
+except ImportError:
+    import time
 import framebuf
+try:
+    import _thread
+except ImportError:
+    _thread = None
 
 # register definitions
 SET_CONTRAST        = const(0x81)
@@ -21,6 +28,23 @@ SET_DISP_CLK_DIV    = const(0xd5)
 SET_PRECHARGE       = const(0xd9)
 SET_VCOM_DESEL      = const(0xdb)
 SET_CHARGE_PUMP     = const(0x8d)
+SET_HSCROLL         = const(0x26)
+SET_VHSCROLL        = const(0x29)
+SET_SCROLL_OFF      = const(0x2e)
+SET_SCROLL_ON       = const(0x2f)
+SET_VSCROLL_AREA    = const(0xa3)
+
+# scroll step interval in frames -> the 3-bit code the panel takes
+SCROLL_FRAMES = {5: 0, 64: 1, 128: 2, 256: 3, 3: 4, 4: 5, 25: 6, 2: 7}
+
+# commands queued with queue_cmd() go out in one transaction; a full queue
+# is flushed on its own
+CMD_QUEUE_SIZE      = const(32)
+
+# show(partial=True) merges the dirty spans of neighbouring pages into one
+# window when the extra bytes cost less than addressing another window
+# (the window commands and the start of a transaction, in bytes)
+WINDOW_OVERHEAD = 16
 
 
 class SSD1306:
@@ -29,15 +53,26 @@ class SSD1306:
         self.height = height
         self.external_vcc = external_vcc
         self.pages = self.height // 8
-        # Note the subclass must initialize self.framebuf to a framebuffer.
+        # Note the subclass must initialize self.framebuf to a framebuffer and
+        # self.view to a memoryview of its bytes.
         # This is necessary because the underlying data buffer is different
         # between I2C and SPI implementations (I2C needs an extra byte).
+        # Per page dirty column span dirty_lo..dirty_hi; lo > hi means clean.
+        self.dirty_lo = bytearray(self.pages)
+        self.dirty_hi = bytearray(self.pages)
+        self.clean()
+        self.cmd_queue = bytearray(CMD_QUEUE_SIZE)
+        self.cmd_count = 0
+        # (p0, p1, top, rows) of a running hardware scroll, and the start line
+        self.scrolled = None
+        self.line = 0
         self.poweron()
         self.init_display()
 
     def init_display(self):
         for cmd in (
             SET_DISP | 0x00, # off
+            SET_SCROLL_OFF, # a reset doesn't stop a running scroll
             # address setting
             SET_MEM_ADDR, 0x00, # horizontal
             # resolution and layout
@@ -58,46 +93,185 @@ class SSD1306:
             # charge pump
             SET_CHARGE_PUMP, 0x10 if self.external_vcc else 0x14,
             SET_DISP | 0x01): # on
-            self.write_cmd(cmd)
+            self.queue_cmd(cmd)
+        self.flush_cmds()
         self.fill(0)
         self.show()
 
+    def queue_cmd(self, cmd):
+        if self.cmd_count == CMD_QUEUE_SIZE:
+            self.flush_cmds()
+        self.cmd_queue[self.cmd_count] = cmd
+        self.cmd_count += 1
+
+    def flush_cmds(self):
+        if self.cmd_count:
+            self.write_cmds(memoryview(self.cmd_queue)[:self.cmd_count])
+            self.cmd_count = 0
+
     def poweroff(self):
         self.write_cmd(SET_DISP | 0x00)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self.queue_cmd(SET_CONTRAST)
+        self.queue_cmd(contrast)
+        self.flush_cmds()
 
     def invert(self, invert):
         self.write_cmd(SET_NORM_INV | (invert & 1))
 
-    def show(self):
-        x0 = 0
-        x1 = self.width - 1
-        if self.width == 64:
-            # displays with width of 64 pixels are shifted by 32
-            x0 += 32
-            x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_framebuf()
+    # Hardware scrolling: the panel moves GDDRAM itself, no data is sent.
+    def scroll_start(self, direction=1, p0=0, p1=None, frames=5, dy=0, top=0, rows=None):
+        # Scroll pages p0..p1 one column every `frames` frames (2, 3, 4, 5,
+        # 25, 64, 128 or 256), to the right for direction 1, left for -1.
+        # dy makes it diagonal: also dy rows up per step within rows
+        # top..top+rows-1. GDDRAM drifts from the framebuffer until
+        # scroll_stop(); show() stops the scroll first, as the panel can't
+        # take writes while it scrolls.
+        if p1 is None:
+            p1 = self.pages - 1
+        if frames not in SCROLL_FRAMES:
+            raise ValueError("frames must be one of %s" % sorted(SCROLL_FRAMES))
+        if self.scrolled is not None:
+            self.scroll_stop()
+        left = 1 if direction < 0 else 0
+        if dy:
+            if rows is None:
+                rows = self.height - top
+            for cmd in (SET_VSCROLL_AREA, top, rows,
+                        SET_VHSCROLL + left, 0x00, p0, SCROLL_FRAMES[frames], p1, dy):
+                self.queue_cmd(cmd)
+        else:
+            rows = 0
+            for cmd in (SET_HSCROLL + left, 0x00, p0, SCROLL_FRAMES[frames], p1, 0x00, 0xff):
+                self.queue_cmd(cmd)
+        self.queue_cmd(SET_SCROLL_ON)
+        self.flush_cmds()
+        self.scrolled = (p0, p1, top, rows)
+
+    def scroll_stop(self):
+        # the scrolled region is rewritten from the framebuffer at the next
+        # show(), partial or not
+        if self.scrolled is None:
+            return
+        p0, p1, top, rows = self.scrolled
+        self.scrolled = None
+        self.queue_cmd(SET_SCROLL_OFF)
+        if rows:
+            for cmd in (SET_VSCROLL_AREA, 0, self.height, SET_DISP_START_LINE | self.line):
+                self.queue_cmd(cmd)
+        self.flush_cmds()
+        self.mark_dirty(0, p0 * 8, self.width, (p1 - p0 + 1) * 8)
+        if rows:
+            self.mark_dirty(0, top, self.width, rows)
+
+    def start_line(self, line):
+        # Pan: screen row 0 shows GDDRAM row `line`. The framebuffer keeps
+        # GDDRAM's layout, so partial updates stay where they are; draw
+        # at ram_row(y) for screen row y. GDDRAM has 64 rows, so panning
+        # wraps seamlessly only on 64 row panels.
+        self.line = line % 64
+        self.write_cmd(SET_DISP_START_LINE | self.line)
+
+    def ram_row(self, y):
+        return (y + self.line) % 64
+
+    def show(self, partial=False):
+        # partial: only send the columns changed since the last show()
+        if self.scrolled is not None:
+            self.scroll_stop()
+        self.flush_cmds()
+        self.send(self.view, self.dirty_lo, self.dirty_hi, partial)
+        self.clean()
+
+    def show_window(self, x0, x1, p0, p1):
+        # send columns x0..x1 of pages p0..p1 now, besides the dirty spans:
+        # for drawing whose changes come in runs that one span per page
+        # would join
+        if self.scrolled is not None:
+            self.scroll_stop()
+        self.flush_cmds()
+        width = self.width
+        shift = 32 if width == 64 else 0
+        view = self.view
+        self.write_window(x0 + shift, x1 + shift, p0, p1,
+                          [view[p * width + x0:p * width + x1 + 1] for p in range(p0, p1 + 1)])
+
+    def send(self, view, lo, hi, partial):
+        width = self.width
+        # displays with width of 64 pixels are shifted by 32
+        shift = 32 if width == 64 else 0
+        if not partial:
+            self.write_window(shift, shift + width - 1, 0, self.pages - 1, [view])
+            return
+        page = 0
+        while page < self.pages:
+            if lo[page] > hi[page]:
+                page += 1
+                continue
+            x0 = lo[page]
+            x1 = hi[page]
+            last = page
+            # take in the next page if one window costs less than two
+            while last + 1 < self.pages and lo[last + 1] <= hi[last + 1]:
+                n0 = min(x0, lo[last + 1])
+                n1 = max(x1, hi[last + 1])
+                merged = (last + 2 - page) * (n1 - n0 + 1)
+                separate = (last + 1 - page) * (x1 - x0 + 1) + hi[last + 1] - lo[last + 1] + 1 + WINDOW_OVERHEAD
+                if merged > separate:
+                    break
+                x0 = n0
+                x1 = n1
+                last += 1
+            if x0 == 0 and x1 == width - 1:
+                bufs = [view[page * width:(last + 1) * width]]
+            else:
+                bufs = [view[p * width + x0:p * width + x1 + 1] for p in range(page, last + 1)]
+            self.write_window(x0 + shift, x1 + shift, page, last, bufs)
+            page = last + 1
+
+    def clean(self):
+        for page in range(self.pages):
+            self.dirty_lo[page] = 0xff
+            self.dirty_hi[page] = 0
+
+    def mark_dirty(self, x, y, w, h):
+        # for drawing done on self.framebuf directly
+        x0 = max(x, 0)
+        x1 = min(x + w, self.width) - 1
+        y0 = max(y, 0)
+        y1 = min(y + h, self.height) - 1
+        if x0 > x1 or y0 > y1:
+            return
+        lo = self.dirty_lo
+        hi = self.dirty_hi
+        for page in range(y0 >> 3, (y1 >> 3) + 1):
+            if x0 < lo[page]:
+                lo[page] = x0
+            if x1 > hi[page]:
+                hi[page] = x1
 
     def fill(self, col):
         self.framebuf.fill(col)
+        self.mark_dirty(0, 0, self.width, self.height)
 
     def pixel(self, x, y, col):
         self.framebuf.pixel(x, y, col)
+        if 0 <= x < self.width and 0 <= y < self.height:
+            page = y >> 3
+            if x < self.dirty_lo[page]:
+                self.dirty_lo[page] = x
+            if x > self.dirty_hi[page]:
+                self.dirty_hi[page] = x
 
     def scroll(self, dx, dy):
         self.framebuf.scroll(dx, dy)
+        self.mark_dirty(0, 0, self.width, self.height)
 
     def text(self, string, x, y, col=1):
         self.framebuf.text(string, x, y, col)
+        # 8x8 font
+        self.mark_dirty(x, y, 8 * len(string), 8)
 
 
 class SSD1306_I2C(SSD1306):
@@ -105,6 +279,10 @@ class SSD1306_I2C(SSD1306):
         self.i2c = i2c
         self.addr = addr
         self.temp = bytearray(2)
+        # a window in one transaction: Co=1 before each command byte, then
+        # Co=0, D/C#=1 and the data
+        self.window_cmd = bytearray((0x80, SET_COL_ADDR, 0x80, 0, 0x80, 0,
+                                     0x80, SET_PAGE_ADDR, 0x80, 0, 0x80, 0, 0x40))
         # Add an extra byte to the data buffer to hold an I2C data/command byte
         # to use hardware-compatible I2C transactions.  A memoryview of the
         # buffer is used to mask this byte from the framebuffer operations
@@ -112,10 +290,13 @@ class SSD1306_I2C(SSD1306):
         # buffer).
         self.buffer = bytearray(((height // 8) * width) + 1)
         self.buffer[0] = 0x40  # Set first byte of data buffer to Co=0, D/C=1
-        self.framebuf = framebuf.FrameBuffer1(memoryview(self.buffer)[1:], width, height)
+        self.view = memoryview(self.buffer)[1:]
+        self.framebuf = framebuf.FrameBuffer1(self.view, width, height)
         super().__init__(width, height, external_vcc)
 
     def write_cmd(self, cmd):
+        # queued commands go first, or this one would overtake them
+        self.flush_cmds()
         self.temp[0] = 0x80 # Co=1, D/C#=0
         self.temp[1] = cmd
         self.i2c.writeto(self.addr, self.temp)
@@ -125,12 +306,25 @@ class SSD1306_I2C(SSD1306):
         # hardware I2C interfaces.
         self.i2c.writeto(self.addr, self.buffer)
 
+    def write_cmds(self, cmds):
+        # Co=0, D/C#=0: every following byte is a command
+        self.i2c.writevto(self.addr, (b"\x00", cmds))
+
+    def write_window(self, x0, x1, p0, p1, bufs):
+        w = self.window_cmd
+        w[3] = x0
+        w[5] = x1
+        w[9] = p0
+        w[11] = p1
+        self.i2c.writevto(self.addr, [w] + bufs)
+
     def poweron(self):
         pass
 
 
 class SSD1306_SPI(SSD1306):
-    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False):
+    def __init__(self, width, height, spi, dc, res, cs, external_vcc=False,
+                 shared=False, double_buffer=False):
         self.rate = 10 * 1024 * 1024
         dc.init(dc.OUT, value=0)
         res.init(res.OUT, value=0)
@@ -139,21 +333,56 @@ class SSD1306_SPI(SSD1306):
         self.dc = dc
         self.res = res
         self.cs = cs
+        # the bus is configured once; shared=True if other devices on it
+        # change the settings, to configure it again before every transfer
+        self.shared = shared
+        spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.cmd = bytearray(1)
+        self.window_cmd = bytearray((SET_COL_ADDR, 0, 0, SET_PAGE_ADDR, 0, 0))
         self.buffer = bytearray((height // 8) * width)
-        self.framebuf = framebuf.FrameBuffer1(self.buffer, width, height)
+        self.view = memoryview(self.buffer)
+        self.framebuf = framebuf.FrameBuffer1(self.view, width, height)
+        self.double_buffer = False
         super().__init__(width, height, external_vcc)
+        if double_buffer:
+            self.start_double_buffer()
 
     def write_cmd(self, cmd):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        # queued commands go first, or this one would overtake them
+        self.flush_cmds()
+        self.cmd[0] = cmd
+        self.write_cmds(self.cmd)
+
+    def write_cmds(self, cmds):
+        if self.double_buffer:
+            self.wait()
+        if self.shared:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
+        self.dc.low()
+        self.cs.low()
+        self.spi.write(cmds)
         self.cs.high()
+
+    def write_window(self, x0, x1, p0, p1, bufs):
+        # window commands and data in one CS frame, D/C# switched in between
+        w = self.window_cmd
+        w[1] = x0
+        w[2] = x1
+        w[4] = p0
+        w[5] = p1
+        if self.shared:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.dc.low()
         self.cs.low()
-        self.spi.write(bytearray([cmd]))
+        self.spi.write(w)
+        self.dc.high()
+        for buf in bufs:
+            self.spi.write(buf)
         self.cs.high()
 
     def write_framebuf(self):
-        self.spi.init(baudrate=self.rate, polarity=0, phase=0)
-        self.cs.high()
+        if self.shared:
+            self.spi.init(baudrate=self.rate, polarity=0, phase=0)
         self.dc.high()
         self.cs.low()
         self.spi.write(self.buffer)
@@ -165,3 +394,75 @@ class SSD1306_SPI(SSD1306):
         self.res.low()
         time.sleep_ms(10)
         self.res.high()
+
+    # Double buffering: show() hands the frame to a thread that clocks it
+    # out, and drawing goes on in a copy of it in the other buffer. The
+    # threads only hand over through self.sending (locks can't be released
+    # by another thread on every port).
+    def start_double_buffer(self):
+        if _thread is None:
+            raise OSError("double buffering needs _thread")
+        if self.double_buffer:
+            return
+        self.buffers = (self.buffer, bytearray(len(self.buffer)))
+        self.views = (self.view, memoryview(self.buffers[1]))
+        self.framebufs = (self.framebuf, framebuf.FrameBuffer1(self.views[1], self.width, self.height))
+        self.drawing = 0
+        self.sending = None
+        self.send_lo = bytearray(self.pages)
+        self.send_hi = bytearray(self.pages)
+        self.send_partial = False
+        self.send_error = None
+        self.double_buffer = True
+        _thread.start_new_thread(self.sender, ())
+
+    def stop_double_buffer(self):
+        if self.double_buffer:
+            self.wait()
+            self.double_buffer = False
+
+    def wait(self):
+        # until the frame being clocked out is done
+        while self.sending is not None:
+            time.sleep_ms(0)
+        if self.send_error is not None:
+            e, self.send_error = self.send_error, None
+            raise e
+
+    def show(self, partial=False):
+        if not self.double_buffer:
+            super().show(partial)
+            return
+        if self.scrolled is not None:
+            self.scroll_stop()
+        self.flush_cmds()
+        self.wait()
+        self.send_lo[:] = self.dirty_lo
+        self.send_hi[:] = self.dirty_hi
+        self.send_partial = partial
+        sending = self.view
+        self.drawing ^= 1
+        self.buffer = self.buffers[self.drawing]
+        self.view = self.views[self.drawing]
+        self.framebuf = self.framebufs[self.drawing]
+        self.view[:] = sending
+        self.clean()
+        self.sending = sending
+
+    def show_window(self, x0, x1, p0, p1):
+        if self.double_buffer:
+            # the sender thread uses the bus and window_cmd
+            self.wait()
+        super().show_window(x0, x1, p0, p1)
+
+    def sender(self):
+        while self.double_buffer:
+            sending = self.sending
+            if sending is None:
+                time.sleep_ms(1)
+                continue
+            try:
+                self.send(sending, self.send_lo, self.send_hi, self.send_partial)
+            except Exception as e:
+                self.send_error = e
+            self.sending = None
@@ -0,0 +1,259 @@
+# ssd1306_atlas.py
+"""
+Sprite sheets and large-font glyph atlases for ssd1306.py, pre-packed in
+the display's page format (bytes of 8 vertical pixels, LSB at the top) so
+drawing them is mostly byte copies into the framebuffer instead of pixel()
+calls.
+
+    import ssd1306_atlas
+    font = ssd1306_atlas.Atlas("font24.oatl")
+    font.text(oled, "21.5C", 0, 8)    # marks the area dirty for show(partial=True)
+    oled.show(partial=True)
+
+Sprites drawn at a y that is a multiple of 8 in COPY mode are slice copies
+per page; other positions shift each byte into two pages, OR mode only
+sets ink pixels (transparent background).
+
+Layout (little endian):
+    header  magic "OATL", version u8, 1 reserved byte, count u16, first u16
+    index   count x (offset u32, width u8, height u8, 2 reserved bytes)
+    data    per entry ceil(height / 8) pages of width bytes
+
+Fonts map char code first + i to entry i; a glyph's width includes the
+space after it, and width 0 marks a missing char. The reader also runs on
+MicroPython; the builder (font/sheet/info below) needs Pillow on the host:
+    python3 ssd1306_atlas.py font -o font24.oatl --size 24 --chars " -Z"
+    python3 ssd1306_atlas.py sheet icons.png --tile 16x16 -o icons.oatl
+    python3 ssd1306_atlas.py info font24.oatl
+"""
+
+import struct
+
+MAGIC = b"OATL"
+VERSION = 1
+HEADER = "<4sBxHH"
+ENTRY = "<IBB2x"
+HEADER_SIZE = struct.calcsize(HEADER)
+ENTRY_SIZE = struct.calcsize(ENTRY)
+
+# blit modes
+COPY = 0  # sprite pixels replace the framebuffer's, background included
+OR = 1    # only the sprite's set pixels are drawn
+
+
+class Atlas:
+    """An .oatl file loaded into memory; entries are blitted into an SSD1306's framebuffer."""
+
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, self.count, self.first = struct.unpack_from(HEADER, data, 0)
+        if magic != MAGIC:
+            raise ValueError("%s is not an .oatl file" % path)
+        if version != VERSION:
+            raise ValueError("%s: unsupported .oatl version %d" % (path, version))
+        self.entries = [struct.unpack_from(ENTRY, data, HEADER_SIZE + i * ENTRY_SIZE) for i in range(self.count)]
+        self.data = memoryview(data)
+        self.height = max([e[2] for e in self.entries] or [0])
+
+    def __len__(self):
+        return self.count
+
+    def size(self, i):
+        return self.entries[i][1], self.entries[i][2]
+
+    def blit(self, oled, i, x, y, mode=COPY):
+        """Draw entry i with its top left at (x, y); returns its width."""
+        offset, w, h = self.entries[i]
+        buf = oled.view
+        stride = oled.width
+        c0 = max(0, -x)
+        c1 = min(w, stride - x)
+        if c0 >= c1 or y >= oled.height or y + h <= 0:
+            return w
+        data = self.data
+        shift = y & 7
+        page0 = y >> 3
+        for p in range((h + 7) >> 3):
+            src = offset + p * w
+            rows = min(8, h - p * 8)
+            mask = (1 << rows) - 1
+            top = page0 + p
+            if shift == 0:
+                if not 0 <= top < oled.pages:
+                    continue
+                dst = top * stride + x
+                if mode == COPY and rows == 8:
+                    # byte-aligned fast path
+                    buf[dst + c0:dst + c1] = data[src + c0:src + c1]
+                elif mode == COPY:
+                    for c in range(c0, c1):
+                        buf[dst + c] = buf[dst + c] & ~mask | data[src + c]
+                else:
+                    for c in range(c0, c1):
+                        buf[dst + c] |= data[src + c]
+                continue
+            # unaligned: each byte straddles this page and the next
+            lo_mask = (mask << shift) & 0xff
+            hi_mask = mask >> (8 - shift)
+            lo = top * stride + x if 0 <= top < oled.pages else None
+            hi = (top + 1) * stride + x if hi_mask and 0 <= top + 1 < oled.pages else None
+            for c in range(c0, c1):
+                b = data[src + c]
+                if lo is not None:
+                    if mode == COPY:
+                        buf[lo + c] = buf[lo + c] & ~lo_mask | (b << shift) & 0xff
+                    else:
+                        buf[lo + c] |= (b << shift) & 0xff
+                if hi is not None:
+                    if mode == COPY:
+                        buf[hi + c] = buf[hi + c] & ~hi_mask | b >> (8 - shift)
+                    else:
+                        buf[hi + c] |= b >> (8 - shift)
+        oled.mark_dirty(x, y, w, h)
+        return w
+
+    def glyph(self, ch):
+        """Entry index of a char, or None if the atlas doesn't have it."""
+        i = ord(ch) - self.first
+        if 0 <= i < self.count and self.entries[i][1]:
+            return i
+        return None
+
+    def text(self, oled, s, x, y, mode=COPY):
+        """Draw s with the atlas as a font; returns the x after the last char."""
+        for ch in s:
+            i = self.glyph(ch)
+            if i is not None:
+                x += self.blit(oled, i, x, y, mode)
+        return x
+
+    def text_width(self, s):
+        width = 0
+        for ch in s:
+            i = self.glyph(ch)
+            if i is not None:
+                width += self.entries[i][1]
+        return width
+
+
+# ---------------------------
+# Builder (host side, Pillow)
+# ---------------------------
+def pack(img):
+    """PIL image -> page format bytes (pixels != 0 are set)."""
+    img = img.convert("L")
+    w, h = img.size
+    out = bytearray(((h + 7) // 8) * w)
+    px = img.load()
+    for y in range(h):
+        for x in range(w):
+            if px[x, y]:
+                out[(y // 8) * w + x] |= 1 << (y % 8)
+    return bytes(out)
+
+
+def write(path, images, first=0):
+    """Write PIL images (None for a missing entry) as an .oatl file, entry i for char first + i."""
+    entries = []
+    data = bytearray()
+    offset = HEADER_SIZE + ENTRY_SIZE * len(images)
+    for i, img in enumerate(images):
+        if img is None:
+            entries.append((offset + len(data), 0, 0))
+            continue
+        if img.width > 255 or img.height > 255:
+            raise ValueError("entry %d is %dx%d, at most 255x255 fits" % (i, img.width, img.height))
+        entries.append((offset + len(data), img.width, img.height))
+        data += pack(img)
+    with open(path, "wb") as f:
+        f.write(struct.pack(HEADER, MAGIC, VERSION, len(images), first))
+        for entry in entries:
+            f.write(struct.pack(ENTRY, *entry))
+        f.write(data)
+
+
+def font_images(font, first, last, spacing=1):
+    """
+    Glyph images for chars first..last of a PIL font: one line box for all
+    (padded to whole pages, so COPY blits at aligned y are byte copies),
+    glyph width = advance + spacing.
+    """
+    from PIL import Image, ImageDraw
+
+    chars = [chr(c) for c in range(first, last + 1)]
+    boxes = [font.getbbox(ch) for ch in chars]
+    top = min(b[1] for b in boxes if b[3] > b[1])
+    bottom = max(b[3] for b in boxes if b[3] > b[1])
+    height = (bottom - top + 7) // 8 * 8
+    images = []
+    for ch, box in zip(chars, boxes):
+        width = max(int(round(font.getlength(ch))), box[2]) + spacing
+        img = Image.new("1", (width, height))
+        draw = ImageDraw.Draw(img)
+        draw.fontmode = "1"
+        draw.text((0, -top), ch, font=font, fill=1)
+        images.append(img)
+    return images
+
+
+def sheet_images(path, tile_w, tile_h):
+    """Tiles of a sprite sheet, row by row."""
+    from PIL import Image
+
+    with Image.open(path) as sheet:
+        sheet = sheet.convert("L")
+        return [sheet.crop((x, y, x + tile_w, y + tile_h))
+                for y in range(0, sheet.height - tile_h + 1, tile_h)
+                for x in range(0, sheet.width - tile_w + 1, tile_w)]
+
+
+def main(argv=None):
+    import argparse
+
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = ap.add_subparsers(dest="command", required=True)
+    font = sub.add_parser("font", help="build a glyph atlas from a TrueType font")
+    font.add_argument("-o", "--output", required=True)
+    font.add_argument("--font", help="TrueType font file (default: Pillow's built-in font)")
+    font.add_argument("--size", type=int, default=24)
+    font.add_argument("--chars", default=" -Z", help="char range first-last (default ' -Z')")
+    font.add_argument("--spacing", type=int, default=1)
+    sheet = sub.add_parser("sheet", help="build a sprite atlas from a sprite sheet image")
+    sheet.add_argument("path")
+    sheet.add_argument("-o", "--output", required=True)
+    sheet.add_argument("--tile", required=True, help="tile size WxH")
+    info = sub.add_parser("info", help="describe an .oatl file")
+    info.add_argument("path")
+    args = ap.parse_args(argv)
+
+    if args.command == "info":
+        atlas = Atlas(args.path)
+        present = [e for e in atlas.entries if e[1]]
+        print("%s: %d entries (%d present), first char %d, height %d, %d bytes" % (
+            args.path, len(atlas), len(present), atlas.first, atlas.height, len(atlas.data)))
+        return 0
+
+    if args.command == "font":
+        from PIL import ImageFont
+
+        if len(args.chars) != 3 or args.chars[1] != "-":
+            ap.error("--chars takes a range like ' -Z'")
+        if args.font:
+            pil_font = ImageFont.truetype(args.font, args.size)
+        else:
+            pil_font = ImageFont.load_default(args.size)
+        first, last = ord(args.chars[0]), ord(args.chars[2])
+        images = font_images(pil_font, first, last, args.spacing)
+    else:
+        first = 0
+        tile_w, tile_h = (int(v) for v in args.tile.lower().split("x"))
+        images = sheet_images(args.path, tile_w, tile_h)
+    write(args.output, images, first)
+    print("%s: %d entries" % (args.output, len(images)))
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
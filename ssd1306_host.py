@@ -0,0 +1,544 @@
+# ssd1306_host.py
+"""
+Run ssd1306.py on CPython: a framebuf.FrameBuffer1 stand-in, Pin/I2C/SPI
+buses that count transactions, bytes and wire time, and an emulated SSD1306
+panel with its GDDRAM, so driver changes can be measured and checked pixel
+by pixel on a PC or in CI.
+
+    import ssd1306_host
+    ssd1306_host.install()          # framebuf, machine, utime, const()
+    import ssd1306
+
+    i2c = ssd1306_host.I2C(freq=400000)
+    panel = ssd1306_host.SSD1306Panel(i2c=i2c)
+    oled = ssd1306.SSD1306_I2C(128, 64, i2c)
+    oled.text("21.5C", 0, 0)
+    oled.show(partial=True)
+    assert panel.matches(oled.framebuf)
+    print(i2c.transactions, i2c.bytes, i2c.wire_time)
+
+text() uses a stand-in 8x8 font (not MicroPython's glyphs); it covers the
+same 8x8 cells, so byte counts and dirty spans are the same as on the board.
+"""
+
+import builtins
+import sys
+import time
+import types
+
+MONO_VLSB = 0
+
+# 8x8 font for chars 32..127, one byte per column, LSB at the top
+FONT = bytes.fromhex(
+    "0000000000000000005e5e0000000000000e000e0000000024ff24ff24000000"
+    "666fcd7d3b00000027157f5472000000745e7a72500000000004030100000000"
+    "003c7e810000000000817e3c000000000a06070a0000000008083e0808000000"
+    "0000c040000000000808080808000000004040000000000000c0300c03000000"
+    "3e7f417f3e00000042427f7f404000006273596f66000000226b497f36000000"
+    "181c127f7f1000006f4f457d390000003e7f497b320000000363791f07000000"
+    "367f497f36000000266f497f3e000000004848000000000000c8480000000000"
+    "081c36220000000014141414000000000022361c0800000004525a0e04000000"
+    "7ec399a53e200000727e167e704000007e7e4a7e340000003c7e426626000000"
+    "7e7e427e3c0000007e7e4a6a620000007e7e4a0a020000003c7e527674000000"
+    "7e7e087e7e420000427e7e420000000070427e3e020000007e7e583662400000"
+    "7e7e4260600000007e1c701c7e0000007e7e0c327e0200003c7e427e3c000000"
+    "7e7e521e0c0000003c7e42febc0000007e7e523e6c4000006c4e5a7a36000000"
+    "427e7e42060000003e7e407e3e020000063e703e060200001e703e701e020000"
+    "42663c3c66420000064e78784e06000066765a6e6600000000ffff8100000000"
+    "030c30c0000000000081ffff0000000004060306040000000000000000000000"
+    "0001030400000000687c547c784000007f7f447c38000000387c446c28000000"
+    "387c457f7f400000387c545c58000000447e7f4545000000387c44f8fc040000"
+    "7f7f047c7800000044447d7d404000000404fdfd000000007f7f386c44400000"
+    "41417f7f404000007c0c7c0c780000007c78047c78000000387c447c38000000"
+    "fcfc447c38000000387c44f8fc040000447c784c040c0000485c5c7474200000"
+    "043f7f44642000003c7c407c7c4000000c3c703c0c0000001c703c703c040000"
+    "446c3c786c4400001cfcc07c1c0400006c745c6c6400000000087ef781000000"
+    "0000fe000000000081f77e080000000008040c0804000000ffffffffffffff00"
+)
+
+
+# ---------------------------
+# framebuf
+# ---------------------------
+class FrameBuffer:
+    """MONO_VLSB framebuf.FrameBuffer: bytes are 8 pixel columns, pages of 8 rows."""
+
+    def __init__(self, buf, width, height, format=MONO_VLSB, stride=None):
+        if format != MONO_VLSB:
+            raise ValueError("only MONO_VLSB is emulated")
+        self.buf = buf
+        self.width = width
+        self.height = height
+        self.stride = width if stride is None else stride
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        i = (y >> 3) * self.stride + x
+        bit = 1 << (y & 7)
+        if c is None:
+            return 1 if self.buf[i] & bit else 0
+        if c:
+            self.buf[i] |= bit
+        else:
+            self.buf[i] &= ~bit & 0xff
+
+    def fill_rect(self, x, y, w, h, c):
+        x0 = max(x, 0)
+        x1 = min(x + w, self.width)
+        y0 = max(y, 0)
+        y1 = min(y + h, self.height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        for page in range(y0 >> 3, ((y1 - 1) >> 3) + 1):
+            top = max(y0 - page * 8, 0)
+            bottom = min(y1 - page * 8, 8)
+            mask = ((1 << bottom) - 1) & ~((1 << top) - 1)
+            row = page * self.stride
+            for i in range(row + x0, row + x1):
+                if c:
+                    self.buf[i] |= mask
+                else:
+                    self.buf[i] &= ~mask & 0xff
+
+    def fill(self, c):
+        self.fill_rect(0, 0, self.width, self.height, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                return
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def text(self, s, x, y, c=1):
+        for ch in s:
+            code = ord(ch)
+            if not 32 <= code <= 127:
+                code = 127
+            glyph = FONT[(code - 32) * 8:(code - 31) * 8]
+            for j, column in enumerate(glyph):
+                for r in range(8):
+                    if column >> r & 1:
+                        self.pixel(x + j, y + r, c)
+            x += 8
+
+    def scroll(self, xstep, ystep):
+        # like MicroPython, the uncovered area keeps its old pixels
+        old = [[self.pixel(x, y) for x in range(self.width)] for y in range(self.height)]
+        for y in range(self.height):
+            for x in range(self.width):
+                sx = x - xstep
+                sy = y - ystep
+                if 0 <= sx < self.width and 0 <= sy < self.height:
+                    self.pixel(x, y, old[sy][sx])
+
+    def blit(self, fbuf, x, y, key=-1, palette=None):
+        for sy in range(fbuf.height):
+            for sx in range(fbuf.width):
+                c = fbuf.pixel(sx, sy)
+                if palette is not None:
+                    c = palette.pixel(c, 0)
+                if c != key:
+                    self.pixel(x + sx, y + sy, c)
+
+
+def FrameBuffer1(buf, width, height, stride=None):
+    return FrameBuffer(buf, width, height, MONO_VLSB, stride)
+
+
+# ---------------------------
+# machine
+# ---------------------------
+class Pin:
+    IN = 0
+    OUT = 1
+
+    def __init__(self, id=None, mode=-1, value=None):
+        self.id = id
+        self._value = 0 if value is None else value
+        self.listeners = []
+
+    def init(self, mode=-1, value=None):
+        if value is not None:
+            self.value(value)
+
+    def value(self, v=None):
+        if v is None:
+            return self._value
+        self._value = 1 if v else 0
+        for listener in self.listeners:
+            listener(self)
+
+    def __call__(self, v=None):
+        return self.value(v)
+
+    def high(self):
+        self.value(1)
+
+    def low(self):
+        self.value(0)
+
+    on = high
+    off = low
+
+
+class ADC:
+    """ADC input; read_u16() returns .value (set it to feed a reading)."""
+
+    def __init__(self, id=0, value=0):
+        self.id = id
+        self.value = value
+
+    def read_u16(self):
+        return self.value
+
+
+class PWM:
+    """PWM output; keeps the last frequency and duty set."""
+
+    def __init__(self, pin, freq=0, duty_u16=0):
+        self.pin = pin
+        self._freq = freq
+        self._duty = duty_u16
+
+    def freq(self, value=None):
+        if value is None:
+            return self._freq
+        self._freq = value
+
+    def duty_u16(self, value=None):
+        if value is None:
+            return self._duty
+        self._duty = value
+
+    def deinit(self):
+        self._duty = 0
+
+
+class I2C:
+    """
+    I2C bus: write transactions go to the device attached at the address.
+    Wire time per transaction: 9 bits per byte (address + data) plus start
+    and stop, at freq Hz; realtime=True also sleeps for it.
+    """
+
+    def __init__(self, id=0, scl=None, sda=None, freq=400000, realtime=False):
+        self.freq = freq
+        self.realtime = realtime
+        self.devices = {}
+        self.reset()
+
+    def reset(self):
+        self.transactions = 0
+        self.bytes = 0
+        self.wire_time = 0.0
+
+    def attach(self, addr, device):
+        self.devices[addr] = device
+
+    def scan(self):
+        return sorted(self.devices)
+
+    def transaction(self, nbytes):
+        """Count one write of nbytes after the address byte; returns its wire time (s)."""
+        seconds = ((nbytes + 1) * 9 + 2) / self.freq
+        self.transactions += 1
+        self.bytes += nbytes
+        self.wire_time += seconds
+        if self.realtime:
+            time.sleep(seconds)
+        return seconds
+
+    def writevto(self, addr, vector, stop=True):
+        data = b"".join(bytes(buf) for buf in vector)
+        self.transaction(len(data))
+        if addr not in self.devices:
+            raise OSError(19, "ENODEV")
+        self.devices[addr].i2c_write(data)
+
+    def writeto(self, addr, buf, stop=True):
+        self.writevto(addr, (buf,), stop)
+
+
+class SPI:
+    """
+    SPI bus: bytes go to the attached devices whose CS pin is low. Counts
+    init() calls, write() calls, CS frames and bytes; wire time is 8 bits
+    per byte at baudrate.
+    """
+
+    def __init__(self, id=0, baudrate=1000000, realtime=False, **kwargs):
+        self.baudrate = baudrate
+        self.realtime = realtime
+        self.devices = []
+        self.reset()
+
+    def reset(self):
+        self.inits = 0
+        self.writes = 0
+        self.frames = 0
+        self.bytes = 0
+        self.wire_time = 0.0
+
+    def attach(self, device, dc, cs):
+        self.devices.append((device, dc, cs))
+        cs.listeners.append(self._cs_changed)
+
+    def _cs_changed(self, pin):
+        if not pin.value():
+            self.frames += 1
+
+    def init(self, baudrate=None, polarity=0, phase=0, **kwargs):
+        self.inits += 1
+        if baudrate is not None:
+            self.baudrate = baudrate
+
+    def write(self, buf):
+        data = bytes(buf)
+        seconds = len(data) * 8 / self.baudrate
+        self.writes += 1
+        self.bytes += len(data)
+        self.wire_time += seconds
+        for device, dc, cs in self.devices:
+            if not cs.value():
+                device.spi_write(data, dc.value())
+        if self.realtime:
+            time.sleep(seconds)
+
+
+# ---------------------------
+# Panel
+# ---------------------------
+# argument bytes of the SSD1306 commands the driver uses
+_ARGS = {
+    0x20: 1, 0x21: 2, 0x22: 2, 0x26: 6, 0x27: 6, 0x29: 5, 0x2a: 5, 0x81: 1, 0x8d: 1,
+    0xa3: 2, 0xa8: 1, 0xd3: 1, 0xd5: 1, 0xd9: 1, 0xda: 1, 0xdb: 1,
+}
+
+
+class SSD1306Panel:
+    """
+    SSD1306 controller: decodes commands and data from I2C (control bytes)
+    or SPI (D/C# pin) into its 128x64 GDDRAM, in horizontal or page
+    addressing mode. scroll holds the last scroll setup (opcode, direction
+    "right"/"left", diagonal flag, start page, interval code, end page,
+    vertical offset); ram_writes_while_scrolling counts data the real panel
+    would garble.
+    """
+
+    def __init__(self, i2c=None, addr=0x3c, spi=None, dc=None, cs=None):
+        self.ram = bytearray(128 * 8)
+        self.mode = 2  # page addressing after reset
+        self.window = [0, 127, 0, 7]
+        self.col = 0
+        self.page = 0
+        self.start_line = 0
+        self.on = False
+        self.inverted = False
+        self.contrast = 0x7f
+        self.scrolling = False
+        self.scroll = None
+        self.ram_writes_while_scrolling = 0
+        self.commands = []
+        self._pending = []
+        if i2c is not None:
+            i2c.attach(addr, self)
+        if spi is not None:
+            spi.attach(self, dc, cs)
+
+    def i2c_write(self, data):
+        i = 0
+        while i < len(data):
+            control = data[i]
+            i += 1
+            write = self.data if control & 0x40 else self.command
+            if control & 0x80:
+                # Co=1: one byte, then another control byte
+                if i < len(data):
+                    write(data[i])
+                i += 1
+            else:
+                for b in data[i:]:
+                    write(b)
+                return
+
+    def spi_write(self, data, dc):
+        write = self.data if dc else self.command
+        for b in data:
+            write(b)
+
+    def command(self, b):
+        cmd = self._pending
+        cmd.append(b)
+        if len(cmd) - 1 < _ARGS.get(cmd[0], 0):
+            return
+        self._pending = []
+        self.commands.append(tuple(cmd))
+        op = cmd[0]
+        if op == 0x20:
+            self.mode = cmd[1] & 3
+        elif op == 0x21:
+            self.window[0:2] = cmd[1:3]
+            self.col = cmd[1]
+        elif op == 0x22:
+            self.window[2:4] = cmd[1:3]
+            self.page = cmd[1]
+        elif op == 0x81:
+            self.contrast = cmd[1]
+        elif op in (0xae, 0xaf):
+            self.on = op == 0xaf
+        elif op in (0xa6, 0xa7):
+            self.inverted = op == 0xa7
+        elif op in (0x26, 0x27):
+            self.scroll = (op, "left" if op == 0x27 else "right", False, cmd[2], cmd[3], cmd[4], 0)
+        elif op in (0x29, 0x2a):
+            self.scroll = (op, "left" if op == 0x2a else "right", True, cmd[2], cmd[3], cmd[4], cmd[5])
+        elif op == 0x2e:
+            self.scrolling = False
+        elif op == 0x2f:
+            self.scrolling = True
+        elif 0x40 <= op <= 0x7f:
+            self.start_line = op & 0x3f
+        elif 0xb0 <= op <= 0xb7:
+            self.page = op & 7
+        elif op <= 0x0f:
+            self.col = (self.col & 0xf0) | op
+        elif op <= 0x1f:
+            self.col = (self.col & 0x0f) | (op & 0x0f) << 4
+
+    def data(self, b):
+        if self.scrolling:
+            self.ram_writes_while_scrolling += 1
+        self.ram[self.page * 128 + self.col] = b
+        x0, x1, p0, p1 = self.window
+        if self.mode == 0:
+            self.col += 1
+            if self.col > x1:
+                self.col = x0
+                self.page = p0 if self.page >= p1 else self.page + 1
+        elif self.mode == 1:
+            self.page += 1
+            if self.page > p1:
+                self.page = p0
+                self.col = x0 if self.col >= x1 else self.col + 1
+        elif self.col < 127:
+            self.col += 1
+
+    def pixel(self, x, y):
+        return self.ram[(y >> 3) * 128 + x] >> (y & 7) & 1
+
+    def matches(self, fbuf, x_offset=None):
+        """True if GDDRAM holds fbuf (64 pixel wide panels sit at column 32)."""
+        if x_offset is None:
+            x_offset = 32 if fbuf.width == 64 else 0
+        for page in range(fbuf.height // 8):
+            row = page * 128 + x_offset
+            if self.ram[row:row + fbuf.width] != bytes(fbuf.buf[page * fbuf.stride:page * fbuf.stride + fbuf.width]):
+                return False
+        return True
+
+    def screen(self, width=128, height=64):
+        """Rows of the visible image (start line applied) as strings of '#' and '.'."""
+        x_offset = 32 if width == 64 else 0
+        return ["".join("#" if self.pixel(x_offset + x, (y + self.start_line) % 64) else "." for x in range(width))
+                for y in range(height)]
+
+
+# ---------------------------
+# install
+# ---------------------------
+def _ticks_add(a, b):
+    return a + b
+
+
+def _ticks_diff(a, b):
+    return a - b
+
+
+def install():
+    """Make framebuf, machine, utime and const() importable like on MicroPython."""
+    builtins.const = lambda x: x
+    # a module of its own: the stdlib time module is left as it is
+    utime = types.ModuleType("utime")
+    utime.time = time.time
+    utime.sleep = time.sleep
+    utime.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    utime.sleep_us = lambda us: time.sleep(us / 1000000)
+    utime.ticks_ms = lambda: time.monotonic_ns() // 1000000
+    utime.ticks_us = lambda: time.monotonic_ns() // 1000
+    utime.ticks_add = _ticks_add
+    utime.ticks_diff = _ticks_diff
+    fb = types.ModuleType("framebuf")
+    fb.FrameBuffer = FrameBuffer
+    fb.FrameBuffer1 = FrameBuffer1
+    fb.MONO_VLSB = MONO_VLSB
+    machine = types.ModuleType("machine")
+    machine.Pin = Pin
+    machine.ADC = ADC
+    machine.PWM = PWM
+    machine.I2C = I2C
+    machine.SoftI2C = I2C
+    machine.SPI = SPI
+    sys.modules.setdefault("framebuf", fb)
+    sys.modules.setdefault("machine", machine)
+    sys.modules.setdefault("utime", utime)
+
+
+# ---------------------------
+# Example usage (main)
+# ---------------------------
+if __name__ == "__main__":
+    install()
+    import ssd1306
+
+    # a changing temperature readout: full vs partial refresh
+    i2c = I2C(freq=400000)
+    panel = SSD1306Panel(i2c=i2c)
+    oled = ssd1306.SSD1306_I2C(128, 64, i2c)
+    for partial in (False, True):
+        i2c.reset()
+        for i in range(100):
+            oled.framebuf.fill_rect(10, 10, 48, 8, 0)
+            oled.mark_dirty(10, 10, 48, 8)
+            oled.text("%5.1fC" % (20 + i / 10), 10, 10)
+            oled.show(partial=partial)
+            assert panel.matches(oled.framebuf)
+        print("I2C %s show: %.1f transactions, %d bytes, %.2f ms on the wire per update" % (
+            "partial" if partial else "full", i2c.transactions / 100, i2c.bytes // 100, i2c.wire_time * 10))
+
+    spi = SPI(baudrate=10 * 1024 * 1024)
+    dc, cs = Pin(), Pin()
+    panel = SSD1306Panel(spi=spi, dc=dc, cs=cs)
+    oled = ssd1306.SSD1306_SPI(128, 64, spi, dc, Pin(), cs)
+    spi.reset()
+    oled.show()
+    assert panel.matches(oled.framebuf)
+    print("SPI full show: %d init, %d writes, %d CS frames, %d bytes, %.2f ms on the wire" % (
+        spi.inits, spi.writes, spi.frames, spi.bytes, spi.wire_time * 1000))
@@ -4,9 +4,14 @@
 
 
 
-from machine import Pin, I2C, PWM
-from utime import sleep
+from machine import Pin, I2C, PWM, ADC
+from utime import sleep, sleep_ms, ticks_ms, ticks_add, ticks_diff
+from array import array
 import ssd1306
+try:
+    import ssd1306_atlas
+except ImportError:
+    ssd1306_atlas = None
 
 
 
@@ -18,7 +23,7 @@ def oled_init(test=True):
     i2c = None
     oled = None
     try:
-        i2c = machine.I2C(0, scl=I2C_SCL, sda=I2C_SDA, freq=400000)
+        i2c = I2C(0, scl=I2C_SCL, sda=I2C_SDA, freq=400000)
         oled_width = 128
         oled_height = 64
         oled = ssd1306.SSD1306_I2C(oled_width, oled_height, i2c)
@@ -39,12 +44,169 @@ def oled_test():
 
 def oled_print(oled,text):
     oled.text(text,10,10)
-    oled.show()
+    oled.show(partial=True)
 
 def oled_clear(oled):
     oled.fill(0)
     oled.show()
 
 
+# Dashboard: temperature readout, low/high of the graph, and a sparkline of
+# the last GRAPH_WIDTH samples scrolling in from the right. Fields are only
+# redrawn when their text changes and go out with show(partial=True); the
+# graph sends just the runs of bytes the shift changed. A noisy line still
+# changes every column of the pages it crosses: on the host emulator a sine
+# with +-0.3C noise sends about 290 of 1037 bytes per tick (one dirty span
+# per page would cover the gaps between the runs too: about 530).
+SAMPLE_MS = 1000
+GRAPH_TOP = 24          # rows above the graph hold the readout (page aligned)
+GRAPH_WIDTH = 128
+FONT_FILE = 'font24.oatl'
+
+def read_temp(sensor, reads=16):
+    # RP2040 internal sensor on ADC 4: 0.706 V at 27C, -1.721 mV/C
+    total = 0
+    for _ in range(reads):
+        total += sensor.read_u16()
+    volts = total / reads * 3.3 / 65535
+    return 27 - (volts - 0.706) / 0.001721
+
+class Dashboard:
+    def __init__(self, oled, font=None):
+        self.oled = oled
+        self.font = font
+        # ring buffer of the graphed samples; head is the next slot
+        self.samples = array('f', [0] * GRAPH_WIDTH)
+        self.head = 0
+        self.count = 0
+        self.lo = None
+        self.hi = None
+        self.fields = {}        # (x, y) -> text on the panel
+        self.readout = ''
+        self.readout_end = 0
+        oled.fill(0)
+        oled.show()
+
+    def add(self, value):
+        prev = self.samples[(self.head - 1) % GRAPH_WIDTH] if self.count else value
+        self.samples[self.head] = value
+        self.head = (self.head + 1) % GRAPH_WIDTH
+        self.count = min(self.count + 1, GRAPH_WIDTH)
+        if self.lo is None or not self.lo <= value <= self.hi:
+            self.rescale()
+        else:
+            self.scroll_graph(prev, value)
+        self.update_fields(value)
+
+    def y(self, value):
+        rows = self.oled.height - GRAPH_TOP
+        return self.oled.height - 1 - int((value - self.lo) * (rows - 1) / (self.hi - self.lo) + 0.5)
+
+    def plot(self, x, prev, value, mark=True):
+        # one graph column: a vertical span from the previous sample to this one
+        fb = self.oled.framebuf
+        rows = self.oled.height - GRAPH_TOP
+        fb.fill_rect(x, GRAPH_TOP, 1, rows, 0)
+        y0 = self.y(prev)
+        y1 = self.y(value)
+        fb.vline(x, min(y0, y1), abs(y1 - y0) + 1, 1)
+        if mark:
+            self.oled.mark_dirty(x, GRAPH_TOP, 1, rows)
+
+    def scroll_graph(self, prev, value):
+        # shift the graph one column left and plot the new sample, then send
+        # the runs of changed bytes with show_window(); runs closer than a
+        # window's overhead go out as one
+        oled = self.oled
+        buf = oled.view
+        width = oled.width
+        last = GRAPH_WIDTH - 1
+        pages = range(GRAPH_TOP >> 3, oled.pages)
+        old = bytes(buf[page * width + last] for page in pages)
+        self.plot(last, prev, value, mark=False)
+        for i, page in enumerate(pages):
+            row = page * width
+            x0 = -1
+            x1 = -1
+            for x in range(GRAPH_WIDTH):
+                if x < last:
+                    # the plotted column moved in from the right: its old bytes
+                    b = buf[row + x + 1] if x + 1 < last else old[i]
+                    if buf[row + x] == b:
+                        continue
+                    buf[row + x] = b
+                elif buf[row + x] == old[i]:
+                    continue
+                if x0 >= 0 and x - x1 > ssd1306.WINDOW_OVERHEAD:
+                    oled.show_window(x0, x1, page, page)
+                    x0 = -1
+                if x0 < 0:
+                    x0 = x
+                x1 = x
+            if x0 >= 0:
+                oled.show_window(x0, x1, page, page)
+
+    def rescale(self):
+        # a sample out of range: widen the scale, redraw the graph from the ring
+        values = [self.samples[(self.head - self.count + k) % GRAPH_WIDTH] for k in range(self.count)]
+        self.lo = min(values) - 1
+        self.hi = max(values) + 1
+        self.oled.framebuf.fill_rect(0, GRAPH_TOP, GRAPH_WIDTH, self.oled.height - GRAPH_TOP, 0)
+        prev = values[0]
+        for k, value in enumerate(values):
+            self.plot(GRAPH_WIDTH - self.count + k, prev, value)
+            prev = value
+
+    def field(self, text, x, y):
+        # 8x8 text, redrawn only when it changed
+        old = self.fields.get((x, y))
+        if old == text:
+            return
+        if old:
+            self.oled.framebuf.fill_rect(x, y, 8 * len(old), 8, 0)
+            self.oled.mark_dirty(x, y, 8 * len(old), 8)
+        self.oled.text(text, x, y)
+        self.fields[(x, y)] = text
+
+    def update_fields(self, value):
+        text = '%.1fC' % value
+        if self.font is None:
+            self.field(text, 0, 8)
+        elif text != self.readout:
+            end = self.font.text(self.oled, text, 0, 0)
+            if end < self.readout_end:
+                # the old readout was wider
+                self.oled.framebuf.fill_rect(end, 0, self.readout_end - end, self.font.height, 0)
+                self.oled.mark_dirty(end, 0, self.readout_end - end, self.font.height)
+            self.readout = text
+            self.readout_end = end
+        # the graph's scale on the right
+        high = 'H%.0f' % self.hi
+        low = 'L%.0f' % self.lo
+        self.field(high, self.oled.width - 8 * len(high), 0)
+        self.field(low, self.oled.width - 8 * len(low), 8)
+
+def dashboard(oled, interval_ms=SAMPLE_MS):
+    sensor = ADC(4)
+    font = None
+    if ssd1306_atlas is not None:
+        try:
+            font = ssd1306_atlas.Atlas(FONT_FILE)
+        except OSError:
+            pass
+    board = Dashboard(oled, font)
+    due = ticks_ms()
+    while True:
+        board.add(read_temp(sensor))
+        oled.show(partial=True)
+        due = ticks_add(due, interval_ms)
+        delay = ticks_diff(due, ticks_ms())
+        if delay > 0:
+            sleep_ms(delay)
+
+
 oled = oled_init(test=False)
 oled_print(oled,"Hello World!!")
+if oled:
+    sleep(1)
+    dashboard(oled)